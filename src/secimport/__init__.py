@@ -41,7 +41,14 @@ from .connectors.siem import QRadarConnector, SentinelConnector, SplunkConnector
 from .connectors.xdr import CortexXDRConnector, VisionOneConnector
 
 # Auto-detection and parsing
-from .detectors import detect_all, detect_data_type, detect_parser, detect_source, parse_file
+from .detectors import (
+    detect_all,
+    detect_data_type,
+    detect_parser,
+    detect_source,
+    parse_file,
+    parse_many,
+)
 
 # Enrichment
 from .enrichment.correlator import AssetCorrelator
@@ -130,4 +137,5 @@ __all__ = [
     "detect_parser",
     "detect_source",
     "parse_file",
+    "parse_many",
 ]
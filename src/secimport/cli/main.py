@@ -32,6 +32,12 @@ def main(argv: list[str] | None = None) -> int:
     p_parse.add_argument(
         "--format", choices=["json", "jsonl"], default="jsonl", help="Output format"
     )
+    p_parse.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="Rows read per CSV chunk (default: the parser's CHUNK_SIZE)",
+    )
 
     # detect
     p_detect = sub.add_parser("detect", help="Detect the source type of a file")
@@ -88,13 +94,16 @@ def _cmd_parse(args: argparse.Namespace) -> int:
         print(f"File not found: {file_path}", file=sys.stderr)
         return 1
 
-    records, result = parse_file(str(file_path), parser_name=args.parser)
+    records, result = parse_file(
+        str(file_path), parser_name=args.parser, chunk_size=args.chunk_size
+    )
 
-    items = list(records)
     if args.format == "json":
-        print(json.dumps([r.model_dump(exclude_none=True) for r in items], indent=2, default=str))
+        items = [r.model_dump(exclude_none=True) for r in records]
+        print(json.dumps(items, indent=2, default=str))
     else:
-        for record in items:
+        # Stream JSON Lines so memory stays bounded by the parser's chunks.
+        for record in records:
             print(json.dumps(record.model_dump(exclude_none=True), default=str))
 
     print(
@@ -24,6 +24,10 @@ Example config::
           client_id: ${CS_ID}
           client_secret: ${CS_SECRET}
 
+      - name: nessus_export
+        path: ./exports/nessus.csv
+        parser: nessus_vuln      # optional; auto-detected if omitted
+
     outputs:
       - type: json
         path: ./output/enriched.json
@@ -40,7 +44,7 @@ import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 _ENV_PATTERN = re.compile(r"\$\{(\w+)}")
 
@@ -60,11 +64,22 @@ def _substitute_env(value: Any) -> Any:
 
 
 class SourceConfig(BaseModel):
-    """Configuration for a single data source."""
+    """
+    Configuration for a single data source.
+
+    A source is either an API connector (``connector`` + ``base_url``) or
+    an exported file (``path``, optionally with an explicit ``parser``).
+    """
 
     name: str = Field(..., description="Unique name for this source instance")
-    connector: str = Field(..., description="Connector name (e.g. 'qualys', 'crowdstrike_falcon')")
-    base_url: str = Field(..., description="Base URL for the API")
+    connector: Optional[str] = Field(
+        None, description="Connector name (e.g. 'qualys', 'crowdstrike_falcon')"
+    )
+    base_url: Optional[str] = Field(None, description="Base URL for the API")
+    path: Optional[str] = Field(None, description="CSV/Excel export to parse")
+    parser: Optional[str] = Field(
+        None, description="Parser name for ``path``; auto-detected if omitted"
+    )
     auth_type: str = Field("api_key", description="Auth type: basic, api_key, oauth2, token")
     credentials: Dict[str, str] = Field(default_factory=dict)
     verify_ssl: bool = True
@@ -75,6 +90,12 @@ class SourceConfig(BaseModel):
         description="Connector-specific options",
     )
 
+    @model_validator(mode="after")
+    def _check_kind(self) -> "SourceConfig":
+        if self.path is None and (self.connector is None or self.base_url is None):
+            raise ValueError("source needs either 'path' or 'connector' and 'base_url'")
+        return self
+
 
 class OutputConfig(BaseModel):
     """Configuration for a single output sink."""
@@ -89,6 +110,15 @@ class EnrichmentConfig(BaseModel):
     """Configuration for the enrichment engine."""
 
     deduplicate: bool = Field(True, description="Run deduplication after ingestion")
+    keep_source_records: bool = Field(
+        False, description="Keep raw source records on each enriched asset"
+    )
+    min_merge_confidence: float = Field(
+        0.0,
+        ge=0.0,
+        le=1.0,
+        description="Lowest identifier match weight that may merge two records",
+    )
     gap_sources: List[List[str]] = Field(
         default_factory=list,
         description="Pairs of sources to compare for gap analysis",
@@ -103,6 +133,15 @@ class SecimportConfig(BaseModel):
     """
 
     sources: List[SourceConfig] = Field(default_factory=list)
+    source_workers: int = Field(
+        1,
+        ge=1,
+        description=(
+            "Sources fetched concurrently. 1 streams each source into the "
+            "correlator; higher values hold each source's records in memory "
+            "until its turn to be ingested"
+        ),
+    )
     outputs: List[OutputConfig] = Field(default_factory=list)
     enrichment: EnrichmentConfig = Field(default_factory=EnrichmentConfig)
 
@@ -7,11 +7,12 @@ and implement these methods for your system.
 """
 
 import logging
+import types
 from abc import ABC
-from typing import Any, ClassVar, Dict, Optional, Tuple, Type
+from typing import Any, ClassVar, Dict, Mapping, Optional, Tuple, Type
 
 import httpx
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .pagination import PaginationMixin
 
@@ -28,7 +29,14 @@ class ConnectorStatus:
 
 
 class ConnectionConfig(BaseModel):
-    """Base configuration for connectors."""
+    """
+    Base configuration for connectors.
+
+    Frozen: a validated config is shared by every connector built from it
+    and never re-validated, so it must not change underneath them.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     base_url: str
     verify_ssl: bool = True
@@ -37,7 +45,9 @@ class ConnectionConfig(BaseModel):
 
 
 class AuthConfig(BaseModel):
-    """Authentication configuration."""
+    """Authentication configuration. Frozen like ``ConnectionConfig``."""
+
+    model_config = ConfigDict(frozen=True)
 
     auth_type: str = Field(
         ...,
@@ -72,9 +82,9 @@ class ConnectorRegistry:
         return cls._connectors.get(name)
 
     @classmethod
-    def list_connectors(cls) -> Dict[str, Type["BaseConnector"]]:
-        """Return all registered connectors."""
-        return dict(cls._connectors)
+    def list_connectors(cls) -> Mapping[str, Type["BaseConnector"]]:
+        """Return a read-only view of all registered connectors."""
+        return types.MappingProxyType(cls._connectors)
 
 
 class BaseConnector(PaginationMixin, ABC):
@@ -111,6 +121,10 @@ class BaseConnector(PaginationMixin, ABC):
     description: ClassVar[str] = "Base connector"
     auth_types: ClassVar[Tuple[str, ...]] = ("api_key",)
 
+    #: Bulk fetch methods ``IngestionRunner`` calls and feeds into the
+    #: correlator, in order. Category bases declare their inventory method.
+    SUPPORTED_OPERATIONS: ClassVar[Tuple[str, ...]] = ()
+
     #: Lightweight health-check URL used by ``test_connection()``.
     _test_endpoint: ClassVar[str] = "/"
 
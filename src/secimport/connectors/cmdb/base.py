@@ -6,7 +6,7 @@ Extend this for: ServiceNow, BMC Helix, Device42, etc.
 
 from abc import abstractmethod
 from datetime import datetime
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple
 
 from ...models.base import ParsedAsset
 from ..base import BaseConnector
@@ -26,6 +26,8 @@ class BaseCMDBConnector(BaseConnector):
         * Implement ``_parse_asset`` to map raw API data to the model.
     """
 
+    SUPPORTED_OPERATIONS: ClassVar[Tuple[str, ...]] = ("get_assets",)
+
     # -- abstract data methods -------------------------------------------------
 
     @abstractmethod
@@ -7,7 +7,7 @@ Carbon Black, Symantec, Trellix, Trend Micro, etc.
 
 from abc import abstractmethod
 from datetime import datetime
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple
 
 from ...models.base import ParsedEndpoint, ParsedVulnerability
 from ..base import BaseConnector
@@ -26,6 +26,8 @@ class BaseEDRConnector(BaseConnector):
         * Implement ``_parse_endpoint`` to map raw API data to the model.
     """
 
+    SUPPORTED_OPERATIONS: ClassVar[Tuple[str, ...]] = ("get_endpoints",)
+
     @abstractmethod
     def get_endpoints(
         self,
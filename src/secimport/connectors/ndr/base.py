@@ -6,7 +6,7 @@ Extend this for: Darktrace, ExtraHop, Vectra, etc.
 
 from abc import abstractmethod
 from datetime import datetime
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple
 
 from ...models.base import ParsedNetworkObservation
 from ..base import BaseConnector
@@ -25,6 +25,8 @@ class BaseNDRConnector(BaseConnector):
         * Implement ``_parse_device``.
     """
 
+    SUPPORTED_OPERATIONS: ClassVar[Tuple[str, ...]] = ("get_devices",)
+
     @abstractmethod
     def get_devices(
         self,
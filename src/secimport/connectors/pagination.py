@@ -9,9 +9,23 @@ than re-implementing loop logic.
 import logging
 from typing import Any, Dict, Iterator, Optional
 
+import httpx
+from pydantic_core import from_json
+
 logger = logging.getLogger("secimport.connectors.pagination")
 
 
+def _decode_page(response: httpx.Response) -> Any:
+    """
+    Decode a JSON page from its raw body.
+
+    Uses pydantic-core's parser, which decodes the whole page in one
+    native pass and caches repeated keys and short strings. This is
+    faster than ``response.json()`` on large result pages.
+    """
+    return from_json(response.content)
+
+
 class PaginationMixin:
     """
     Mixin providing reusable pagination helpers.
@@ -58,7 +72,7 @@ class PaginationMixin:
 
             response = self._client.get(endpoint, params=params)  # type: ignore[union-attr]
             response.raise_for_status()
-            data = response.json()
+            data = _decode_page(response)
 
             items = data[results_key] if results_key else data
             if not items:
@@ -111,7 +125,7 @@ class PaginationMixin:
 
             response = self._client.get(endpoint, params=params)  # type: ignore[union-attr]
             response.raise_for_status()
-            data = response.json()
+            data = _decode_page(response)
 
             items = data[results_key] if results_key else data
             if not items:
@@ -164,7 +178,7 @@ class PaginationMixin:
 
             response = self._client.get(endpoint, params=params)  # type: ignore[union-attr]
             response.raise_for_status()
-            data = response.json()
+            data = _decode_page(response)
 
             items = data[results_key] if results_key else data
             if not items:
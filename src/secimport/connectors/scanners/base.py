@@ -6,7 +6,7 @@ Extend this for: Qualys, Nessus, Tenable, Rapid7, OpenVAS, CrowdStrike, etc.
 
 from abc import abstractmethod
 from datetime import datetime
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple
 
 from ...models.base import ParsedVulnerability
 from ..base import BaseConnector
@@ -25,6 +25,8 @@ class BaseScannerConnector(BaseConnector):
         * Implement ``_parse_vulnerability`` to map raw API data to the model.
     """
 
+    SUPPORTED_OPERATIONS: ClassVar[Tuple[str, ...]] = ("get_assets",)
+
     # -- abstract data methods -------------------------------------------------
 
     @abstractmethod
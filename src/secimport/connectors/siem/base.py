@@ -6,7 +6,7 @@ Extend this for: Splunk, Microsoft Sentinel, QRadar, etc.
 
 from abc import abstractmethod
 from datetime import datetime
-from typing import Any, Dict, Iterator, Optional
+from typing import Any, ClassVar, Dict, Iterator, Optional, Tuple
 
 from ...models.base import ParsedAsset
 from ..base import BaseConnector
@@ -26,6 +26,8 @@ class BaseSIEMConnector(BaseConnector):
         * Implement ``_parse_asset``.
     """
 
+    SUPPORTED_OPERATIONS: ClassVar[Tuple[str, ...]] = ("get_assets",)
+
     @abstractmethod
     def get_assets(
         self,
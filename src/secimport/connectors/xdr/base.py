@@ -6,7 +6,7 @@ Extend this for: Palo Alto Cortex XDR, Trend Micro Vision One, etc.
 
 from abc import abstractmethod
 from datetime import datetime
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple
 
 from ...models.base import ParsedEndpoint, ParsedVulnerability
 from ..base import BaseConnector
@@ -25,6 +25,8 @@ class BaseXDRConnector(BaseConnector):
         * Implement ``_parse_endpoint``.
     """
 
+    SUPPORTED_OPERATIONS: ClassVar[Tuple[str, ...]] = ("get_endpoints",)
+
     @abstractmethod
     def get_endpoints(
         self,
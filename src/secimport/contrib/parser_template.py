@@ -17,7 +17,7 @@
 # from typing import Any, ClassVar, Dict, Set
 #
 # from secimport.models.base import ParsedVulnerability
-# from secimport.parsers.base import BaseParser
+# from secimport.parsers.base import BaseParser, coerce_cvss
 #
 #
 # class MyNewParser(BaseParser):
@@ -46,14 +46,17 @@
 #
 #     def _parse_row(self, mapped: Dict[str, Any]) -> ParsedVulnerability:
 #         """Convert a single mapped row to a normalized model."""
-#         return ParsedVulnerability(
-#             scanner_id=mapped.get("scanner_id"),
-#             title=mapped.get("scanner_id", "Unknown"),
-#             hostname=mapped.get("hostname"),
-#             severity=mapped.get("severity", "Low"),
-#             cvss_score=(
-#                 float(mapped["cvss_score"]) if mapped.get("cvss_score") else None
-#             ),
-#             description=mapped.get("description"),
-#             source_system=self.source,
+#         # Coerce typed fields here: _build skips Pydantic validation
+#         # unless FAST_CONSTRUCT is set to False.
+#         return self._build(
+#             ParsedVulnerability,
+#             {
+#                 "scanner_id": mapped.get("scanner_id"),
+#                 "title": mapped.get("scanner_id", "Unknown"),
+#                 "hostname": mapped.get("hostname"),
+#                 "severity": mapped.get("severity", "Low"),
+#                 "cvss_score": coerce_cvss(mapped.get("cvss_score")),
+#                 "description": mapped.get("description"),
+#                 "source_system": self.source,
+#             },
 #         )
@@ -1,6 +1,13 @@
 """Auto-detection of data source and type from file columns."""
 
-from .auto_detect import detect_all, detect_data_type, detect_parser, detect_source, parse_file
+from .auto_detect import (
+    detect_all,
+    detect_data_type,
+    detect_parser,
+    detect_source,
+    parse_file,
+    parse_many,
+)
 
 __all__ = [
     "detect_all",
@@ -8,4 +15,5 @@ __all__ = [
     "detect_parser",
     "detect_source",
     "parse_file",
+    "parse_many",
 ]
@@ -8,8 +8,10 @@ is automatically included when its module is imported.
 
 import logging
 import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
 from pathlib import Path
-from typing import Iterator, List, Optional, Tuple, Type, Union
+from typing import Iterable, Iterator, List, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel
 
@@ -43,17 +45,11 @@ def detect_parser(
         logger.warning("No columns found in %s", file_path)
         return None
 
-    if data_type:
-        candidates = ParserRegistry.by_data_type(data_type)
-    else:
-        candidates = ParserRegistry.list_parsers()
-
     best_parser: Optional[Type[BaseParser]] = None
     best_score = 0.0
 
-    for name, parser_cls in candidates.items():
-        score = parser_cls.detect(columns)
-        logger.debug("detect: %s scored %.2f for %s", name, score, file_path)
+    for parser_cls, score in ParserRegistry.score_columns(columns, data_type=data_type):
+        logger.debug("detect: %s scored %.2f for %s", parser_cls.name, score, file_path)
         if score > best_score:
             best_score = score
             best_parser = parser_cls
@@ -107,11 +103,11 @@ def detect_all(
     if not columns:
         return []
 
-    results = []
-    for _name, parser_cls in ParserRegistry.list_parsers().items():
-        score = parser_cls.detect(columns)
-        if score > 0:
-            results.append((parser_cls, score))
+    results = [
+        (parser_cls, score)
+        for parser_cls, score in ParserRegistry.score_columns(columns)
+        if score > 0
+    ]
 
     results.sort(key=lambda x: x[1], reverse=True)
     return results
@@ -123,6 +119,7 @@ def parse_file(
     parser_name: Optional[str] = None,
     data_type: Optional[str] = None,
     sheet_name: Optional[str] = None,
+    chunk_size: Optional[int] = None,
 ) -> Tuple[Iterator[BaseModel], ParseResult]:
     """
     Auto-detect and parse a file, returning results and metadata.
@@ -136,6 +133,8 @@ def parse_file(
         parser_name: Force a specific parser by name (skip detection).
         data_type: Hint for detection ("vulnerability", "asset", "owner").
         sheet_name: For Excel files, which sheet to read.
+        chunk_size: Rows per CSV chunk; defaults to the parser's
+            ``CHUNK_SIZE``.
 
     Returns:
         Tuple of (data iterator, ParseResult metadata).
@@ -144,8 +143,14 @@ def parse_file(
         ValueError: If no parser can be detected or found.
     """
     path = Path(file_path)
+    parser_cls = _resolve_parser(path, parser_name, data_type)
+    return _parse_with(parser_cls, path, sheet_name=sheet_name, chunk_size=chunk_size)
 
-    # Resolve parser
+
+def _resolve_parser(
+    path: Path, parser_name: Optional[str], data_type: Optional[str]
+) -> Type[BaseParser]:
+    """Look up ``parser_name``, or detect the parser for ``path``."""
     if parser_name:
         parser_cls = ParserRegistry.get(parser_name)
         if not parser_cls:
@@ -160,7 +165,17 @@ def parse_file(
                 f"Could not detect parser for {path}. "
                 f"Use parser_name= to specify one explicitly."
             )
+    return parser_cls
+
 
+def _parse_with(
+    parser_cls: Type[BaseParser],
+    path: Path,
+    *,
+    sheet_name: Optional[str] = None,
+    chunk_size: Optional[int] = None,
+) -> Tuple[Iterator[BaseModel], ParseResult]:
+    """Parse ``path`` with ``parser_cls``; the second half of ``parse_file``."""
     parser = parser_cls()
     result = ParseResult(
         source_type=parser.source,
@@ -172,7 +187,63 @@ def parse_file(
     def _counting_iterator() -> Iterator[BaseModel]:
         """Wrap parser output, delegating counting to parser.parse()."""
         start = time.monotonic()
-        yield from parser.parse(path, sheet_name=sheet_name, result=result)
+        yield from parser.parse(
+            path, sheet_name=sheet_name, result=result, chunk_size=chunk_size
+        )
         result.duration_seconds = round(time.monotonic() - start, 3)
 
     return _counting_iterator(), result
+
+
+def _parse_all(
+    parser_cls: Type[BaseParser], path: Path
+) -> Tuple[List[BaseModel], ParseResult]:
+    """
+    Parse one file to a list; runs inside ``parse_many`` workers.
+
+    The parser class is resolved by the caller and pickled by reference,
+    so workers do not depend on inheriting the caller's registry: parsers
+    registered at runtime or by plugins work under any start method.
+    """
+    records, result = _parse_with(parser_cls, path)
+    return list(records), result
+
+
+def parse_many(
+    file_paths: Iterable[Union[str, Path]],
+    *,
+    data_type: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    mp_context: Optional[BaseContext] = None,
+) -> Iterator[Tuple[List[BaseModel], ParseResult]]:
+    """
+    Auto-detect and parse several files in parallel worker processes.
+
+    Parsers are detected here, up front, then each file is parsed in its
+    own process, so parsing is not limited by the GIL. Results come back
+    in input order, one fully parsed file at a time.
+
+    Args:
+        file_paths: Paths to the CSV/Excel files.
+        data_type: Hint for detection ("vulnerability", "asset", "owner").
+        max_workers: Worker processes; defaults to ``os.cpu_count()``.
+            With one worker or one file, parsing runs in this process.
+        mp_context: Multiprocessing context for the workers (e.g.
+            ``multiprocessing.get_context("spawn")``); defaults to the
+            platform's start method.
+
+    Yields:
+        ``(records, ParseResult)`` per file.
+
+    Raises:
+        ValueError: If no parser can be detected for a file.
+    """
+    paths = [Path(p) for p in file_paths]
+    parsers = [_resolve_parser(path, None, data_type) for path in paths]
+    if max_workers == 1 or len(paths) <= 1:
+        for parser_cls, path in zip(parsers, paths):
+            yield _parse_all(parser_cls, path)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as pool:
+        yield from pool.map(_parse_all, parsers, paths)
@@ -1,6 +1,6 @@
 """Asset enrichment, correlation, and gap analysis."""
 
-from .correlator import AssetCorrelator
+from .correlator import AssetCorrelator, gc_paused
 from .models import (
     CorrelationKey,
     EnrichedAsset,
@@ -19,4 +19,5 @@ __all__ = [
     "MatchResult",
     "MatchWeights",
     "SourceConfidence",
+    "gc_paused",
 ]
@@ -6,9 +6,32 @@ serial numbers, and agent IDs. As records are ingested, it attempts
 to match them to existing enriched assets. When a match is found,
 fields are merged with provenance tracking. When no match is found,
 a new enriched asset is created.
+
+Matching is an index lookup per identifier, never a scan over existing
+assets. A record whose identifiers hit several assets (a "split brain")
+is merged into the best-weighted one. The assets it bridges stay
+separate until ``deduplicate()`` joins them, so asset indexes stay
+stable during ingestion.
 """
 
-from typing import Iterator, List, Optional
+import contextlib
+import gc
+import sys
+from array import array
+from collections import Counter
+from operator import attrgetter
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+
+from pydantic import BaseModel
 
 from ..models.base import (
     ParsedAsset,
@@ -17,15 +40,160 @@ from ..models.base import (
     ParsedOwnerMapping,
     ParsedVulnerability,
 )
-from ..normalizers.hostname import normalize_hostname, normalize_ip, normalize_mac
-from .models import CorrelationKey, EnrichedAsset, GapReport, MatchResult
+from .models import (
+    PROVENANCE_FIELDS,
+    CorrelationKey,
+    EnrichedAsset,
+    GapReport,
+    MatchResult,
+)
 from .scoring import MatchWeights, SourceConfidence
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# (enriched field, parsed record attribute) pairs applied on ingest.
+_ASSET_FIELDS: tuple[tuple[str, str], ...] = (
+    ("hostname", "hostname"),
+    ("ip_address", "ip_address"),
+    ("mac_address", "mac_address"),
+    ("serial_number", "serial_number"),
+    ("operating_system", "operating_system"),
+    ("os_version", "os_version"),
+    ("asset_type", "asset_type"),
+    ("owner_email", "owner_email"),
+    ("owner_name", "owner_name"),
+    ("department", "department"),
+    ("location", "location"),
+)
+
+_ENDPOINT_FIELDS: tuple[tuple[str, str], ...] = (
+    ("hostname", "hostname"),
+    ("ip_address", "ip_address"),
+    ("mac_address", "mac_address"),
+    ("serial_number", "serial_number"),
+    ("agent_id", "agent_id"),
+    ("operating_system", "operating_system"),
+    ("os_version", "os_version"),
+    ("asset_type", "endpoint_type"),
+    ("owner_email", "owner_email"),
+    ("owner_name", "owner_name"),
+    ("department", "department"),
+    ("agent_status", "agent_status"),
+    ("policy_status", "policy_status"),
+    ("isolation_status", "isolation_status"),
+)
+
+_OWNER_FIELDS: tuple[tuple[str, str], ...] = (
+    ("owner_email", "owner_email"),
+    ("owner_name", "owner_name"),
+    ("department", "department"),
+    ("location", "location"),
+)
+
+_OBSERVATION_FIELDS: tuple[tuple[str, str], ...] = (
+    ("hostname", "hostname"),
+    ("ip_address", "ip_address"),
+    ("mac_address", "mac_address"),
+)
+
+
+@contextlib.contextmanager
+def gc_paused() -> Iterator[None]:
+    """
+    Pause Python's cyclic garbage collector for the duration of the block.
+
+    Bulk ingestion and ``deduplicate()`` allocate tracked containers and
+    keep them, so generation-0 overflows keep triggering collections that
+    walk a growing, cycle-free heap; on a 50k-asset ingest that was about
+    two thirds of the run. Reference counting still frees garbage
+    meanwhile. The collector is process-wide, so this is for applications
+    to opt into around a whole pipeline run, as ``IngestionRunner`` does;
+    the correlator itself never touches it. A collector that was already
+    disabled is left alone::
+
+        with gc_paused():
+            correlator.ingest_assets(records)
+            correlator.deduplicate()
+    """
+    if not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def _dump_nonnull(record: BaseModel) -> dict[str, Any]:
+    """
+    Shallow ``model_dump(exclude_none=True)`` for flat parsed records.
+
+    Parsed models hold plain values, so reading ``__dict__`` directly gives
+    the same result without a serialization pass per ingested record.
+    """
+    return {k: v for k, v in record.__dict__.items() if v is not None}
+
+
+def _present_fields(
+    record: BaseModel, fields: tuple[tuple[str, str], ...]
+) -> dict[str, Any]:
+    """Map enriched field names to the record's non-None attribute values."""
+    values = record.__dict__
+    return {
+        field: value for field, attr in fields if (value := values.get(attr)) is not None
+    }
+
+
+class _DSU:
+    """Disjoint-set forest with path compression and union by rank."""
+
+    __slots__ = ("parent", "rank")
+
+    def __init__(self, size: int) -> None:
+        self.parent: list[int] = list(range(size))
+        self.rank: list[int] = [0] * size
+
+    def find(self, x: int) -> int:
+        """Return the root of x's set, compressing the path behind it."""
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a: int, b: int) -> None:
+        """Join the sets containing a and b."""
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return
+        if self.rank[ra] < self.rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if self.rank[ra] == self.rank[rb]:
+            self.rank[ra] += 1
+
+
+class _ConfidenceCache(dict[str, float]):
+    """Per-correlator memo of ``SourceConfidence.get`` keyed by source name."""
+
+    def __missing__(self, source: str) -> float:
+        confidence = self[source] = SourceConfidence.get(source)
+        return confidence
+
 
 class AssetCorrelator:
     """
     Correlates and enriches assets from multiple security sources.
 
+    New enriched assets start empty and are filled from already-validated
+    parsed records. They are built with the plain constructor: with no
+    arguments pydantic-core fills the defaults natively, which is cheaper
+    than ``model_construct`` (it inspects every default factory in Python).
+
     Usage::
 
         correlator = AssetCorrelator()
@@ -40,14 +208,68 @@ class AssetCorrelator:
         print(f"In EDR but not scanner: {len(gap.in_a_not_b)}")
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self, *, keep_source_records: bool = False, min_merge_confidence: float = 0.0
+    ) -> None:
+        """
+        Args:
+            keep_source_records: Keep a copy of every ingested asset and
+                endpoint record in ``EnrichedAsset.source_records``. Useful
+                as an audit trail, but memory grows with every record, so
+                it is off by default.
+            min_merge_confidence: Lowest ``MatchWeights`` weight an
+                identifier needs to join records into one asset, during
+                ingestion and in ``deduplicate()``. For example, 0.8 stops
+                IP-only matches (0.70) from merging DHCP neighbours into
+                large clusters. The default of 0 merges on any shared
+                identifier.
+        """
+        self._keep_source_records = keep_source_records
+        self._min_merge_confidence = min_merge_confidence
         self._assets: List[EnrichedAsset] = []
-        # Indexes: identifier_value -> list of asset indexes
-        self._hostname_idx: dict[str, list[int]] = {}
-        self._ip_idx: dict[str, list[int]] = {}
-        self._mac_idx: dict[str, list[int]] = {}
-        self._serial_idx: dict[str, list[int]] = {}
-        self._agent_id_idx: dict[str, list[int]] = {}
+        # Indexes: identifier_value -> asset indexes, in insertion order.
+        # Nearly every bucket holds one asset, and a one-item uint32 array
+        # is less than half the size of a one-item set.
+        self._hostname_idx: dict[str, array[int]] = {}
+        self._ip_idx: dict[str, array[int]] = {}
+        self._mac_idx: dict[str, array[int]] = {}
+        self._serial_idx: dict[str, array[int]] = {}
+        self._agent_id_idx: dict[str, array[int]] = {}
+        # source_system -> indexes of assets present in it, for gap_analysis
+        self._source_idx: dict[str, set[int]] = {}
+
+        # Indexes in probe order (highest match weight first) with their
+        # weights resolved once, so _find_match does no per-record lookups.
+        # Sorting by weight lets _find_match stop at the first tier below
+        # its best hit, even if MatchWeights has been re-tuned.
+        self._probe_order: tuple[
+            tuple[
+                str, float, Callable[[CorrelationKey], AbstractSet[str]], dict[str, array[int]]
+            ],
+            ...,
+        ] = tuple(
+            sorted(
+                (
+                    (id_type, MatchWeights.get(id_type), attrgetter(key_attr), idx_map)
+                    for id_type, key_attr, idx_map in (
+                        ("agent_id", "agent_ids", self._agent_id_idx),
+                        ("serial_number", "serial_numbers", self._serial_idx),
+                        ("mac_address", "mac_addresses", self._mac_idx),
+                        ("hostname", "hostnames", self._hostname_idx),
+                        ("ip_address", "ip_addresses", self._ip_idx),
+                    )
+                ),
+                key=lambda probe: -probe[1],
+            )
+        )
+        # The tiers allowed to join records; the rest stay indexed for
+        # _find_match and owner mappings but never merge assets.
+        self._merge_probes = tuple(
+            probe
+            for probe in self._probe_order
+            if probe[1] > 0 and probe[1] >= min_merge_confidence
+        )
+        self._source_confidence = _ConfidenceCache()
 
     @property
     def asset_count(self) -> int:
@@ -56,7 +278,7 @@ class AssetCorrelator:
 
     # -- Ingestion Methods ---------------------------------------------------
 
-    def ingest_assets(self, assets: Iterator[ParsedAsset]) -> int:
+    def ingest_assets(self, assets: Iterable[ParsedAsset]) -> int:
         """
         Ingest parsed assets (from scanners, CMDB, IPAM, cloud).
 
@@ -64,8 +286,10 @@ class AssetCorrelator:
         """
         count = 0
         for asset in assets:
-            source = asset.source_system or "unknown"
-            confidence = SourceConfidence.get(source)
+            # Interned so every provenance entry and present_in_sources set
+            # shares one string per source, even for records parsed from JSON.
+            source = sys.intern(asset.source_system or "unknown")
+            confidence = self._source_confidence[source]
 
             key = self._build_key(
                 hostname=asset.hostname,
@@ -74,36 +298,22 @@ class AssetCorrelator:
                 serial_number=asset.serial_number,
             )
 
-            match = self._find_match(key)
-            if match.matched and match.enriched_asset_index is not None:
-                enriched = self._assets[match.enriched_asset_index]
-            else:
-                enriched = EnrichedAsset()
-                self._assets.append(enriched)
-
-            enriched.correlation_key.merge(key)
-            enriched.present_in_sources.add(source)
-            enriched.source_records.setdefault(source, []).append(
-                asset.model_dump(exclude_none=True)
-            )
+            asset_idx = self._match_or_create(key)
+            enriched = self._assets[asset_idx]
 
-            enriched.set_field("hostname", asset.hostname, source, confidence)
-            enriched.set_field("ip_address", asset.ip_address, source, confidence)
-            enriched.set_field("mac_address", asset.mac_address, source, confidence)
-            enriched.set_field("serial_number", asset.serial_number, source, confidence)
-            enriched.set_field("operating_system", asset.operating_system, source, confidence)
-            enriched.set_field("os_version", asset.os_version, source, confidence)
-            enriched.set_field("asset_type", asset.asset_type, source, confidence)
-            enriched.set_field("owner_email", asset.owner_email, source, confidence)
-            enriched.set_field("owner_name", asset.owner_name, source, confidence)
-            enriched.set_field("department", asset.department, source, confidence)
-            enriched.set_field("location", asset.location, source, confidence)
-
-            self._update_indexes(len(self._assets) - 1, key)
+            if source not in enriched.present_in_sources:
+                enriched.present_in_sources.add(source)
+                self._source_idx.setdefault(source, set()).add(asset_idx)
+            if self._keep_source_records:
+                enriched.add_source_records(source, [_dump_nonnull(asset)])
+
+            enriched.merge_parsed(source, confidence, _present_fields(asset, _ASSET_FIELDS))
+
+            self._update_indexes(asset_idx, key)
             count += 1
         return count
 
-    def ingest_endpoints(self, endpoints: Iterator[ParsedEndpoint]) -> int:
+    def ingest_endpoints(self, endpoints: Iterable[ParsedEndpoint]) -> int:
         """
         Ingest parsed endpoints (from EDR, AV, XDR).
 
@@ -111,8 +321,8 @@ class AssetCorrelator:
         """
         count = 0
         for ep in endpoints:
-            source = ep.source_system or "unknown"
-            confidence = SourceConfidence.get(source)
+            source = sys.intern(ep.source_system or "unknown")
+            confidence = self._source_confidence[source]
 
             key = self._build_key(
                 hostname=ep.hostname,
@@ -122,73 +332,71 @@ class AssetCorrelator:
                 agent_id=ep.agent_id,
             )
 
-            match = self._find_match(key)
-            if match.matched and match.enriched_asset_index is not None:
-                enriched = self._assets[match.enriched_asset_index]
-            else:
-                enriched = EnrichedAsset()
-                self._assets.append(enriched)
-
-            enriched.correlation_key.merge(key)
-            enriched.present_in_sources.add(source)
-            enriched.source_records.setdefault(source, []).append(
-                ep.model_dump(exclude_none=True)
-            )
+            asset_idx = self._match_or_create(key)
+            enriched = self._assets[asset_idx]
 
-            enriched.set_field("hostname", ep.hostname, source, confidence)
-            enriched.set_field("ip_address", ep.ip_address, source, confidence)
-            enriched.set_field("mac_address", ep.mac_address, source, confidence)
-            enriched.set_field("serial_number", ep.serial_number, source, confidence)
-            enriched.set_field("agent_id", ep.agent_id, source, confidence)
-            enriched.set_field("operating_system", ep.operating_system, source, confidence)
-            enriched.set_field("os_version", ep.os_version, source, confidence)
-            enriched.set_field("asset_type", ep.endpoint_type, source, confidence)
-            enriched.set_field("owner_email", ep.owner_email, source, confidence)
-            enriched.set_field("owner_name", ep.owner_name, source, confidence)
-            enriched.set_field("department", ep.department, source, confidence)
-            enriched.set_field("agent_status", ep.agent_status, source, confidence)
-            enriched.set_field("policy_status", ep.policy_status, source, confidence)
-            enriched.set_field("isolation_status", ep.isolation_status, source, confidence)
-
-            self._update_indexes(len(self._assets) - 1, key)
+            if source not in enriched.present_in_sources:
+                enriched.present_in_sources.add(source)
+                self._source_idx.setdefault(source, set()).add(asset_idx)
+            if self._keep_source_records:
+                enriched.add_source_records(source, [_dump_nonnull(ep)])
+
+            enriched.merge_parsed(source, confidence, _present_fields(ep, _ENDPOINT_FIELDS))
+
+            self._update_indexes(asset_idx, key)
             count += 1
         return count
 
-    def ingest_vulnerabilities(self, vulns: Iterator[ParsedVulnerability]) -> int:
+    def ingest_vulnerabilities(self, vulns: Iterable[ParsedVulnerability]) -> int:
         """
         Ingest vulnerabilities and attach them to matching enriched assets.
 
         Returns the number of records ingested.
         """
         count = 0
-        for vuln in vulns:
-            source = vuln.source_system or "unknown"
-            key = self._build_key(
-                hostname=vuln.hostname,
-                ip_address=vuln.ip_address,
-            )
-
-            match = self._find_match(key)
-            if match.matched and match.enriched_asset_index is not None:
-                enriched = self._assets[match.enriched_asset_index]
-            else:
-                enriched = EnrichedAsset()
-                enriched.correlation_key.merge(key)
-                self._assets.append(enriched)
-                self._update_indexes(len(self._assets) - 1, key)
-
-            enriched.present_in_sources.add(source)
-            enriched.vulnerability_count += 1
-            severity = (vuln.severity or "").lower()
-            if severity == "critical":
-                enriched.critical_vuln_count += 1
-            elif severity == "high":
-                enriched.high_vuln_count += 1
-
-            count += 1
+        # Scanner exports repeat the same host on many rows, so raw
+        # (hostname, ip) pairs are resolved once per call. Only pairs whose
+        # first probed identifier matched are remembered: assets created
+        # later can add identifiers an earlier probe missed, but never change
+        # a bucket's first entry.
+        resolved: dict[tuple[Optional[str], Optional[str]], int] = {}
+        # Per-record work is a single histogram bump; asset counters and
+        # sources are updated once per (asset, source, severity) at the end.
+        tallies: Counter[tuple[int, str, Optional[str]]] = Counter()
+        try:
+            for vuln in vulns:
+                pair = (vuln.hostname, vuln.ip_address)
+                asset_idx = resolved.get(pair)
+                if asset_idx is None:
+                    key = CorrelationKey.from_host_ip(vuln.hostname, vuln.ip_address)
+                    asset_idx = self._first_probe_match(key)
+                    if asset_idx is not None:
+                        resolved[pair] = asset_idx
+                    else:
+                        new_idx = len(self._assets)
+                        asset_idx = self._match_or_create(key, merge=False)
+                        if asset_idx == new_idx:
+                            self._update_indexes(asset_idx, key)
+
+                tallies[asset_idx, vuln.source_system or "unknown", vuln.severity] += 1
+                count += 1
+        finally:
+            # Apply what was tallied even if the input iterator fails midway.
+            for (asset_idx, source, severity), n in tallies.items():
+                enriched = self._assets[asset_idx]
+                if source not in enriched.present_in_sources:
+                    source = sys.intern(source)
+                    enriched.present_in_sources.add(source)
+                    self._source_idx.setdefault(source, set()).add(asset_idx)
+                enriched.vulnerability_count += n
+                severity = (severity or "").lower()
+                if severity == "critical":
+                    enriched.critical_vuln_count += n
+                elif severity == "high":
+                    enriched.high_vuln_count += n
         return count
 
-    def ingest_owner_mappings(self, mappings: Iterator[ParsedOwnerMapping]) -> int:
+    def ingest_owner_mappings(self, mappings: Iterable[ParsedOwnerMapping]) -> int:
         """
         Ingest owner mappings and apply them to matching enriched assets.
 
@@ -196,26 +404,20 @@ class AssetCorrelator:
         """
         count = 0
         for mapping in mappings:
-            source = mapping.source_system or "unknown"
-            confidence = SourceConfidence.get(source) * mapping.confidence
+            source = sys.intern(mapping.source_system or "unknown")
+            confidence = self._source_confidence[source] * mapping.confidence
 
-            key = self._build_key(
-                hostname=None,
-                ip_address=mapping.ip_address,
-            )
+            key = CorrelationKey.from_host_ip(None, mapping.ip_address)
 
             match = self._find_match(key)
             if match.matched and match.enriched_asset_index is not None:
                 enriched = self._assets[match.enriched_asset_index]
-                enriched.set_field("owner_email", mapping.owner_email, source, confidence)
-                enriched.set_field("owner_name", mapping.owner_name, source, confidence)
-                enriched.set_field("department", mapping.department, source, confidence)
-                enriched.set_field("location", mapping.location, source, confidence)
+                enriched.merge_parsed(source, confidence, _present_fields(mapping, _OWNER_FIELDS))
                 count += 1
         return count
 
     def ingest_network_observations(
-        self, observations: Iterator[ParsedNetworkObservation]
+        self, observations: Iterable[ParsedNetworkObservation]
     ) -> int:
         """
         Ingest NDR observations and correlate with existing assets.
@@ -224,8 +426,8 @@ class AssetCorrelator:
         """
         count = 0
         for obs in observations:
-            source = obs.source_system or "unknown"
-            confidence = SourceConfidence.get(source)
+            source = sys.intern(obs.source_system or "unknown")
+            confidence = self._source_confidence[source]
 
             key = self._build_key(
                 hostname=obs.hostname,
@@ -233,21 +435,16 @@ class AssetCorrelator:
                 mac_address=obs.mac_address,
             )
 
-            match = self._find_match(key)
-            if match.matched and match.enriched_asset_index is not None:
-                enriched = self._assets[match.enriched_asset_index]
-            else:
-                enriched = EnrichedAsset()
-                self._assets.append(enriched)
+            asset_idx = self._match_or_create(key)
+            enriched = self._assets[asset_idx]
 
-            enriched.correlation_key.merge(key)
-            enriched.present_in_sources.add(source)
+            if source not in enriched.present_in_sources:
+                enriched.present_in_sources.add(source)
+                self._source_idx.setdefault(source, set()).add(asset_idx)
 
-            enriched.set_field("hostname", obs.hostname, source, confidence)
-            enriched.set_field("ip_address", obs.ip_address, source, confidence)
-            enriched.set_field("mac_address", obs.mac_address, source, confidence)
+            enriched.merge_parsed(source, confidence, _present_fields(obs, _OBSERVATION_FIELDS))
 
-            self._update_indexes(len(self._assets) - 1, key)
+            self._update_indexes(asset_idx, key)
             count += 1
         return count
 
@@ -257,6 +454,35 @@ class AssetCorrelator:
         """Yield all enriched assets."""
         yield from self._assets
 
+    def to_dataframe(self) -> "pd.DataFrame":
+        """
+        Return the enriched assets as a column-oriented DataFrame.
+
+        Each provenance field becomes three columns: ``<field>`` (value),
+        ``<field>_source`` and ``<field>_confidence``. Sources are a sorted
+        list per row. Columns are built directly rather than row by row, so
+        the frame can be filtered vectorially or written to Parquet/Arrow
+        for out-of-core use.
+        """
+        import pandas as pd
+
+        assets = self._assets
+        columns: dict[str, list[Any]] = {}
+        for field in PROVENANCE_FIELDS:
+            provs = [getattr(a, field) for a in assets]
+            columns[field] = [p.value if p is not None else None for p in provs]
+            columns[f"{field}_source"] = [
+                p.source_system if p is not None else None for p in provs
+            ]
+            columns[f"{field}_confidence"] = [
+                p.confidence if p is not None else None for p in provs
+            ]
+        columns["present_in_sources"] = [sorted(a.present_in_sources) for a in assets]
+        columns["vulnerability_count"] = [a.vulnerability_count for a in assets]
+        columns["critical_vuln_count"] = [a.critical_vuln_count for a in assets]
+        columns["high_vuln_count"] = [a.high_vuln_count for a in assets]
+        return pd.DataFrame(columns)
+
     def gap_analysis(self, source_a: str, source_b: str) -> GapReport:
         """
         Compute coverage gaps between two sources.
@@ -268,48 +494,54 @@ class AssetCorrelator:
         Returns:
             A GapReport showing assets in A not B, in B not A, and in both.
         """
-        report = GapReport(source_a=source_a, source_b=source_b)
-
-        for asset in self._assets:
-            in_a = source_a in asset.present_in_sources
-            in_b = source_b in asset.present_in_sources
-
-            if in_a and in_b:
-                report.in_both.append(asset.correlation_key)
-            elif in_a:
-                report.in_a_not_b.append(asset.correlation_key)
-            elif in_b:
-                report.in_b_not_a.append(asset.correlation_key)
-
-        return report
+        in_a = self._source_idx.get(source_a, set())
+        in_b = self._source_idx.get(source_b, set())
+        assets = self._assets
+        # Only assets seen in either source are touched; sorting keeps
+        # each list in ingestion order. The keys are the correlator's own,
+        # so the report is built without re-validating every list item.
+        return GapReport.model_construct(
+            source_a=source_a,
+            source_b=source_b,
+            in_a_not_b=[assets[i].correlation_key for i in sorted(in_a - in_b)],
+            in_b_not_a=[assets[i].correlation_key for i in sorted(in_b - in_a)],
+            in_both=[assets[i].correlation_key for i in sorted(in_a & in_b)],
+        )
 
     def deduplicate(self) -> int:
         """
         Merge enriched assets that share identifiers.
 
+        Assets are connected through the identifier indexes with a
+        union-find pass, so chains (A shares a MAC with B, B shares a
+        hostname with C) collapse into a single asset. Each component is
+        merged into its lowest-indexed member. Identifier types weighted
+        below ``min_merge_confidence`` do not connect assets.
+
         Returns the number of merges performed.
         """
-        merges = 0
-        i = 0
-        while i < len(self._assets):
-            j = i + 1
-            while j < len(self._assets):
-                if self._assets[i].correlation_key.overlaps(
-                    self._assets[j].correlation_key
-                ):
-                    self._merge_assets(i, j)
-                    # Remove j, shift everything down
-                    self._assets.pop(j)
-                    merges += 1
-                    # Don't increment j — the next asset slid into j's slot
-                else:
-                    j += 1
-            i += 1
-
-        if merges:
+        dsu = _DSU(len(self._assets))
+        for _, _, _, idx_map in self._merge_probes:
+            for bucket in idx_map.values():
+                if len(bucket) > 1:
+                    members = iter(bucket)
+                    first = next(members)
+                    for other in members:
+                        dsu.union(first, other)
+
+        keep_for_root: dict[int, int] = {}
+        merged: set[int] = set()
+        for i in range(len(self._assets)):
+            keep = keep_for_root.setdefault(dsu.find(i), i)
+            if keep != i:
+                self._merge_assets(keep, i)
+                merged.add(i)
+
+        if merged:
+            self._assets = [a for i, a in enumerate(self._assets) if i not in merged]
             self._rebuild_indexes()
 
-        return merges
+        return len(merged)
 
     # -- Internal Helpers ----------------------------------------------------
 
@@ -322,57 +554,42 @@ class AssetCorrelator:
         agent_id: Optional[str] = None,
     ) -> CorrelationKey:
         """Build a normalized CorrelationKey from raw fields."""
-        key = CorrelationKey()
-
-        hn = normalize_hostname(hostname)
-        if hn:
-            key.hostnames.add(hn)
-
-        ip = normalize_ip(ip_address)
-        if ip:
-            key.ip_addresses.add(ip)
-
-        mac = normalize_mac(mac_address)
-        if mac:
-            key.mac_addresses.add(mac)
-
-        if serial_number and serial_number.strip():
-            key.serial_numbers.add(serial_number.strip().lower())
-
-        if agent_id and agent_id.strip():
-            key.agent_ids.add(agent_id.strip())
-
-        return key
+        return CorrelationKey.from_identifiers(
+            hostname, ip_address, mac_address, serial_number, agent_id
+        )
 
     def _find_match(self, key: CorrelationKey) -> MatchResult:
         """
         Find the best matching enriched asset for a correlation key.
 
         Checks indexes in order of match weight (agent_id > serial > MAC > hostname > IP).
+        Ingestion uses ``_match_or_create``, which picks the same asset
+        without building a ``MatchResult``; this reports how it matched.
         """
         best_idx: Optional[int] = None
         best_confidence = 0.0
-        matched_on: list[str] = []
-
-        # Check each identifier type from highest to lowest weight
-        for id_type, values, idx_map in [
-            ("agent_id", key.agent_ids, self._agent_id_idx),
-            ("serial_number", key.serial_numbers, self._serial_idx),
-            ("mac_address", key.mac_addresses, self._mac_idx),
-            ("hostname", key.hostnames, self._hostname_idx),
-            ("ip_address", key.ip_addresses, self._ip_idx),
-        ]:
+        matched_on: Optional[list[str]] = None
+
+        # Check each identifier type from highest to lowest weight. Once a
+        # hit is found only equal-weight tiers can still contribute.
+        for id_type, weight, get_values, idx_map in self._probe_order:
+            if weight < best_confidence:
+                break
+            values = get_values(key)
+            if not values:
+                continue
             for val in values:
                 if val in idx_map:
-                    weight = MatchWeights.get(id_type)
                     if weight > best_confidence:
                         best_confidence = weight
-                        best_idx = idx_map[val][0]  # Take first match
+                        # Any asset in the bucket will do; overlapping assets
+                        # are collapsed later by deduplicate().
+                        best_idx = idx_map[val][0]
                         matched_on = [id_type]
-                    elif weight == best_confidence and best_idx is not None:
+                    elif weight == best_confidence and matched_on is not None:
                         matched_on.append(id_type)
 
-        if best_idx is not None:
+        if best_idx is not None and matched_on is not None:
             return MatchResult(
                 matched=True,
                 confidence=best_confidence,
@@ -381,32 +598,52 @@ class AssetCorrelator:
             )
         return MatchResult()
 
+    def _match_or_create(self, key: CorrelationKey, merge: bool = True) -> int:
+        """
+        Return the index of the asset ``key`` matches, merging ``key`` into
+        it unless ``merge`` is False. When nothing matches, a new asset is
+        appended that takes ``key`` itself as its correlation key; the
+        record's key is not used afterwards, and adopting it saves an empty
+        key (five sets) per asset. The caller updates the indexes.
+
+        Ingestion calls this once per record, so it stops at the first hit
+        in probe order (the asset ``_find_match`` would report) instead of
+        collecting every matching identifier type. Only identifier types
+        weighted at least ``min_merge_confidence`` are probed.
+        """
+        for _, _, get_values, idx_map in self._merge_probes:
+            for val in get_values(key):
+                bucket = idx_map.get(val)
+                if bucket:
+                    asset_idx = bucket[0]
+                    if merge:
+                        self._assets[asset_idx].correlation_key.merge(key)
+                    return asset_idx
+        self._assets.append(EnrichedAsset(correlation_key=key))
+        return len(self._assets) - 1
+
+    def _first_probe_match(self, key: CorrelationKey) -> Optional[int]:
+        """
+        Return the asset the first identifier ``_match_or_create`` would
+        probe for ``key`` resolves to, or None if it misses or ``key`` is
+        empty.
+        """
+        for _, _, get_values, idx_map in self._merge_probes:
+            for val in get_values(key):
+                bucket = idx_map.get(val)
+                return bucket[0] if bucket else None
+        return None
+
     def _update_indexes(self, asset_idx: int, key: CorrelationKey) -> None:
         """Add a correlation key's identifiers to the lookup indexes."""
-        for val in key.hostnames:
-            self._hostname_idx.setdefault(val, [])
-            if asset_idx not in self._hostname_idx[val]:
-                self._hostname_idx[val].append(asset_idx)
-
-        for val in key.ip_addresses:
-            self._ip_idx.setdefault(val, [])
-            if asset_idx not in self._ip_idx[val]:
-                self._ip_idx[val].append(asset_idx)
-
-        for val in key.mac_addresses:
-            self._mac_idx.setdefault(val, [])
-            if asset_idx not in self._mac_idx[val]:
-                self._mac_idx[val].append(asset_idx)
-
-        for val in key.serial_numbers:
-            self._serial_idx.setdefault(val, [])
-            if asset_idx not in self._serial_idx[val]:
-                self._serial_idx[val].append(asset_idx)
-
-        for val in key.agent_ids:
-            self._agent_id_idx.setdefault(val, [])
-            if asset_idx not in self._agent_id_idx[val]:
-                self._agent_id_idx[val].append(asset_idx)
+        for _, _, get_values, idx_map in self._probe_order:
+            for val in get_values(key):
+                bucket = idx_map.get(val)
+                if bucket is None:
+                    idx_map[val] = array("I", (asset_idx,))
+                elif asset_idx not in bucket:
+                    # Buckets are tiny, so a linear scan beats keeping a set.
+                    bucket.append(asset_idx)
 
     def _rebuild_indexes(self) -> None:
         """Rebuild all indexes from scratch (after deduplication)."""
@@ -415,8 +652,11 @@ class AssetCorrelator:
         self._mac_idx.clear()
         self._serial_idx.clear()
         self._agent_id_idx.clear()
+        self._source_idx.clear()
         for i, asset in enumerate(self._assets):
             self._update_indexes(i, asset.correlation_key)
+            for source in asset.present_in_sources:
+                self._source_idx.setdefault(source, set()).add(i)
 
     def _merge_assets(self, keep_idx: int, merge_idx: int) -> None:
         """Merge asset at merge_idx into asset at keep_idx."""
@@ -427,12 +667,7 @@ class AssetCorrelator:
         keep.present_in_sources |= merge.present_in_sources
 
         # Merge provenance fields — higher confidence wins
-        for field in [
-            "hostname", "ip_address", "mac_address", "serial_number",
-            "agent_id", "operating_system", "os_version", "asset_type",
-            "owner_email", "owner_name", "department", "location",
-            "agent_status", "policy_status", "isolation_status",
-        ]:
+        for field in PROVENANCE_FIELDS:
             other_prov = getattr(merge, field)
             if other_prov is not None:
                 current = getattr(keep, field)
@@ -443,5 +678,6 @@ class AssetCorrelator:
         keep.critical_vuln_count += merge.critical_vuln_count
         keep.high_vuln_count += merge.high_vuln_count
 
-        for src, records in merge.source_records.items():
-            keep.source_records.setdefault(src, []).extend(records)
+        if merge.source_records:
+            for src, records in merge.source_records.items():
+                keep.add_source_records(src, records)
@@ -5,41 +5,133 @@ These models track provenance (which source contributed each field),
 enable correlation across multiple sources, and report coverage gaps.
 """
 
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
-
-from pydantic import BaseModel, Field
-
-
-class FieldProvenance(BaseModel):
+from typing import Annotated, Any, Dict, FrozenSet, List, Optional, Set
+
+from pydantic import BaseModel, Field, PlainSerializer
+
+from ..normalizers.hostname import normalize_hostname, normalize_ip, normalize_mac
+
+#: EnrichedAsset fields that hold a ``FieldProvenance``.
+PROVENANCE_FIELDS: tuple[str, ...] = (
+    "hostname",
+    "ip_address",
+    "mac_address",
+    "serial_number",
+    "agent_id",
+    "operating_system",
+    "os_version",
+    "asset_type",
+    "owner_email",
+    "owner_name",
+    "department",
+    "location",
+    "agent_status",
+    "policy_status",
+    "isolation_status",
+)
+
+#: Identifier set on a ``CorrelationKey``. Always a ``frozenset``, dumped as a
+#: plain ``set``.
+_IdentifierSet = Annotated[FrozenSet[str], PlainSerializer(set)]
+
+#: Shared value for identifier types a key lacks, so keys built from records
+#: (which the correlator adopts for new assets) allocate no empty sets.
+_NO_IDENTIFIERS: FrozenSet[str] = frozenset()
+
+_KEY_FIELDS = ("hostnames", "ip_addresses", "mac_addresses", "serial_numbers", "agent_ids")
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FieldProvenance:
     """
     Tracks the value, source, and confidence for a single enriched field.
 
     When the same field is reported by multiple sources, the correlator
-    keeps the value with the highest confidence.
+    keeps the value with the highest confidence. A plain frozen dataclass
+    rather than a model: one is built for every winning field value, and
+    the correlator only ever passes already-validated values. The field
+    constraints apply wherever Pydantic validates one, such as
+    ``EnrichedAsset`` input.
     """
 
     value: Any = None
-    source_system: str = Field(..., description="Source that provided this value")
+    source_system: Annotated[str, Field(description="Source that provided this value")]
     source_instance: Optional[str] = None
     timestamp: Optional[datetime] = None
-    confidence: float = Field(default=1.0, ge=0, le=1)
+    confidence: Annotated[float, Field(ge=0, le=1)] = 1.0
 
 
-class CorrelationKey(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class CorrelationKey:
     """
     A set of identifiers used to match records across sources.
 
     Two records are considered the same asset if they share any
     high-confidence identifier (agent_id, serial, MAC) or a
     combination of lower-confidence ones (hostname + IP).
+
+    The sets hold already-normalized values and are never normalized
+    again. Build keys from raw record values with ``from_identifiers`` or
+    ``from_host_ip``, which are the single place normalization happens.
+    Hostname normalization is not idempotent ("web01.local.corp" becomes
+    "web01.local", then "web01"), so normalizing twice would change keys.
+
+    Every identifier set is a ``frozenset``; other iterables passed to the
+    constructor are converted. ``merge`` replaces the sets rather than
+    changing them, so keys can share them.
     """
 
-    hostnames: Set[str] = Field(default_factory=set)
-    ip_addresses: Set[str] = Field(default_factory=set)
-    mac_addresses: Set[str] = Field(default_factory=set)
-    serial_numbers: Set[str] = Field(default_factory=set)
-    agent_ids: Set[str] = Field(default_factory=set)
+    hostnames: _IdentifierSet = _NO_IDENTIFIERS
+    ip_addresses: _IdentifierSet = _NO_IDENTIFIERS
+    mac_addresses: _IdentifierSet = _NO_IDENTIFIERS
+    serial_numbers: _IdentifierSet = _NO_IDENTIFIERS
+    agent_ids: _IdentifierSet = _NO_IDENTIFIERS
+
+    def __post_init__(self) -> None:
+        for name in _KEY_FIELDS:
+            value = getattr(self, name)
+            if type(value) is not frozenset:
+                setattr(self, name, frozenset(value))
+
+    @classmethod
+    def from_identifiers(
+        cls,
+        hostname: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        serial_number: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> "CorrelationKey":
+        """Build a key from raw identifiers, normalizing each one."""
+        hn = normalize_hostname(hostname)
+        ip = normalize_ip(ip_address)
+        mac = normalize_mac(mac_address)
+        # Interned like the normalizers' output, so index lookups and set
+        # probes on repeat identifiers compare by identity first.
+        serial = sys.intern(serial_number.strip().lower()) if serial_number else ""
+        agent = sys.intern(agent_id.strip()) if agent_id else ""
+        return cls(
+            hostnames=frozenset((hn,)) if hn else _NO_IDENTIFIERS,
+            ip_addresses=frozenset((ip,)) if ip else _NO_IDENTIFIERS,
+            mac_addresses=frozenset((mac,)) if mac else _NO_IDENTIFIERS,
+            serial_numbers=frozenset((serial,)) if serial else _NO_IDENTIFIERS,
+            agent_ids=frozenset((agent,)) if agent else _NO_IDENTIFIERS,
+        )
+
+    @classmethod
+    def from_host_ip(
+        cls, hostname: Optional[str], ip_address: Optional[str]
+    ) -> "CorrelationKey":
+        """Build a key from a hostname and IP only (vulnerabilities, owner maps)."""
+        hn = normalize_hostname(hostname)
+        ip = normalize_ip(ip_address)
+        return cls(
+            hostnames=frozenset((hn,)) if hn else _NO_IDENTIFIERS,
+            ip_addresses=frozenset((ip,)) if ip else _NO_IDENTIFIERS,
+        )
 
     def is_empty(self) -> bool:
         """Return True if no identifiers are present."""
@@ -52,36 +144,44 @@ class CorrelationKey(BaseModel):
         ])
 
     def overlaps(self, other: "CorrelationKey") -> bool:
-        """Return True if any identifier set overlaps with another key."""
-        return bool(
-            (self.agent_ids & other.agent_ids)
-            or (self.serial_numbers & other.serial_numbers)
-            or (self.mac_addresses & other.mac_addresses)
-            or (self.hostnames & other.hostnames)
-            or (self.ip_addresses & other.ip_addresses)
+        """
+        Return True if any identifier set overlaps with another key.
+
+        ``isdisjoint`` probes the smaller set against the larger one and
+        stops at the first shared element, without building an
+        intersection. Identifier types are checked most selective first.
+        """
+        return not (
+            self.agent_ids.isdisjoint(other.agent_ids)
+            and self.serial_numbers.isdisjoint(other.serial_numbers)
+            and self.mac_addresses.isdisjoint(other.mac_addresses)
+            and self.hostnames.isdisjoint(other.hostnames)
+            and self.ip_addresses.isdisjoint(other.ip_addresses)
         )
 
     def merge(self, other: "CorrelationKey") -> None:
-        """Merge identifiers from another key into this one."""
-        self.hostnames |= other.hostnames
-        self.ip_addresses |= other.ip_addresses
-        self.mac_addresses |= other.mac_addresses
-        self.serial_numbers |= other.serial_numbers
-        self.agent_ids |= other.agent_ids
+        """
+        Merge identifiers from another key into this one.
+
+        Each set is replaced by the union, and left as is when ``other``
+        adds nothing to it.
+        """
+        for name in _KEY_FIELDS:
+            mine, theirs = getattr(self, name), getattr(other, name)
+            if not theirs <= mine:
+                setattr(self, name, mine | theirs)
 
 
-class MatchResult(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class MatchResult:
     """Result of attempting to match a record to an existing enriched asset."""
 
     matched: bool = False
-    confidence: float = Field(default=0.0, ge=0, le=1)
-    matched_on: List[str] = Field(
-        default_factory=list,
-        description="Identifier types that matched (e.g. ['hostname', 'ip_address'])",
-    )
-    enriched_asset_index: Optional[int] = Field(
-        None, description="Index of the matched asset in the correlator"
-    )
+    confidence: float = 0.0
+    #: Identifier types that matched (e.g. ``['hostname', 'ip_address']``).
+    matched_on: List[str] = field(default_factory=list)
+    #: Index of the matched asset in the correlator.
+    enriched_asset_index: Optional[int] = None
 
 
 class EnrichedAsset(BaseModel):
@@ -125,8 +225,15 @@ class EnrichedAsset(BaseModel):
     critical_vuln_count: int = 0
     high_vuln_count: int = 0
 
-    # Raw records from each source for full detail
-    source_records: Dict[str, List[Any]] = Field(default_factory=dict)
+    # Raw records from each source for full detail; None until the first
+    # record is added, so assets without an audit trail allocate nothing.
+    source_records: Optional[Dict[str, List[Any]]] = None
+
+    def add_source_records(self, source_system: str, records: List[Any]) -> None:
+        """Append raw records from a source, creating ``source_records`` if needed."""
+        if self.source_records is None:
+            self.source_records = {}
+        self.source_records.setdefault(source_system, []).extend(records)
 
     def set_field(
         self,
@@ -140,7 +247,7 @@ class EnrichedAsset(BaseModel):
         Set a field only if the new value has higher confidence.
 
         Args:
-            field_name: Name of the field on this model.
+            field_name: Name of a provenance field (see ``PROVENANCE_FIELDS``).
             value: The value to set.
             source_system: Source system providing this value.
             confidence: Confidence score (0-1).
@@ -162,6 +269,43 @@ class EnrichedAsset(BaseModel):
                 ),
             )
 
+    def merge_parsed(
+        self,
+        source_system: str,
+        confidence: float,
+        values: Dict[str, Any],
+        timestamp: Optional[datetime] = None,
+    ) -> None:
+        """
+        Apply several field values from one source record at once.
+
+        Equivalent to calling ``set_field`` for each item in one pass. It
+        reads and writes the instance dict directly, skipping Pydantic's
+        ``__setattr__``, and only builds a ``FieldProvenance`` for values
+        that win.
+
+        Args:
+            source_system: Source system providing the values.
+            confidence: Confidence score (0-1) for every value.
+            values: Provenance field name (see ``PROVENANCE_FIELDS``) ->
+                value; ``None`` values are skipped.
+            timestamp: When the source last updated these values.
+        """
+        current_fields = self.__dict__
+        fields_set = self.__pydantic_fields_set__
+        for field_name, value in values.items():
+            if value is None:
+                continue
+            current = current_fields.get(field_name)
+            if current is None or confidence > current.confidence:
+                current_fields[field_name] = FieldProvenance(
+                    value=value,
+                    source_system=source_system,
+                    confidence=confidence,
+                    timestamp=timestamp,
+                )
+                fields_set.add(field_name)
+
 
 class GapReport(BaseModel):
     """
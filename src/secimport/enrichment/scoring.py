@@ -16,6 +16,8 @@ class MatchWeights:
     same value for this identifier are the same physical asset.
     """
 
+    DEFAULT: ClassVar[float] = 0.5
+
     WEIGHTS: ClassVar[Dict[str, float]] = {
         "agent_id": 0.99,
         "serial_number": 0.95,
@@ -27,7 +29,7 @@ class MatchWeights:
     @classmethod
     def get(cls, identifier_type: str) -> float:
         """Return the match weight for an identifier type."""
-        return cls.WEIGHTS.get(identifier_type, 0.5)
+        return cls.WEIGHTS.get(identifier_type, cls.DEFAULT)
 
     @classmethod
     def best_match_confidence(cls, matched_on: list[str]) -> float:
@@ -40,9 +42,10 @@ class MatchWeights:
         Returns:
             The highest weight among matched types, or 0.0 if empty.
         """
-        if not matched_on:
-            return 0.0
-        return max(cls.get(m) for m in matched_on)
+        # Read WEIGHTS once per call rather than once per element, so
+        # re-tuned weights still apply.
+        weights, default = cls.WEIGHTS, cls.DEFAULT
+        return max((weights.get(m, default) for m in matched_on), default=0.0)
 
 
 class SourceConfidence:
@@ -26,7 +26,10 @@ class SourceMetadata(BaseModel):
     )
     ingested_at: datetime = Field(
         default_factory=datetime.utcnow,
-        description="UTC timestamp when this record was ingested",
+        description=(
+            "UTC timestamp when this record was ingested; records parsed from"
+            " one file share the time parsing started"
+        ),
     )
     source_updated_at: Optional[datetime] = Field(
         None, description="Last update timestamp from the source system"
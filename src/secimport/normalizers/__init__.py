@@ -1,12 +1,21 @@
 """Data normalizers for cross-scanner consistency."""
 
 from .hostname import normalize_hostname, normalize_ip, normalize_mac
-from .severity import SEVERITY_MAPPINGS, normalize_severity
+from .severity import (
+    SEVERITY_MAPPINGS,
+    invalidate_severity_tables,
+    normalize_severity,
+    register_severity_mapping,
+    severity_normalizer,
+)
 
 __all__ = [
     "SEVERITY_MAPPINGS",
+    "invalidate_severity_tables",
     "normalize_hostname",
     "normalize_ip",
     "normalize_mac",
     "normalize_severity",
+    "register_severity_mapping",
+    "severity_normalizer",
 ]
@@ -8,7 +8,8 @@ Each scanner uses different scales:
 - Rapid7: Critical/Severe/Moderate/Low
 """
 
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
 SEVERITY_MAPPINGS: Dict[str, Dict[str, str]] = {
     "qualys": {
@@ -59,6 +60,81 @@ SEVERITY_MAPPINGS: Dict[str, Dict[str, str]] = {
     },
 }
 
+#: Lowercased scanner name -> (exact table, folded table). Built on first
+#: use and dropped by ``invalidate_severity_tables``.
+_TABLES: Dict[str, Tuple[Dict[str, str], Dict[str, str]]] = {}
+
+
+def _build_tables(scanner: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Build and cache the ``(exact, folded)`` lookup tables for a scanner.
+
+    ``folded`` maps lowercased keys to the first matching entry; ``exact``
+    adds the spellings scanners export, so well-formed values resolve
+    without stripping or case folding. Unknown scanners use the generic
+    mapping.
+    """
+    mapping = SEVERITY_MAPPINGS.get(scanner) or SEVERITY_MAPPINGS["generic"]
+    folded: Dict[str, str] = {}
+    for key, normalized in mapping.items():
+        folded.setdefault(key.lower(), normalized)
+    tables = _TABLES[scanner] = ({**folded, **mapping}, folded)
+    return tables
+
+
+def invalidate_severity_tables() -> None:
+    """
+    Drop the lookup tables built from ``SEVERITY_MAPPINGS``.
+
+    Call after editing ``SEVERITY_MAPPINGS`` in place; normalizers pick up
+    the change on their next call. ``register_severity_mapping`` does this
+    for you.
+    """
+    _TABLES.clear()
+
+
+def register_severity_mapping(scanner: str, mapping: Mapping[str, str]) -> None:
+    """
+    Add or replace the severity mapping for a scanner.
+
+    Args:
+        scanner: Scanner name, matched case-insensitively.
+        mapping: Raw severity -> Critical, High, Medium or Low.
+    """
+    SEVERITY_MAPPINGS[scanner.lower()] = dict(mapping)
+    invalidate_severity_tables()
+
+
+@lru_cache(maxsize=64)
+def severity_normalizer(scanner: str = "generic") -> Callable[[Any], str]:
+    """
+    Return a ``normalize_severity`` equivalent bound to one scanner.
+
+    Per-value calls are a dict get for exact scanner spellings. Mappings
+    changed through ``register_severity_mapping`` or followed by
+    ``invalidate_severity_tables`` apply to normalizers already returned.
+    Unknown scanners use the generic mapping.
+
+    Examples:
+        >>> severity_normalizer("qualys")("5")
+        'Critical'
+    """
+    key = scanner.lower()
+
+    def normalize(value: Optional[str | int]) -> str:
+        if value is None:
+            return "Low"
+        tables = _TABLES.get(key)
+        if tables is None:
+            tables = _build_tables(key)
+        exact, folded = tables
+        found = exact.get(value) if type(value) is str else None
+        if found is None:
+            found = folded.get(str(value).strip().lower(), "Low")
+        return found
+
+    return normalize
+
 
 def normalize_severity(value: Optional[str | int], scanner: str = "generic") -> str:
     """
@@ -77,19 +153,4 @@ def normalize_severity(value: Optional[str | int], scanner: str = "generic") ->
         >>> normalize_severity("Info", "nessus")
         'Low'
     """
-    if value is None:
-        return "Low"
-
-    mapping = SEVERITY_MAPPINGS.get(scanner.lower(), SEVERITY_MAPPINGS["generic"])
-    str_value = str(value).strip()
-
-    # Direct match
-    if str_value in mapping:
-        return mapping[str_value]
-
-    # Case-insensitive match
-    for key, normalized in mapping.items():
-        if key.lower() == str_value.lower():
-            return normalized
-
-    return "Low"
+    return severity_normalizer(scanner)(value)
@@ -4,8 +4,39 @@ Base output sink and registry.
 All output sinks auto-register via ``__init_subclass__``.
 """
 
+import json
+import types
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Iterator, Optional, Type
+from typing import Any, Dict, Iterator, Mapping, Optional, Type
+
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install secimport[fast-json]
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_json(obj: Any, *, indent: bool = False) -> bytes:
+    """
+    Serialize ``obj`` to UTF-8 JSON bytes for output sinks.
+
+    Uses orjson when it is installed and the stdlib ``json`` module
+    otherwise. Both backends fall back to ``str()`` for types JSON cannot
+    represent, and format datetimes with ``str()`` too, so the decoded
+    records are the same either way.
+
+    Args:
+        obj: Records (or a single record) to serialize.
+        indent: Pretty-print with two-space indentation; otherwise the
+            output is compact, with no spaces after separators.
+    """
+    if orjson is not None:
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, default=str).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), default=str).encode("utf-8")
 
 
 class OutputRegistry:
@@ -22,8 +53,9 @@ class OutputRegistry:
         return cls._registry.get(name)
 
     @classmethod
-    def list_outputs(cls) -> Dict[str, Type["BaseOutput"]]:
-        return dict(cls._registry)
+    def list_outputs(cls) -> Mapping[str, Type["BaseOutput"]]:
+        """Return a read-only view of the registered outputs."""
+        return types.MappingProxyType(cls._registry)
 
 
 class BaseOutput(ABC):
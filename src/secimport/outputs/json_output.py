@@ -1,26 +1,57 @@
 """JSON file output sink."""
 
-import json
 from pathlib import Path
-from typing import Any, Dict, Iterator
+from typing import Any, Dict, Iterator, Optional
 
-from .base import BaseOutput
+from .base import BaseOutput, dumps_json
 
 
 class JSONOutput(BaseOutput):
-    """Write enriched assets to a JSON file."""
+    """
+    Write enriched assets to a JSON file.
+
+    Records are streamed to disk one at a time, so memory use does not
+    grow with the export size. By default the file is a JSON array of
+    compact objects, one per line (``pretty=True`` indents them); with
+    ``jsonl=True`` it is JSON Lines (one compact object per line). When
+    ``jsonl`` is not given, a ``.jsonl`` or ``.ndjson`` path selects JSON
+    Lines.
+    """
 
     output_type = "json"
 
-    def __init__(self, path: str, **kwargs: Any) -> None:
+    #: Path suffixes that select JSON Lines when ``jsonl`` is not given.
+    JSONL_SUFFIXES = (".jsonl", ".ndjson")
+
+    def __init__(
+        self,
+        path: str,
+        jsonl: Optional[bool] = None,
+        pretty: bool = False,
+        **kwargs: Any,
+    ) -> None:
         super().__init__(**kwargs)
         self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if jsonl is None:
+            jsonl = self.path.suffix.lower() in self.JSONL_SUFFIXES
+        self.jsonl = jsonl
+        self.pretty = pretty
 
     def write(self, records: Iterator[Dict[str, Any]]) -> int:
-        items = list(records)
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(
-            json.dumps(items, indent=2, default=str),
-            encoding="utf-8",
-        )
-        return len(items)
+        count = 0
+        # A 1 MiB buffer turns many small record writes into few syscalls.
+        with self.path.open("wb", buffering=1 << 20) as fh:
+            if self.jsonl:
+                for record in records:
+                    fh.write(dumps_json(record) + b"\n")
+                    count += 1
+                return count
+
+            fh.write(b"[")
+            for record in records:
+                fh.write(b",\n" if count else b"\n")
+                fh.write(dumps_json(record, indent=self.pretty))
+                count += 1
+            fh.write(b"\n]" if count else b"]")
+        return count
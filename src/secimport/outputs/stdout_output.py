@@ -1,10 +1,9 @@
 """Stdout output sink."""
 
-import json
 import sys
 from typing import Any, Dict, Iterator
 
-from .base import BaseOutput
+from .base import BaseOutput, dumps_json
 
 
 class StdoutOutput(BaseOutput):
@@ -12,17 +11,38 @@ class StdoutOutput(BaseOutput):
 
     output_type = "stdout"
 
+    #: Encoded lines are collected up to this many bytes per write call.
+    FLUSH_BYTES = 64 * 1024
+
     def __init__(self, pretty: bool = False, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.pretty = pretty
 
     def write(self, records: Iterator[Dict[str, Any]]) -> int:
+        # Write bytes straight to the binary buffer when there is one;
+        # replaced streams (e.g. StringIO) only take text.
+        stdout = sys.stdout
+        buffer = getattr(stdout, "buffer", None)
+        if buffer is not None:
+            stdout.flush()
+        pending = bytearray()
+
+        def emit() -> None:
+            if buffer is not None:
+                buffer.write(bytes(pending))
+            else:
+                stdout.write(pending.decode("utf-8"))
+            pending.clear()
+
         count = 0
         for record in records:
-            if self.pretty:
-                json.dump(record, sys.stdout, indent=2, default=str)
-            else:
-                json.dump(record, sys.stdout, default=str)
-            sys.stdout.write("\n")
+            pending += dumps_json(record, indent=self.pretty)
+            pending += b"\n"
             count += 1
+            if len(pending) >= self.FLUSH_BYTES:
+                emit()
+        if pending:
+            emit()
+        if buffer is not None:
+            buffer.flush()
         return count
@@ -1,13 +1,23 @@
 """Webhook output sink."""
 
-import json
-from typing import Any, Dict, Iterator, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterator, List, Optional
 
-from .base import BaseOutput
+import httpx
+
+from .base import BaseOutput, dumps_json
 
 
 class WebhookOutput(BaseOutput):
-    """POST enriched assets to a webhook URL."""
+    """
+    POST enriched assets to a webhook URL.
+
+    All batches of one ``write`` share a single keep-alive connection
+    pool. With ``concurrency > 1`` up to that many batches are in flight
+    at once, so total time is no longer one round trip per batch; the
+    order in which batches arrive is then not guaranteed.
+    """
 
     output_type = "webhook"
 
@@ -16,38 +26,56 @@ class WebhookOutput(BaseOutput):
         url: str,
         headers: Optional[Dict[str, str]] = None,
         batch_size: int = 100,
+        concurrency: int = 1,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
         self.url = url
         self.headers = headers or {"Content-Type": "application/json"}
         self.batch_size = batch_size
+        self.concurrency = max(1, concurrency)
 
     def write(self, records: Iterator[Dict[str, Any]]) -> int:
-        import httpx
-
-        count = 0
-        batch: list[Dict[str, Any]] = []
+        limits = httpx.Limits(max_keepalive_connections=self.concurrency)
+        with httpx.Client(headers=self.headers, timeout=30, limits=limits) as client:
+            if self.concurrency == 1:
+                count = 0
+                for batch in self._batches(records):
+                    self._send_batch(client, batch)
+                    count += len(batch)
+                return count
+            return self._write_concurrent(client, records)
 
+    def _batches(self, records: Iterator[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+        """Group records into lists of at most ``batch_size``."""
+        batch: List[Dict[str, Any]] = []
         for record in records:
             batch.append(record)
             if len(batch) >= self.batch_size:
-                self._send_batch(batch, httpx)
-                count += len(batch)
+                yield batch
                 batch = []
-
         if batch:
-            self._send_batch(batch, httpx)
-            count += len(batch)
+            yield batch
 
+    def _write_concurrent(self, client: httpx.Client, records: Iterator[Dict[str, Any]]) -> int:
+        """Send batches from a thread pool, keeping at most ``concurrency`` in flight."""
+        count = 0
+        pending: Deque["Future[int]"] = deque()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            try:
+                for batch in self._batches(records):
+                    if len(pending) >= self.concurrency:
+                        count += pending.popleft().result()
+                    pending.append(pool.submit(self._send_batch, client, batch))
+                while pending:
+                    count += pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
         return count
 
-    def _send_batch(self, batch: list[Dict[str, Any]], httpx: Any) -> None:
-        """Send a batch of records to the webhook."""
-        response = httpx.post(
-            self.url,
-            headers=self.headers,
-            content=json.dumps(batch, default=str),
-            timeout=30,
-        )
+    def _send_batch(self, client: httpx.Client, batch: List[Dict[str, Any]]) -> int:
+        """Send a batch of records to the webhook; returns the batch size."""
+        response = client.post(self.url, content=dumps_json(batch))
         response.raise_for_status()
+        return len(batch)
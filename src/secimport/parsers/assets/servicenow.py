@@ -42,7 +42,4 @@ class ServiceNowAssetParser(BaseParser):
     }
 
     def _parse_row(self, row: Dict[str, Any]) -> ParsedAsset:
-        mapped = dict(row)
-        extra = mapped.pop("extra", {})
-        mapped["extra"] = extra
-        return ParsedAsset(**mapped)
+        return self._build(ParsedAsset, row)
@@ -6,16 +6,302 @@ Community contributors: Create a new file in the appropriate folder
 and implement these methods for your data source.
 """
 
+import csv
+import functools
+import itertools
 import logging
+import os
+import types
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple, Type, Union
-
-import pandas as pd
-from pydantic import BaseModel
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import PydanticUndefined
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger("secimport.parsers")
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_DATETIME = TypeAdapter(datetime)
+
+#: ``ingested_at`` shared by the records ``BaseParser.parse`` builds from one
+#: file, so records do not each read the clock. Set only while a row is being
+#: parsed, so interleaved ``parse`` generators each keep their own value.
+_INGESTED_AT: ContextVar[Optional[datetime]] = ContextVar("_INGESTED_AT", default=None)
+
+
+# Cell coercions. Used through COLUMN_COERCIONS they run once per distinct
+# value per batch, and scanner exports repeat scores and ports heavily, so
+# these stay plain Python rather than vectorised or compiled kernels.
+
+
+def coerce_cvss(value: Any) -> Optional[float]:
+    """Convert a CVSS cell to a float in 0-10; blank cells become None."""
+    if not value:
+        return None
+    score = float(value)
+    if not 0 <= score <= 10:
+        raise ValueError(f"CVSS score {score} outside 0-10")
+    return score
+
+
+def coerce_port(value: Any) -> Optional[int]:
+    """Convert a port cell to an int; blank cells become None."""
+    return int(value) if value else None
+
+
+def coerce_datetime(value: Any) -> Optional[datetime]:
+    """Parse a date cell as Pydantic would; blank cells become None."""
+    if not value:
+        return None
+    return _DATETIME.validate_python(value)
+
+
+def coerce_confidence(value: Any, default: float) -> float:
+    """Convert a confidence cell to a float in 0-1; blank or junk cells get ``default``."""
+    if not value:
+        return default
+    try:
+        confidence = float(value)
+    except (TypeError, ValueError):
+        return default
+    if not 0 <= confidence <= 1:
+        raise ValueError(f"confidence {confidence} outside 0-1")
+    return confidence
+
+
+#: Per-model construction plan: (field names, required field names,
+#: defaults in field order with PydanticUndefined for required fields,
+#: default factories).
+_ConstructPlan = Tuple[
+    FrozenSet[str],
+    FrozenSet[str],
+    Dict[str, Any],
+    Tuple[Tuple[str, Callable[..., Any]], ...],
+]
+
+_object_setattr = object.__setattr__
+
+
+@functools.lru_cache(maxsize=None)
+def _construct_plan(model: Type[BaseModel]) -> Optional[_ConstructPlan]:
+    """Precompute defaults for ``_construct``; None if ``model`` needs ``model_construct``."""
+    fields = model.model_fields
+    if (
+        model.model_config.get("extra") == "allow"
+        or model.__pydantic_post_init__
+        or any(f.alias or f.validation_alias for f in fields.values())
+    ):
+        return None
+    defaults: Dict[str, Any] = {}
+    factories: List[Tuple[str, Callable[..., Any]]] = []
+    for name, info in fields.items():
+        if isinstance(info.default, (list, dict, set)):
+            return None  # model_construct copies mutable defaults
+        defaults[name] = info.default
+        if info.default_factory is not None:
+            # Pydantic >= 2.10 factories may take the validated data.
+            if getattr(info, "default_factory_takes_validated_data", False):
+                return None
+            factories.append((name, info.default_factory))
+    required = frozenset(n for n, f in fields.items() if f.is_required())
+    return frozenset(fields), required, defaults, tuple(factories)
+
+
+def _construct(model: Type[ModelT], fields: Dict[str, Any]) -> ModelT:
+    """
+    Build ``model`` from trusted ``fields`` without validation.
+
+    Equivalent to ``model.model_construct(**fields)``, but the defaults are
+    resolved once per model instead of by a per-field Python loop on every
+    call, which on current Pydantic is slower than validating.
+    """
+    plan = _construct_plan(model)
+    if plan is None:
+        return model.model_construct(**fields)
+    names, required, defaults, factories = plan
+    if not fields.keys() <= names:
+        fields = {k: v for k, v in fields.items() if k in names}
+    values = defaults.copy()
+    for name, factory in factories:
+        if name not in fields:
+            values[name] = factory()
+    values.update(fields)
+    if not required <= fields.keys():
+        # Missing required fields stay unset, as with model_construct.
+        values = {k: v for k, v in values.items() if v is not PydanticUndefined}
+    obj = model.__new__(model)
+    _object_setattr(obj, "__dict__", values)
+    _object_setattr(obj, "__pydantic_fields_set__", set(fields))
+    _object_setattr(obj, "__pydantic_extra__", None)
+    _object_setattr(obj, "__pydantic_private__", None)
+    return obj
+
+
+def _advise_sequential(fh: IO[Any]) -> None:
+    """
+    Hint the kernel that a file will be read front to back.
+
+    On Linux this widens readahead for cold-cache scanner exports. It is a
+    no-op on platforms without ``posix_fadvise``.
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:  # pragma: no cover - e.g. pipes or exotic filesystems
+            pass
+
+
+@functools.lru_cache(maxsize=512)
+def _read_columns(path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """
+    Read a file's header row. ``mtime_ns`` and ``size`` only key the cache.
+
+    CSV headers are read with the stdlib ``csv`` module, like ``parse``
+    reads rows, so detecting a CSV file does not import pandas. Leading
+    blank lines are skipped and duplicate names renamed as pandas does;
+    an empty file has no columns.
+    """
+    if Path(path).suffix.lower() in (".xlsx", ".xls"):
+        import pandas as pd
+
+        return tuple(pd.read_excel(path, nrows=0).columns)
+
+    with open(path, newline="", encoding="utf-8-sig") as fh:
+        header = next((row for row in csv.reader(fh) if row), None)
+    return tuple(_dedupe_columns(header)) if header else ()
+
+
+def _dedupe_columns(header: List[str]) -> List[str]:
+    """
+    Name header cells as ``pandas.read_csv`` does.
+
+    Blank cells become ``Unnamed: <index>`` and repeated names get ``.1``,
+    ``.2``, ... suffixes. Named cells are deduplicated before blank ones,
+    so a given name is kept and the placeholder is the one renamed.
+    """
+    columns = [col if col else f"Unnamed: {i}" for i, col in enumerate(header)]
+    if len(set(columns)) == len(columns):
+        return columns
+    unnamed = [i for i, col in enumerate(header) if not col]
+    order = [i for i, col in enumerate(header) if col] + unnamed
+    counts: Dict[str, int] = {}
+    for i in order:
+        col = name = columns[i]
+        count = counts.get(col, 0)
+        while count:
+            counts[col] = count + 1
+            name = f"{col}.{count}"
+            count = count + 1 if name in columns else counts.get(name, 0)
+        columns[i] = name
+        counts[name] = count + 1
+    return columns
+
+
+def _iter_csv_rows(
+    path: Path, chunk_size: int
+) -> Iterator[Tuple[List[str], List[List[str]]]]:
+    """
+    Stream a CSV file as ``(columns, rows)`` batches of up to ``chunk_size``.
+
+    Reads with the stdlib ``csv`` module, skipping pandas' DataFrame build
+    for values ``parse`` only needs as lists of strings. Matches
+    ``read_csv(dtype=str, keep_default_na=False)``: blank lines, including
+    any before the header, are skipped, short rows are padded with ``""``,
+    blank headers become ``Unnamed: <index>`` and duplicate headers get
+    ``.1``-style suffixes. Rows longer than the
+    header are passed through whole so ``parse`` can reject them.
+
+    ``parse`` needs Python strings per cell, so building them dominates:
+    pyarrow's streaming CSV reader plus ``to_pylist`` measured no faster
+    than this loop on a 200k-row export.
+    """
+    with open(path, newline="", encoding="utf-8-sig", buffering=1 << 20) as fh:
+        _advise_sequential(fh)
+        yield from _iter_csv_stream(fh, chunk_size)
+
+
+def _iter_csv_stream(
+    fh: IO[str], chunk_size: int
+) -> Iterator[Tuple[List[str], List[List[str]]]]:
+    """Batch an open CSV text stream the way ``_iter_csv_rows`` does."""
+    reader = csv.reader(fh)
+    header = next((row for row in reader if row), None)
+    if header is None:
+        return
+    if header and header[0].startswith("\ufeff"):
+        header[0] = header[0][1:]
+    columns = _dedupe_columns(header)
+    width = len(columns)
+    pad = [""] * width
+    while True:
+        rows = list(itertools.islice(reader, chunk_size))
+        if not rows:
+            return
+        yield columns, [
+            row if len(row) >= width else (row + pad)[:width]
+            for row in rows
+            if row
+        ]
+
+
+_Signature = Tuple[
+    List[Type["BaseParser"]],
+    Dict[str, Tuple[Tuple[int, int], ...]],
+    List[int],
+    List[int],
+]
+
+#: Per-header column plan: ((position, field), ...), ((position, column), ...),
+#: and a row template holding the mapped keys in order, plus "extra".
+_ColumnPlan = Tuple[
+    Tuple[Tuple[int, str], ...],
+    Tuple[Tuple[int, str], ...],
+    Dict[str, Any],
+]
+
+#: Distinct headers remembered per parser class by ``_column_plan``.
+_MAX_COLUMN_PLANS = 64
+
+#: Per-batch COLUMN_COERCIONS plan: ((position, field, converter, memo), ...)
+#: for mapped columns, plus the converted blank value for absent fields.
+_CoercionPlan = Tuple[
+    Tuple[Tuple[int, str, Callable[[Any], Any], Dict[Any, Any]], ...],
+    Dict[str, Any],
+]
+
+
+class _Failed:
+    """Memoised converter error, re-raised for every cell with that value."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
 
 class ParserRegistry:
     """
@@ -27,30 +313,118 @@ class ParserRegistry:
 
     _parsers: Dict[str, Type["BaseParser"]] = {}
 
+    #: Detection signature built from every parser's DETECTION_COLUMNS:
+    #: (parsers, inverted index of lowercased column -> (parser index,
+    #: hit count) pairs, detection column totals, indexes of parsers
+    #: overriding ``detect``). Rebuilt lazily after registration changes.
+    _signature: Optional["_Signature"] = None
+
+    #: ``by_data_type`` results per data type, cleared on registration changes.
+    _by_data_type: Dict[str, Mapping[str, Type["BaseParser"]]] = {}
+
     @classmethod
     def register(cls, parser_cls: Type["BaseParser"]) -> Type["BaseParser"]:
         """Register a parser class by its ``name``."""
         cls._parsers[parser_cls.name] = parser_cls
+        cls._invalidate()
         return parser_cls
 
+    @classmethod
+    def unregister(cls, name: str) -> Optional[Type["BaseParser"]]:
+        """Remove a parser by ``name``, returning it if it was registered."""
+        parser_cls = cls._parsers.pop(name, None)
+        cls._invalidate()
+        return parser_cls
+
+    @classmethod
+    def _invalidate(cls) -> None:
+        """Drop lookups derived from the registered parsers."""
+        cls._signature = None
+        cls._by_data_type = {}
+
     @classmethod
     def get(cls, name: str) -> Optional[Type["BaseParser"]]:
         """Look up a parser by name."""
         return cls._parsers.get(name)
 
     @classmethod
-    def list_parsers(cls) -> Dict[str, Type["BaseParser"]]:
-        """Return all registered parsers."""
-        return dict(cls._parsers)
+    def list_parsers(cls) -> Mapping[str, Type["BaseParser"]]:
+        """Return a read-only view of all registered parsers."""
+        return types.MappingProxyType(cls._parsers)
 
     @classmethod
-    def by_data_type(cls, data_type: str) -> Dict[str, Type["BaseParser"]]:
+    def by_data_type(cls, data_type: str) -> Mapping[str, Type["BaseParser"]]:
         """Return parsers filtered by data_type (vulnerability, asset, owner)."""
-        return {
-            name: p
-            for name, p in cls._parsers.items()
-            if p.data_type == data_type
-        }
+        cached = cls._by_data_type.get(data_type)
+        if cached is None:
+            cached = cls._by_data_type[data_type] = types.MappingProxyType({
+                name: p
+                for name, p in cls._parsers.items()
+                if p.data_type == data_type
+            })
+        return cached
+
+    @classmethod
+    def score_columns(
+        cls,
+        columns: List[str],
+        *,
+        data_type: Optional[str] = None,
+    ) -> List[Tuple[Type["BaseParser"], float]]:
+        """
+        Score every registered parser against a file's columns.
+
+        Equivalent to calling ``parser_cls.detect(columns)`` for each parser,
+        but the default fingerprint check is one pass over the file's
+        columns through an inverted index, so the cost does not grow with
+        the number of registered parsers. Parsers that override ``detect``
+        are still asked directly.
+
+        Args:
+            columns: Column names from the file header.
+            data_type: Optionally restrict to a data type.
+
+        Returns:
+            ``(parser_cls, score)`` pairs in registration order.
+        """
+        if cls._signature is None:
+            cls._signature = cls._build_signature()
+        parsers, index, totals, custom = cls._signature
+
+        hits = [0] * len(parsers)
+        for col in {c.lower().strip() for c in columns}:
+            for i, count in index.get(col, ()):
+                hits[i] += count
+        scores = [h / t if t else 0.0 for h, t in zip(hits, totals)]
+        for i in custom:
+            scores[i] = parsers[i].detect(columns)
+
+        return [
+            (parser_cls, score)
+            for parser_cls, score in zip(parsers, scores)
+            if data_type is None or parser_cls.data_type == data_type
+        ]
+
+    @classmethod
+    def _build_signature(cls) -> "_Signature":
+        """Precompute the inverted column -> (parser, hit count) index."""
+        parsers = list(cls._parsers.values())
+        counts: Dict[str, Dict[int, int]] = {}
+        for i, parser_cls in enumerate(parsers):
+            # Counts rather than booleans so duplicated detection columns
+            # weigh the same as in BaseParser.detect.
+            for col in parser_cls._DETECTION_COLUMNS_LOWER:
+                by_parser = counts.setdefault(col, {})
+                by_parser[i] = by_parser.get(i, 0) + 1
+        index = {col: tuple(by_parser.items()) for col, by_parser in counts.items()}
+        totals = [len(p.DETECTION_COLUMNS) for p in parsers]
+
+        base_detect = BaseParser.detect.__func__  # type: ignore[attr-defined]
+        custom = [
+            i for i, p in enumerate(parsers)
+            if p.detect.__func__ is not base_detect  # type: ignore[attr-defined]
+        ]
+        return parsers, index, totals, custom
 
 
 class BaseParser(ABC):
@@ -91,9 +465,38 @@ class BaseParser(ABC):
     #: Columns that fingerprint this source (used for auto-detection).
     DETECTION_COLUMNS: ClassVar[Tuple[str, ...]] = ()
 
+    #: DETECTION_COLUMNS lowercased and stripped, built by
+    #: ``__init_subclass__`` so ``detect`` never re-folds them.
+    _DETECTION_COLUMNS_LOWER: ClassVar[Tuple[str, ...]] = ()
+
     #: Map source column names -> model field names.
     COLUMN_MAPPING: ClassVar[Dict[str, str]] = {}
 
+    #: COLUMN_MAPPING keyed by lowercased, stripped column name. Built by
+    #: ``__init_subclass__`` so rows never re-fold the mapping.
+    _COLUMN_MAPPING_LOWER: ClassVar[Dict[str, str]] = {}
+
+    #: Column plans by header, per class. Exports of one format share a
+    #: header, so rows and batches after the first skip re-resolving it.
+    _COLUMN_PLANS: ClassVar[Dict[Tuple[str, ...], _ColumnPlan]] = {}
+
+    #: Converters applied column-wise by ``parse`` before ``_parse_row``,
+    #: keyed by model field. Each distinct cell value is converted once per
+    #: batch and reused, since scanner exports repeat severities, scores,
+    #: ports and dates heavily. A converter that raises fails every row
+    #: with that value. Fields missing from the file get the converted
+    #: blank value (``converter(None)``).
+    COLUMN_COERCIONS: ClassVar[Dict[str, Callable[[Any], Any]]] = {}
+
+    #: Rows per DataFrame chunk when streaming CSV files through ``parse``.
+    CHUNK_SIZE: ClassVar[int] = 100_000
+
+    #: Build models in ``_build`` without validation (``model_construct``
+    #: semantics). ``_parse_row`` coerces every typed field first, so rows
+    #: are already well formed. Set False to validate every row, e.g. while
+    #: developing or debugging a parser.
+    FAST_CONSTRUCT: ClassVar[bool] = True
+
     # -- auto-registration -----------------------------------------------------
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
@@ -101,6 +504,13 @@ class BaseParser(ABC):
         super().__init_subclass__(**kwargs)
         if isinstance(cls.DETECTION_COLUMNS, list):
             cls.DETECTION_COLUMNS = tuple(cls.DETECTION_COLUMNS)
+        cls._DETECTION_COLUMNS_LOWER = tuple(
+            c.lower().strip() for c in cls.DETECTION_COLUMNS
+        )
+        cls._COLUMN_MAPPING_LOWER = {
+            k.lower().strip(): v for k, v in cls.COLUMN_MAPPING.items()
+        }
+        cls._COLUMN_PLANS = {}
         if not getattr(cls, "__abstractmethods__", None) and cls.name != "base":
             ParserRegistry.register(cls)
 
@@ -121,13 +531,12 @@ class BaseParser(ABC):
         Returns:
             Confidence score between 0.0 and 1.0.
         """
-        if not cls.DETECTION_COLUMNS:
+        expected = cls._DETECTION_COLUMNS_LOWER
+        if not expected:
             return 0.0
         columns_lower = {c.lower().strip() for c in columns}
-        matches = sum(
-            1 for dc in cls.DETECTION_COLUMNS if dc.lower().strip() in columns_lower
-        )
-        return matches / len(cls.DETECTION_COLUMNS)
+        matches = sum(1 for dc in expected if dc in columns_lower)
+        return matches / len(expected)
 
     # -- file reading ----------------------------------------------------------
 
@@ -136,7 +545,7 @@ class BaseParser(ABC):
         file_path: Union[str, Path],
         *,
         sheet_name: Optional[str] = None,
-    ) -> pd.DataFrame:
+    ) -> "pd.DataFrame":
         """
         Read a CSV or Excel file into a DataFrame.
 
@@ -149,6 +558,8 @@ class BaseParser(ABC):
         Returns:
             pandas DataFrame with the file contents.
         """
+        import pandas as pd
+
         path = Path(file_path)
         suffix = path.suffix.lower()
 
@@ -164,89 +575,290 @@ class BaseParser(ABC):
             return pd.read_csv(path, dtype=str, keep_default_na=False)
 
     @staticmethod
-    def get_columns(file_path: Union[str, Path]) -> List[str]:
-        """Read only the header row and return column names."""
+    def iter_chunks(
+        file_path: Union[str, Path],
+        *,
+        sheet_name: Optional[str] = None,
+        chunk_size: int = 100_000,
+    ) -> Iterator["pd.DataFrame"]:
+        """
+        Read a CSV or Excel file as a sequence of DataFrames.
+
+        CSV files are streamed ``chunk_size`` rows at a time so memory stays
+        bounded on large exports. Excel workbooks cannot be streamed by
+        pandas and are yielded as a single frame.
+
+        Args:
+            file_path: Path to the file.
+            sheet_name: For Excel files, which sheet to read.
+            chunk_size: Maximum rows per CSV chunk.
+
+        Yields:
+            pandas DataFrames with string-typed columns.
+        """
+        import pandas as pd
+
         path = Path(file_path)
         suffix = path.suffix.lower()
 
-        if suffix == ".csv":
-            df = pd.read_csv(path, nrows=0)
-        elif suffix in (".xlsx", ".xls"):
-            df = pd.read_excel(path, nrows=0)
-        else:
-            df = pd.read_csv(path, nrows=0)
+        if suffix in (".xlsx", ".xls"):
+            logger.info("%s: Excel workbooks are read in one piece", path.name)
+            yield pd.read_excel(
+                path, sheet_name=sheet_name or 0, dtype=str, keep_default_na=False
+            )
+            return
+        if suffix != ".csv":
+            logger.warning("Unknown extension %s, trying CSV", suffix)
 
-        return list(df.columns)
+        with open(path, "rb") as fh:
+            _advise_sequential(fh)
+            with pd.read_csv(
+                fh, dtype=str, keep_default_na=False, chunksize=chunk_size
+            ) as reader:
+                yield from reader
 
-    # -- mapped row helper -----------------------------------------------------
+    @classmethod
+    def iter_rows(
+        cls,
+        file_path: Union[str, Path, IO[str]],
+        *,
+        sheet_name: Optional[str] = None,
+        chunk_size: int = 100_000,
+    ) -> Iterator[Tuple[List[str], List[List[Any]]]]:
+        """
+        Read a CSV or Excel file as ``(columns, rows)`` batches.
 
-    def _map_columns(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        Each row is a list of cell strings in column order. CSV files are
+        read with the stdlib ``csv`` module; Excel workbooks go through
+        ``iter_chunks``. An open text stream is read as CSV. A CSV row
+        with more cells than the header is yielded whole.
+
+        Args:
+            file_path: Path to the file, or an open CSV text stream.
+            sheet_name: For Excel files, which sheet to read.
+            chunk_size: Maximum rows per batch.
+
+        Yields:
+            ``(columns, rows)`` tuples; ``columns`` is the same per file.
         """
-        Apply COLUMN_MAPPING to a row dict, renaming source columns
-        to model field names. Unmapped columns go into 'extra'.
+        if not isinstance(file_path, (str, os.PathLike)):
+            yield from _iter_csv_stream(file_path, chunk_size)
+            return
+        path = Path(file_path)
+        suffix = path.suffix.lower()
+
+        if suffix in (".xlsx", ".xls"):
+            for chunk in cls.iter_chunks(path, sheet_name=sheet_name):
+                yield chunk.columns.tolist(), chunk.to_numpy(dtype=object).tolist()
+            return
+        if suffix != ".csv":
+            logger.warning("Unknown extension %s, trying CSV", suffix)
+        yield from _iter_csv_rows(path, chunk_size)
+
+    @staticmethod
+    def get_columns(file_path: Union[str, Path]) -> List[str]:
         """
-        mapped: Dict[str, Any] = {}
-        extra: Dict[str, Any] = {}
+        Read only the header row and return column names.
+
+        Headers are cached per (path, mtime, size), so detecting and then
+        parsing the same file reads its header once.
+        """
+        path = Path(file_path).resolve()
+        stat = path.stat()
+        return list(_read_columns(str(path), stat.st_mtime_ns, stat.st_size))
 
-        # Build case-insensitive lookup for column mapping
-        mapping_lower = {k.lower(): v for k, v in self.COLUMN_MAPPING.items()}
+    # -- mapped row helper -----------------------------------------------------
+
+    def _column_plan(self, columns: Sequence[str]) -> _ColumnPlan:
+        """
+        Resolve COLUMN_MAPPING against a header, cached per class.
 
-        for col, value in row.items():
+        Returns ``(targets, extras, template)``: ``(position, field name)``
+        pairs for mapped columns, ``(position, column)`` pairs for the rest,
+        and the row template ``_map_values`` copies. Column names are
+        matched case-insensitively, ignoring surrounding spaces.
+        """
+        key = tuple(columns)
+        plans = self._COLUMN_PLANS
+        plan = plans.get(key)
+        if plan is None:
+            if len(plans) >= _MAX_COLUMN_PLANS:
+                plans.clear()
+            plan = plans[key] = self._resolve_columns(key)
+        return plan
+
+    def _resolve_columns(self, columns: Sequence[str]) -> _ColumnPlan:
+        """Build the uncached ``_column_plan`` for ``columns``."""
+        mapping_lower = self._COLUMN_MAPPING_LOWER
+        targets: List[Tuple[int, str]] = []
+        extras: List[Tuple[int, str]] = []
+        for pos, col in enumerate(columns):
             target = mapping_lower.get(col.lower().strip())
             if target:
-                mapped[target] = value
+                targets.append((pos, target))
             else:
-                extra[col] = value
+                extras.append((pos, col))
+        template = dict.fromkeys([target for _, target in targets] + ["extra"])
+        return tuple(targets), tuple(extras), template
 
+    @staticmethod
+    def _map_values(plan: _ColumnPlan, values: Sequence[Any]) -> Dict[str, Any]:
+        """
+        Build a mapped row dict from positional ``values`` using ``plan``.
+
+        Rows stay dicts rather than namedtuples: ``_build`` consumes a
+        field dict, so a tuple row would only be converted back. The dict
+        is built once here and owned by ``_parse_row``; nothing copies it.
+        """
+        # Plain loops: on Python < 3.12 each comprehension costs an extra
+        # function frame, which is measurable at one call per row. They
+        # also beat dict(zip(names, itemgetter(*positions)(values))).
+        # Copying the presized template skips the hash-table resizes of
+        # growing a fresh dict key by key.
+        targets, extras, template = plan
+        mapped = template.copy()
+        for pos, target in targets:
+            mapped[target] = values[pos]
+        extra: Dict[str, Any] = {}
+        for pos, col in extras:
+            extra[col] = values[pos]
         mapped["extra"] = extra
         return mapped
 
+    def _coercion_plan(self, plan: _ColumnPlan) -> _CoercionPlan:
+        """Resolve COLUMN_COERCIONS against a column plan, with empty memos."""
+        positions = {target: pos for pos, target in plan[0]}
+        mapped: List[Tuple[int, str, Callable[[Any], Any], Dict[Any, Any]]] = []
+        absent: Dict[str, Any] = {}
+        for field, convert in self.COLUMN_COERCIONS.items():
+            if field in positions:
+                mapped.append((positions[field], field, convert, {}))
+            else:
+                absent[field] = convert(None)
+        return tuple(mapped), absent
+
+    @staticmethod
+    def _coerce_values(
+        coercions: _CoercionPlan, values: Sequence[Any], mapped: Dict[str, Any]
+    ) -> None:
+        """Apply a coercion plan to one mapped row, memoising per value."""
+        columns, absent = coercions
+        for pos, field, convert, memo in columns:
+            raw = values[pos]
+            try:
+                value = memo[raw]
+            except KeyError:
+                try:
+                    value = convert(raw)
+                except Exception as exc:
+                    value = _Failed(exc)
+                memo[raw] = value
+            if type(value) is _Failed:
+                raise value.error.with_traceback(None)
+            mapped[field] = value
+        if absent:
+            mapped.update(absent)
+
+    def _map_columns(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Apply COLUMN_MAPPING to a row dict, renaming source columns
+        to model field names. Unmapped columns go into 'extra'.
+        """
+        return self._map_values(self._column_plan(list(row)), list(row.values()))
+
     # -- parsing ---------------------------------------------------------------
 
+    def _build(self, model: Type[ModelT], fields: Dict[str, Any]) -> ModelT:
+        """
+        Instantiate ``model`` from already-coerced row fields.
+
+        ``_parse_row`` is the only producer of these fields, so validation
+        is skipped unless ``FAST_CONSTRUCT`` is turned off.
+        """
+        ingested_at = _INGESTED_AT.get()
+        if ingested_at is not None:
+            fields.setdefault("ingested_at", ingested_at)
+        if self.FAST_CONSTRUCT:
+            return _construct(model, fields)
+        return model.model_validate(fields)
+
     @abstractmethod
     def _parse_row(self, row: Dict[str, Any]) -> BaseModel:
-        """Convert a single mapped row dict to the appropriate model instance."""
+        """
+        Convert a single mapped row dict to the appropriate model instance.
+
+        ``row`` is built fresh by ``_map_columns`` for each row, already
+        carries ``extra`` and has COLUMN_COERCIONS applied; the parser owns
+        it and may modify it in place. Keep per-column conversions in
+        COLUMN_COERCIONS and leave only logic that spans columns here
+        (fallbacks such as a default title, split fields).
+        """
         ...
 
     def parse(
         self,
-        file_path: Union[str, Path],
+        file_path: Union[str, Path, IO[str]],
         *,
         sheet_name: Optional[str] = None,
         result: Optional[Any] = None,
+        chunk_size: Optional[int] = None,
     ) -> Iterator[BaseModel]:
         """
         Parse a file and yield normalized model instances.
 
-        Reads the file, applies column mapping, and delegates each row
-        to ``_parse_row``. Logs and skips rows that fail to parse.
+        Streams the file in ``chunk_size``-row chunks, applies column
+        mapping, and delegates each row to ``_parse_row``. Logs and skips
+        rows that fail to parse, including rows with more cells than the
+        header.
 
         Args:
-            file_path: Path to the CSV/Excel file.
+            file_path: Path to the CSV/Excel file, or an open CSV text
+                stream (e.g. ``io.StringIO`` or ``sys.stdin``).
             sheet_name: For Excel files, which sheet to read.
             result: Optional ``ParseResult`` to track row counts and errors.
+            chunk_size: Rows per CSV chunk; defaults to ``CHUNK_SIZE``.
 
         Yields:
             Pydantic model instances (ParsedVulnerability, ParsedAsset, etc.)
         """
-        df = self.read_file(file_path, sheet_name=sheet_name)
-        logger.info(
-            "%s: parsing %d rows from %s", self.name, len(df), file_path
-        )
-
-        for idx, row in df.iterrows():
-            if result is not None:
-                result.total_rows += 1
-            try:
-                mapped = self._map_columns(row.to_dict())
-                item = self._parse_row(mapped)
-                if result is not None:
-                    result.parsed_count += 1
-                yield item
-            except Exception as exc:
-                logger.warning(
-                    "%s: failed to parse row %d: %s", self.name, idx, exc
-                )
+        logger.info("%s: parsing %s", self.name, file_path)
+
+        idx = -1
+        # Naive UTC, matching the SourceMetadata.ingested_at default.
+        ingested_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        for columns, rows in self.iter_rows(
+            file_path,
+            sheet_name=sheet_name,
+            chunk_size=chunk_size or self.CHUNK_SIZE,
+        ):
+            # Resolve the header once per batch, then map plain value
+            # lists.
+            plan = self._column_plan(columns)
+            coercions = self._coercion_plan(plan)
+            width = len(columns)
+            for values in rows:
+                idx += 1
                 if result is not None:
-                    result.error_count += 1
-                    result.errors.append(f"Row {idx}: {exc}")
+                    result.total_rows += 1
+                try:
+                    if len(values) > width:
+                        raise ValueError(f"expected {width} fields, saw {len(values)}")
+                    mapped = self._map_values(plan, values)
+                    self._coerce_values(coercions, values, mapped)
+                    token = _INGESTED_AT.set(ingested_at)
+                    try:
+                        item = self._parse_row(mapped)
+                    finally:
+                        _INGESTED_AT.reset(token)
+                    if result is not None:
+                        result.parsed_count += 1
+                    yield item
+                except Exception as exc:
+                    logger.warning(
+                        "%s: failed to parse row %d: %s", self.name, idx, exc
+                    )
+                    if result is not None:
+                        result.error_count += 1
+                        result.errors.append(f"Row {idx}: {exc}")
+
+        logger.info("%s: read %d rows from %s", self.name, idx + 1, file_path)
@@ -3,7 +3,7 @@
 from typing import Any, ClassVar, Dict, Tuple
 
 from ...models.base import ParsedOwnerMapping
-from ..base import BaseParser
+from ..base import BaseParser, coerce_confidence
 
 
 class GenericOwnerParser(BaseParser):
@@ -46,16 +46,5 @@ class GenericOwnerParser(BaseParser):
     }
 
     def _parse_row(self, row: Dict[str, Any]) -> ParsedOwnerMapping:
-        mapped = dict(row)
-        extra = mapped.pop("extra", {})
-
-        # Coerce confidence to float
-        conf = mapped.get("confidence")
-        if conf:
-            try:
-                mapped["confidence"] = float(conf)
-            except (ValueError, TypeError):
-                mapped["confidence"] = 1.0
-
-        mapped["extra"] = extra
-        return ParsedOwnerMapping(**mapped)
+        row["confidence"] = coerce_confidence(row.get("confidence"), 1.0)
+        return self._build(ParsedOwnerMapping, row)
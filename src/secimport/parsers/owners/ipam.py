@@ -3,7 +3,7 @@
 from typing import Any, ClassVar, Dict, Tuple
 
 from ...models.base import ParsedOwnerMapping
-from ..base import BaseParser
+from ..base import BaseParser, coerce_confidence
 
 
 class IPAMOwnerParser(BaseParser):
@@ -40,19 +40,7 @@ class IPAMOwnerParser(BaseParser):
     }
 
     def _parse_row(self, row: Dict[str, Any]) -> ParsedOwnerMapping:
-        mapped = dict(row)
-        extra = mapped.pop("extra", {})
-
-        mapped.setdefault("source_system", "IPAM")
-
-        conf = mapped.get("confidence")
-        if conf:
-            try:
-                mapped["confidence"] = float(conf)
-            except (ValueError, TypeError):
-                mapped["confidence"] = 0.8
-        else:
-            mapped["confidence"] = 0.8
-
-        mapped["extra"] = extra
-        return ParsedOwnerMapping(**mapped)
+        row.setdefault("source_system", "IPAM")
+
+        row["confidence"] = coerce_confidence(row.get("confidence"), 0.8)
+        return self._build(ParsedOwnerMapping, row)
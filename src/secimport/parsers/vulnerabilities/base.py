@@ -0,0 +1,37 @@
+"""
+Base class for vulnerability scanner CSV parsers.
+
+Extend this for: Qualys, Nessus, Tenable, Rapid7, OpenVAS, CrowdStrike, etc.
+"""
+
+from typing import Any, ClassVar, Dict
+
+from ...models.base import ParsedVulnerability
+from ..base import BaseParser
+
+
+class BaseVulnParser(BaseParser):
+    """
+    Base class for all vulnerability parsers.
+
+    Scanner exports differ only in their column names, converters and the
+    prefix used for untitled findings, so concrete parsers are declarations:
+    set ``COLUMN_MAPPING``, ``COLUMN_COERCIONS`` and ``TITLE_PREFIX`` and the
+    shared ``_parse_row`` does the rest. Override ``_parse_row`` (and call
+    ``super()``) only for logic that spans columns, such as a CVSS fallback.
+    """
+
+    data_type: ClassVar[str] = "vulnerability"
+
+    #: Untitled findings become ``"<TITLE_PREFIX>-<scanner_id>"``.
+    TITLE_PREFIX: ClassVar[str] = "Vuln"
+
+    def _default_title(self, row: Dict[str, Any]) -> str:
+        """Title for a finding whose export left the title blank."""
+        return f"{self.TITLE_PREFIX}-{row.get('scanner_id', 'unknown')}"
+
+    def _parse_row(self, row: Dict[str, Any]) -> ParsedVulnerability:
+        if not row.get("title"):
+            row["title"] = self._default_title(row)
+
+        return self._build(ParsedVulnerability, row)
@@ -1,19 +1,19 @@
 """CrowdStrike Spotlight vulnerability CSV parser."""
 
-from typing import Any, ClassVar, Dict, Tuple
+from typing import Any, Callable, ClassVar, Dict, Tuple
 
-from ...models.base import ParsedVulnerability
-from ...normalizers.severity import normalize_severity
-from ..base import BaseParser
+from ...normalizers.severity import severity_normalizer
+from ..base import coerce_cvss, coerce_datetime
+from .base import BaseVulnParser
 
 
-class CrowdStrikeVulnParser(BaseParser):
+class CrowdStrikeVulnParser(BaseVulnParser):
     """Parse CrowdStrike Spotlight CSV exports into ParsedVulnerability."""
 
     name: ClassVar[str] = "crowdstrike_vuln"
     source: ClassVar[str] = "crowdstrike"
-    data_type: ClassVar[str] = "vulnerability"
     description: ClassVar[str] = "CrowdStrike Spotlight vulnerability CSV export"
+    TITLE_PREFIX: ClassVar[str] = "Vuln"
 
     DETECTION_COLUMNS: ClassVar[Tuple[str, ...]] = (
         "Vulnerability ID",
@@ -37,17 +37,9 @@ class CrowdStrikeVulnParser(BaseParser):
         "Last Seen": "last_detected",
     }
 
-    def _parse_row(self, row: Dict[str, Any]) -> ParsedVulnerability:
-        mapped = dict(row)
-        extra = mapped.pop("extra", {})
-
-        mapped["severity"] = normalize_severity(mapped.get("severity"), "generic")
-
-        cvss = mapped.get("cvss_score")
-        mapped["cvss_score"] = float(cvss) if cvss else None
-
-        if not mapped.get("title"):
-            mapped["title"] = f"Vuln-{mapped.get('scanner_id', 'unknown')}"
-
-        mapped["extra"] = extra
-        return ParsedVulnerability(**mapped)
+    COLUMN_COERCIONS: ClassVar[Dict[str, Callable[[Any], Any]]] = {
+        "severity": severity_normalizer("generic"),
+        "cvss_score": coerce_cvss,
+        "first_detected": coerce_datetime,
+        "last_detected": coerce_datetime,
+    }
@@ -1,18 +1,17 @@
 """Generic vulnerability CSV parser for unknown/custom formats."""
 
-from typing import Any, ClassVar, Dict, Tuple
+from typing import Any, Callable, ClassVar, Dict, Tuple
 
-from ...models.base import ParsedVulnerability
-from ...normalizers.severity import normalize_severity
-from ..base import BaseParser
+from ...normalizers.severity import severity_normalizer
+from ..base import coerce_cvss, coerce_port
+from .base import BaseVulnParser
 
 
-class GenericVulnParser(BaseParser):
+class GenericVulnParser(BaseVulnParser):
     """Parse generic vulnerability CSVs with common column names."""
 
     name: ClassVar[str] = "generic_vuln"
     source: ClassVar[str] = "generic"
-    data_type: ClassVar[str] = "vulnerability"
     description: ClassVar[str] = "Generic vulnerability CSV with standard column names"
 
     DETECTION_COLUMNS: ClassVar[Tuple[str, ...]] = (
@@ -45,20 +44,11 @@ class GenericVulnParser(BaseParser):
         "Protocol": "protocol",
     }
 
-    def _parse_row(self, row: Dict[str, Any]) -> ParsedVulnerability:
-        mapped = dict(row)
-        extra = mapped.pop("extra", {})
-
-        mapped["severity"] = normalize_severity(mapped.get("severity"), "generic")
-
-        cvss = mapped.get("cvss_score")
-        mapped["cvss_score"] = float(cvss) if cvss else None
-
-        port = mapped.get("port")
-        mapped["port"] = int(port) if port else None
-
-        if not mapped.get("title"):
-            mapped["title"] = mapped.get("cve_id") or "Unknown Vulnerability"
+    COLUMN_COERCIONS: ClassVar[Dict[str, Callable[[Any], Any]]] = {
+        "severity": severity_normalizer("generic"),
+        "cvss_score": coerce_cvss,
+        "port": coerce_port,
+    }
 
-        mapped["extra"] = extra
-        return ParsedVulnerability(**mapped)
+    def _default_title(self, row: Dict[str, Any]) -> str:
+        return row.get("cve_id") or "Unknown Vulnerability"
@@ -1,19 +1,20 @@
 """Nessus vulnerability CSV parser."""
 
-from typing import Any, ClassVar, Dict, Tuple
+from typing import Any, Callable, ClassVar, Dict, Tuple
 
 from ...models.base import ParsedVulnerability
-from ...normalizers.severity import normalize_severity
-from ..base import BaseParser
+from ...normalizers.severity import severity_normalizer
+from ..base import coerce_cvss, coerce_port
+from .base import BaseVulnParser
 
 
-class NessusVulnParser(BaseParser):
+class NessusVulnParser(BaseVulnParser):
     """Parse Nessus CSV exports into ParsedVulnerability."""
 
     name: ClassVar[str] = "nessus_vuln"
     source: ClassVar[str] = "nessus"
-    data_type: ClassVar[str] = "vulnerability"
     description: ClassVar[str] = "Nessus vulnerability CSV export"
+    TITLE_PREFIX: ClassVar[str] = "Plugin"
 
     DETECTION_COLUMNS: ClassVar[Tuple[str, ...]] = (
         "Plugin ID",
@@ -38,23 +39,15 @@ class NessusVulnParser(BaseParser):
         "Protocol": "protocol",
     }
 
-    def _parse_row(self, row: Dict[str, Any]) -> ParsedVulnerability:
-        mapped = dict(row)
-        extra = mapped.pop("extra", {})
-
-        # Normalize severity
-        mapped["severity"] = normalize_severity(mapped.get("severity"), "nessus")
+    COLUMN_COERCIONS: ClassVar[Dict[str, Callable[[Any], Any]]] = {
+        "severity": severity_normalizer("nessus"),
+        "port": coerce_port,
+    }
 
+    def _parse_row(self, row: Dict[str, Any]) -> ParsedVulnerability:
         # Prefer CVSS v3, fall back to v2
-        cvss = mapped.pop("cvss_score", None) or mapped.pop("cvss_score_v2", None)
-        extra.pop("cvss_score_v2", None)
-        mapped["cvss_score"] = float(cvss) if cvss else None
-
-        port = mapped.get("port")
-        mapped["port"] = int(port) if port else None
-
-        if not mapped.get("title"):
-            mapped["title"] = f"Plugin-{mapped.get('scanner_id', 'unknown')}"
+        cvss_v2 = row.pop("cvss_score_v2", None)
+        cvss = row.pop("cvss_score", None) or cvss_v2
+        row["cvss_score"] = coerce_cvss(cvss)
 
-        mapped["extra"] = extra
-        return ParsedVulnerability(**mapped)
+        return super()._parse_row(row)
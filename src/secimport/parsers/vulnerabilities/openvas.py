@@ -1,19 +1,37 @@
 """OpenVAS vulnerability CSV parser."""
 
-from typing import Any, ClassVar, Dict, Tuple
+import functools
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple
 
 from ...models.base import ParsedVulnerability
-from ...normalizers.severity import normalize_severity
-from ..base import BaseParser
+from ...normalizers.severity import severity_normalizer
+from ..base import coerce_cvss
+from .base import BaseVulnParser
 
 
-class OpenVASVulnParser(BaseParser):
+@functools.lru_cache(maxsize=4096)
+def _split_port(value: Any) -> Tuple[Optional[int], Optional[str]]:
+    """Split an OpenVAS ``port/protocol`` cell; non-numeric ports become None."""
+    text = str(value)
+    if "/" not in text:
+        try:
+            return int(value), None
+        except (TypeError, ValueError):
+            return None, None
+    number, _, protocol = text.partition("/")
+    try:
+        return int(number), protocol
+    except ValueError:
+        return None, protocol
+
+
+class OpenVASVulnParser(BaseVulnParser):
     """Parse OpenVAS/Greenbone CSV exports into ParsedVulnerability."""
 
     name: ClassVar[str] = "openvas_vuln"
     source: ClassVar[str] = "openvas"
-    data_type: ClassVar[str] = "vulnerability"
     description: ClassVar[str] = "OpenVAS/Greenbone vulnerability CSV export"
+    TITLE_PREFIX: ClassVar[str] = "NVT"
 
     DETECTION_COLUMNS: ClassVar[Tuple[str, ...]] = (
         "NVT OID",
@@ -37,34 +55,20 @@ class OpenVASVulnParser(BaseParser):
         "Protocol": "protocol",
     }
 
-    def _parse_row(self, row: Dict[str, Any]) -> ParsedVulnerability:
-        mapped = dict(row)
-        extra = mapped.pop("extra", {})
-
-        mapped["severity"] = normalize_severity(mapped.get("severity"), "openvas")
-
-        cvss = mapped.get("cvss_score")
-        mapped["cvss_score"] = float(cvss) if cvss else None
+    COLUMN_COERCIONS: ClassVar[Dict[str, Callable[[Any], Any]]] = {
+        "severity": severity_normalizer("openvas"),
+        "cvss_score": coerce_cvss,
+    }
 
-        # OpenVAS port field is "port/protocol" format
-        port_raw = mapped.get("port")
-        if port_raw and "/" in str(port_raw):
-            parts = str(port_raw).split("/", 1)
-            try:
-                mapped["port"] = int(parts[0])
-            except ValueError:
-                mapped["port"] = None
-            mapped.setdefault("protocol", parts[1])
-        elif port_raw:
-            try:
-                mapped["port"] = int(port_raw)
-            except ValueError:
-                mapped["port"] = None
+    def _parse_row(self, row: Dict[str, Any]) -> ParsedVulnerability:
+        # OpenVAS port field is "port/protocol" format (or "general/tcp");
+        # exports repeat a handful of values, so splits are cached.
+        port_raw = row.get("port")
+        if port_raw:
+            row["port"], protocol = _split_port(port_raw)
+            if protocol is not None:
+                row.setdefault("protocol", protocol)
         else:
-            mapped["port"] = None
-
-        if not mapped.get("title"):
-            mapped["title"] = f"NVT-{mapped.get('scanner_id', 'unknown')}"
+            row["port"] = None
 
-        mapped["extra"] = extra
-        return ParsedVulnerability(**mapped)
+        return super()._parse_row(row)
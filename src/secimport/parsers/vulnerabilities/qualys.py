@@ -1,19 +1,19 @@
 """Qualys vulnerability CSV parser."""
 
-from typing import Any, ClassVar, Dict, Tuple
+from typing import Any, Callable, ClassVar, Dict, Tuple
 
-from ...models.base import ParsedVulnerability
-from ...normalizers.severity import normalize_severity
-from ..base import BaseParser
+from ...normalizers.severity import severity_normalizer
+from ..base import coerce_cvss, coerce_datetime, coerce_port
+from .base import BaseVulnParser
 
 
-class QualysVulnParser(BaseParser):
+class QualysVulnParser(BaseVulnParser):
     """Parse Qualys VM CSV exports into ParsedVulnerability."""
 
     name: ClassVar[str] = "qualys_vuln"
     source: ClassVar[str] = "qualys"
-    data_type: ClassVar[str] = "vulnerability"
     description: ClassVar[str] = "Qualys VM vulnerability CSV export"
+    TITLE_PREFIX: ClassVar[str] = "QID"
 
     DETECTION_COLUMNS: ClassVar[Tuple[str, ...]] = (
         "QID",
@@ -40,23 +40,10 @@ class QualysVulnParser(BaseParser):
         "Last Detected": "last_detected",
     }
 
-    def _parse_row(self, row: Dict[str, Any]) -> ParsedVulnerability:
-        mapped = dict(row)
-        extra = mapped.pop("extra", {})
-
-        # Normalize severity
-        mapped["severity"] = normalize_severity(mapped.get("severity"), "qualys")
-
-        # Coerce numeric fields
-        cvss = mapped.get("cvss_score")
-        mapped["cvss_score"] = float(cvss) if cvss else None
-
-        port = mapped.get("port")
-        mapped["port"] = int(port) if port else None
-
-        # Ensure title is present
-        if not mapped.get("title"):
-            mapped["title"] = f"QID-{mapped.get('scanner_id', 'unknown')}"
-
-        mapped["extra"] = extra
-        return ParsedVulnerability(**mapped)
+    COLUMN_COERCIONS: ClassVar[Dict[str, Callable[[Any], Any]]] = {
+        "severity": severity_normalizer("qualys"),
+        "cvss_score": coerce_cvss,
+        "first_detected": coerce_datetime,
+        "last_detected": coerce_datetime,
+        "port": coerce_port,
+    }
@@ -1,19 +1,19 @@
 """Rapid7 InsightVM vulnerability CSV parser."""
 
-from typing import Any, ClassVar, Dict, Tuple
+from typing import Any, Callable, ClassVar, Dict, Tuple
 
-from ...models.base import ParsedVulnerability
-from ...normalizers.severity import normalize_severity
-from ..base import BaseParser
+from ...normalizers.severity import severity_normalizer
+from ..base import coerce_cvss, coerce_datetime, coerce_port
+from .base import BaseVulnParser
 
 
-class Rapid7VulnParser(BaseParser):
+class Rapid7VulnParser(BaseVulnParser):
     """Parse Rapid7 InsightVM CSV exports into ParsedVulnerability."""
 
     name: ClassVar[str] = "rapid7_vuln"
     source: ClassVar[str] = "rapid7"
-    data_type: ClassVar[str] = "vulnerability"
     description: ClassVar[str] = "Rapid7 InsightVM vulnerability CSV export"
+    TITLE_PREFIX: ClassVar[str] = "Vuln"
 
     DETECTION_COLUMNS: ClassVar[Tuple[str, ...]] = (
         "Vulnerability ID",
@@ -39,20 +39,10 @@ class Rapid7VulnParser(BaseParser):
         "Last Found": "last_detected",
     }
 
-    def _parse_row(self, row: Dict[str, Any]) -> ParsedVulnerability:
-        mapped = dict(row)
-        extra = mapped.pop("extra", {})
-
-        mapped["severity"] = normalize_severity(mapped.get("severity"), "rapid7")
-
-        cvss = mapped.get("cvss_score")
-        mapped["cvss_score"] = float(cvss) if cvss else None
-
-        port = mapped.get("port")
-        mapped["port"] = int(port) if port else None
-
-        if not mapped.get("title"):
-            mapped["title"] = f"Vuln-{mapped.get('scanner_id', 'unknown')}"
-
-        mapped["extra"] = extra
-        return ParsedVulnerability(**mapped)
+    COLUMN_COERCIONS: ClassVar[Dict[str, Callable[[Any], Any]]] = {
+        "severity": severity_normalizer("rapid7"),
+        "cvss_score": coerce_cvss,
+        "first_detected": coerce_datetime,
+        "last_detected": coerce_datetime,
+        "port": coerce_port,
+    }
@@ -1,19 +1,20 @@
 """Tenable.io vulnerability CSV parser."""
 
-from typing import Any, ClassVar, Dict, Tuple
+from typing import Any, Callable, ClassVar, Dict, Tuple
 
 from ...models.base import ParsedVulnerability
-from ...normalizers.severity import normalize_severity
-from ..base import BaseParser
+from ...normalizers.severity import severity_normalizer
+from ..base import coerce_cvss, coerce_datetime, coerce_port
+from .base import BaseVulnParser
 
 
-class TenableVulnParser(BaseParser):
+class TenableVulnParser(BaseVulnParser):
     """Parse Tenable.io CSV exports into ParsedVulnerability."""
 
     name: ClassVar[str] = "tenable_vuln"
     source: ClassVar[str] = "tenable"
-    data_type: ClassVar[str] = "vulnerability"
     description: ClassVar[str] = "Tenable.io vulnerability CSV export"
+    TITLE_PREFIX: ClassVar[str] = "Plugin"
 
     DETECTION_COLUMNS: ClassVar[Tuple[str, ...]] = (
         "Plugin ID",
@@ -40,21 +41,16 @@ class TenableVulnParser(BaseParser):
         "Last Seen": "last_detected",
     }
 
-    def _parse_row(self, row: Dict[str, Any]) -> ParsedVulnerability:
-        mapped = dict(row)
-        extra = mapped.pop("extra", {})
-
-        mapped["severity"] = normalize_severity(mapped.get("severity"), "tenable")
-
-        cvss = mapped.pop("cvss_score", None) or mapped.pop("cvss_score_v2", None)
-        extra.pop("cvss_score_v2", None)
-        mapped["cvss_score"] = float(cvss) if cvss else None
-
-        port = mapped.get("port")
-        mapped["port"] = int(port) if port else None
+    COLUMN_COERCIONS: ClassVar[Dict[str, Callable[[Any], Any]]] = {
+        "severity": severity_normalizer("tenable"),
+        "first_detected": coerce_datetime,
+        "last_detected": coerce_datetime,
+        "port": coerce_port,
+    }
 
-        if not mapped.get("title"):
-            mapped["title"] = f"Plugin-{mapped.get('scanner_id', 'unknown')}"
+    def _parse_row(self, row: Dict[str, Any]) -> ParsedVulnerability:
+        cvss_v2 = row.pop("cvss_score_v2", None)
+        cvss = row.pop("cvss_score", None) or cvss_v2
+        row["cvss_score"] = coerce_cvss(cvss)
 
-        mapped["extra"] = extra
-        return ParsedVulnerability(**mapped)
+        return super()._parse_row(row)
@@ -37,8 +37,9 @@ def discover_plugins() -> Dict[str, List[str]]:
     """
     loaded: Dict[str, List[str]] = {"connectors": [], "parsers": []}
 
+    # One metadata scan of the installed distributions serves both groups.
+    eps = importlib.metadata.entry_points()
     for group, key in [(CONNECTOR_GROUP, "connectors"), (PARSER_GROUP, "parsers")]:
-        eps = importlib.metadata.entry_points()
         # Python 3.12+ returns a SelectableGroups; 3.10-3.11 returns dict
         if hasattr(eps, "select"):
             entries = eps.select(group=group)
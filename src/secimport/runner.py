@@ -6,15 +6,42 @@ through the correlator, and writes enriched assets to outputs.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from .config.loader import OutputConfig, SecimportConfig, SourceConfig, load_config
-from .connectors.base import AuthConfig, ConnectionConfig, ConnectorRegistry
-from .enrichment.correlator import AssetCorrelator
+from .connectors.base import (
+    AuthConfig,
+    BaseConnector,
+    ConnectionConfig,
+    ConnectorRegistry,
+    ConnectorStatus,
+)
+from .detectors.auto_detect import parse_file
+from .enrichment.correlator import AssetCorrelator, gc_paused
 from .outputs.base import OutputRegistry
 
 logger = logging.getLogger("secimport.runner")
 
+#: Receives ``(kind, records)`` for one source and returns the record count;
+#: ``kind`` names an ``AssetCorrelator.ingest_<kind>`` method.
+_Sink = Callable[[str, Iterable[Any]], int]
+
+#: Correlator input kind for each ``BaseConnector.SUPPORTED_OPERATIONS`` entry.
+_OPERATION_KINDS = {
+    "get_endpoints": "endpoints",
+    "get_assets": "assets",
+    "get_devices": "network_observations",
+}
+
+#: Correlator input kind for each parser ``data_type``.
+_FILE_KINDS = {
+    "vulnerability": "vulnerabilities",
+    "asset": "assets",
+    "owner": "owner_mappings",
+}
+
 
 class IngestionRunner:
     """
@@ -24,11 +51,47 @@ class IngestionRunner:
     2. Ingest data → feed correlator
     3. Optionally deduplicate
     4. Write enriched assets to outputs
+
+    Sources are streamed into the correlator one at a time by default.
+    With ``config.source_workers`` above 1, they are fetched concurrently,
+    each fully read into memory, and fed to the correlator in config order.
+
+    Each ``run()`` connects and closes its connectors. Used as a context
+    manager, the runner keeps connectors (and their HTTP connection pools)
+    open across repeated ``run()`` calls until the block exits::
+
+        with IngestionRunner.from_config("secimport.yaml") as runner:
+            while True:
+                runner.run()
+                time.sleep(3600)
     """
 
     def __init__(self, config: SecimportConfig) -> None:
         self.config = config
-        self.correlator = AssetCorrelator()
+        self.correlator = AssetCorrelator(
+            keep_source_records=config.enrichment.keep_source_records,
+            min_merge_confidence=config.enrichment.min_merge_confidence,
+        )
+        # Connectors by source name, reused while they stay connected.
+        self._connectors: Dict[str, BaseConnector] = {}
+        self._keep_connections = False
+
+    def __enter__(self) -> "IngestionRunner":
+        self._keep_connections = True
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._keep_connections = False
+        self.close()
+
+    def close(self) -> None:
+        """Disconnect and forget every connector opened by ``run()``."""
+        connectors, self._connectors = self._connectors, {}
+        for connector in connectors.values():
+            try:
+                connector.disconnect()
+            except Exception as exc:
+                logger.warning("Failed to disconnect %s: %s", connector.name, exc)
 
     @classmethod
     def from_config(cls, path: str | Path) -> "IngestionRunner":
@@ -38,18 +101,17 @@ class IngestionRunner:
 
     def run(self) -> None:
         """Execute the full ingestion pipeline."""
-        # Ingest from all sources
-        for source_cfg in self.config.sources:
-            try:
-                self._ingest_source(source_cfg)
-            except Exception as exc:
-                logger.error("Failed to ingest from %s: %s", source_cfg.name, exc)
+        try:
+            self._run()
+        finally:
+            if not self._keep_connections:
+                self.close()
 
-        # Deduplicate if configured
-        if self.config.enrichment.deduplicate:
-            merges = self.correlator.deduplicate()
-            if merges:
-                logger.info("Deduplicated %d asset pairs", merges)
+    def _run(self) -> None:
+        # Ingestion and deduplication build a large, long-lived heap, so
+        # the cyclic collector is paused for them (see ``gc_paused``).
+        with gc_paused():
+            self._ingest_all()
 
         # Write to outputs
         for output_cfg in self.config.outputs:
@@ -62,8 +124,71 @@ class IngestionRunner:
             "Pipeline complete: %d enriched assets", self.correlator.asset_count
         )
 
-    def _ingest_source(self, source_cfg: "SourceConfig") -> None:
-        """Ingest data from a single configured source."""
+    def _ingest_all(self) -> None:
+        """Feed every configured source to the correlator, then deduplicate."""
+        # Ingest from all sources
+        sources = self.config.sources
+        workers = min(self.config.source_workers, len(sources))
+        if workers <= 1:
+            for source_cfg in sources:
+                try:
+                    self._ingest_source(source_cfg)
+                except Exception as exc:
+                    logger.error("Failed to ingest from %s: %s", source_cfg.name, exc)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="secimport-source"
+            ) as pool:
+                futures = [pool.submit(self._fetch_source, cfg) for cfg in sources]
+                # The correlator is not thread-safe, and merge results depend
+                # on ingestion order, so feed it here in config order.
+                for source_cfg, future in zip(sources, futures):
+                    try:
+                        for kind, records in future.result():
+                            self._ingest_records(kind, records)
+                    except Exception as exc:
+                        logger.error("Failed to ingest from %s: %s", source_cfg.name, exc)
+
+        # Deduplicate if configured
+        if self.config.enrichment.deduplicate:
+            merges = self.correlator.deduplicate()
+            if merges:
+                logger.info("Deduplicated %d asset pairs", merges)
+
+    def _ingest_records(self, kind: str, records: Iterable[Any]) -> int:
+        """Feed ``records`` to the correlator's ``ingest_<kind>`` method."""
+        count: int = getattr(self.correlator, f"ingest_{kind}")(records)
+        return count
+
+    def _fetch_source(
+        self, source_cfg: "SourceConfig"
+    ) -> List[Tuple[str, List[Any]]]:
+        """Read all records from a source without touching the correlator."""
+        fetched: List[Tuple[str, List[Any]]] = []
+
+        def collect(kind: str, records: Iterable[Any]) -> int:
+            items = list(records)
+            fetched.append((kind, items))
+            return len(items)
+
+        self._ingest_source(source_cfg, collect)
+        return fetched
+
+    def _ingest_source(
+        self, source_cfg: "SourceConfig", sink: Optional[_Sink] = None
+    ) -> None:
+        """
+        Ingest data from a single configured source.
+
+        Records stream into the correlator unless ``sink`` is given.
+        """
+        ingest = sink or self._ingest_records
+        if source_cfg.path is not None:
+            self._ingest_file(source_cfg, source_cfg.path, ingest)
+            return
+        if source_cfg.connector is None:
+            # SourceConfig validation rules this out; model_construct does not.
+            raise ValueError(f"source {source_cfg.name} has neither 'path' nor 'connector'")
 
         connector_cls = ConnectorRegistry.get(source_cfg.connector)
         if connector_cls is None:
@@ -74,52 +199,66 @@ class IngestionRunner:
             )
             return
 
-        conn_config = ConnectionConfig(
-            base_url=source_cfg.base_url,
-            verify_ssl=source_cfg.verify_ssl,
-            timeout=source_cfg.timeout,
-            max_retries=source_cfg.max_retries,
-        )
-        auth_config = AuthConfig(
-            auth_type=source_cfg.auth_type,
-            credentials=source_cfg.credentials,
-        )
+        connector = self._connectors.get(source_cfg.name)
+        if connector is None:
+            connector = connector_cls(
+                ConnectionConfig(
+                    base_url=source_cfg.base_url,
+                    verify_ssl=source_cfg.verify_ssl,
+                    timeout=source_cfg.timeout,
+                    max_retries=source_cfg.max_retries,
+                ),
+                AuthConfig(
+                    auth_type=source_cfg.auth_type,
+                    credentials=source_cfg.credentials,
+                ),
+            )
+            self._connectors[source_cfg.name] = connector
+        if connector.status != ConnectorStatus.CONNECTED:
+            connector.connect()
 
-        connector = connector_cls(conn_config, auth_config)
+        count = 0
+        for operation in connector.SUPPORTED_OPERATIONS:
+            fetch = getattr(connector, operation)
+            count += ingest(_OPERATION_KINDS[operation], fetch())
 
-        with connector:
-            # Try to ingest assets or endpoints depending on connector type
-            count = 0
-            if hasattr(connector, "get_endpoints"):
-                try:
-                    count += self.correlator.ingest_endpoints(
-                        connector.get_endpoints()
-                    )
-                except NotImplementedError:
-                    pass
+        logger.info(
+            "Ingested %d records from %s (%s)",
+            count,
+            source_cfg.name,
+            source_cfg.connector,
+        )
 
-            if hasattr(connector, "get_assets"):
-                try:
-                    count += self.correlator.ingest_assets(
-                        connector.get_assets()
-                    )
-                except NotImplementedError:
-                    pass
+    def _ingest_file(self, source_cfg: "SourceConfig", path: str, ingest: _Sink) -> None:
+        """
+        Parse the export at ``path`` and stream its records into ``ingest``.
 
-            if hasattr(connector, "get_devices"):
-                try:
-                    count += self.correlator.ingest_network_observations(
-                        connector.get_devices()
-                    )
-                except NotImplementedError:
-                    pass
-
-            logger.info(
-                "Ingested %d records from %s (%s)",
-                count,
+        Rows are read in ``options.chunk_size`` batches and fed straight
+        through, so memory stays bounded by the chunk size unless ``ingest``
+        collects them (concurrent fetching).
+        """
+        records, result = parse_file(
+            path,
+            parser_name=source_cfg.parser,
+            chunk_size=source_cfg.options.get("chunk_size"),
+        )
+        kind = _FILE_KINDS.get(result.data_type)
+        if kind is None:
+            logger.warning(
+                "No correlator input for %s data (skipping %s)",
+                result.data_type,
                 source_cfg.name,
-                source_cfg.connector,
             )
+            return
+
+        count = ingest(kind, records)
+        logger.info(
+            "Ingested %d records from %s (%s, %d row errors)",
+            count,
+            source_cfg.name,
+            result.source_type,
+            result.error_count,
+        )
 
     def _write_output(self, output_cfg: "OutputConfig") -> None:
         """Write enriched assets to a single output."""
@@ -138,7 +277,10 @@ class IngestionRunner:
 
         output = output_cls(**kwargs)
 
-        # Serialize enriched assets to dicts
+        # Serialize enriched assets to dicts one at a time. Dumping them all
+        # through a TypeAdapter(List[EnrichedAsset]) is no faster (the
+        # provenance-flattening serializer runs per asset either way) and
+        # would hold every dict in memory before the output sees one.
         def _records():
             for asset in self.correlator.get_enriched_assets():
                 yield asset.model_dump(exclude_none=True)
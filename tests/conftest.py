@@ -1,11 +1,14 @@
-"""Shared fixtures for secimport tests."""
+"""Shared fixtures for secimport tests.
+
+Connector configs are frozen models, so one instance serves the whole session.
+"""
 
 import pytest
 
 from secimport.connectors.base import AuthConfig, ConnectionConfig
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def basic_auth() -> AuthConfig:
     """Basic auth credentials for testing."""
     return AuthConfig(
@@ -14,7 +17,7 @@ def basic_auth() -> AuthConfig:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def api_key_auth() -> AuthConfig:
     """API-key auth credentials for testing."""
     return AuthConfig(
@@ -23,7 +26,7 @@ def api_key_auth() -> AuthConfig:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def oauth2_auth() -> AuthConfig:
     """OAuth2 auth credentials for testing."""
     return AuthConfig(
@@ -32,7 +35,7 @@ def oauth2_auth() -> AuthConfig:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def token_auth() -> AuthConfig:
     """Token auth credentials for testing."""
     return AuthConfig(
@@ -41,7 +44,7 @@ def token_auth() -> AuthConfig:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def connection_config() -> ConnectionConfig:
     """Standard connection config for testing."""
     return ConnectionConfig(
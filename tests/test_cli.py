@@ -1,5 +1,8 @@
 """Tests for CLI commands."""
 
+import subprocess
+import sys
+
 from secimport.cli.main import main
 
 
@@ -18,8 +21,28 @@ class TestCLIListConnectors:
         output = capsys.readouterr().out
         assert "qualys" in output.lower()
 
+    def test_listing_does_not_import_pandas(self):
+        code = (
+            "import sys; from secimport.cli.main import main; "
+            "main(['list-parsers']); main(['list-connectors']); "
+            "sys.exit('pandas' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
 
 class TestCLIDetect:
+    def test_detect_csv_does_not_import_pandas(self, tmp_path):
+        csv_file = tmp_path / "qualys.csv"
+        csv_file.write_text("IP,DNS,QID,Title,Severity\n10.0.0.1,web01,1,T,5\n")
+        code = (
+            "import sys; from secimport.cli.main import main; "
+            f"main(['detect', {str(csv_file)!r}]); "
+            "sys.exit('pandas' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
     def test_detect_qualys(self, tmp_path, capsys):
         csv_file = tmp_path / "qualys.csv"
         csv_file.write_text("IP,DNS,QID,Title,Severity,CVSS Base\n10.0.0.1,web01,1234,Test,5,9.8\n")
@@ -40,6 +63,16 @@ class TestCLIParse:
         ret = main(["parse", str(csv_file)])
         assert ret == 0
 
+    def test_parse_chunk_size(self, tmp_path, capsys):
+        csv_file = tmp_path / "qualys.csv"
+        rows = "".join(f"10.0.0.{i},web{i},{i},Test,5,9.8\n" for i in range(5))
+        csv_file.write_text("IP,DNS,QID,Title,Severity,CVSS Base\n" + rows)
+        ret = main(["parse", str(csv_file), "--chunk-size", "2"])
+        assert ret == 0
+        out = capsys.readouterr()
+        assert len(out.out.splitlines()) == 5
+        assert "5 parsed, 0 errors" in out.err
+
     def test_parse_file_not_found(self, capsys):
         ret = main(["parse", "/nonexistent/file.csv"])
         assert ret == 1
@@ -23,6 +23,17 @@ class TestSourceConfig:
         )
         assert cfg.timeout == 60
 
+    def test_file_source(self):
+        cfg = SourceConfig(name="export", path="scan.csv")
+        assert cfg.connector is None
+        assert cfg.parser is None
+
+    def test_needs_connector_or_path(self):
+        with pytest.raises(ValueError, match="either 'path' or 'connector'"):
+            SourceConfig(name="nothing")
+        with pytest.raises(ValueError, match="either 'path' or 'connector'"):
+            SourceConfig(name="no_url", connector="qualys")
+
 
 class TestSecimportConfig:
     def test_empty(self):
@@ -30,6 +41,7 @@ class TestSecimportConfig:
         assert cfg.sources == []
         assert cfg.outputs == []
         assert cfg.enrichment.deduplicate is True
+        assert cfg.source_workers == 1
 
 
 class TestLoadConfig:
@@ -89,9 +101,11 @@ sources:
         config_file.write_text("""
 enrichment:
   deduplicate: false
+  min_merge_confidence: 0.8
   gap_sources:
     - ["crowdstrike", "qualys"]
 """)
         cfg = load_config(config_file)
         assert cfg.enrichment.deduplicate is False
+        assert cfg.enrichment.min_merge_confidence == 0.8
         assert cfg.enrichment.gap_sources == [["crowdstrike", "qualys"]]
@@ -1,13 +1,17 @@
 """Tests for connector infrastructure and scanner connector initialization."""
 
+import httpx
 import pytest
+from pydantic import ValidationError
 
 from secimport.connectors.base import (
     AuthConfig,
+    BaseConnector,
     ConnectionConfig,
     ConnectorRegistry,
     ConnectorStatus,
 )
+from secimport.connectors.pagination import PaginationMixin
 from secimport.connectors.scanners import (
     CrowdStrikeConnector,
     NessusConnector,
@@ -30,6 +34,12 @@ class TestConnectionConfig:
         assert cfg.timeout == 60
         assert cfg.verify_ssl is False
 
+    def test_frozen(self, connection_config, basic_auth):
+        with pytest.raises(ValidationError):
+            connection_config.timeout = 5
+        with pytest.raises(ValidationError):
+            basic_auth.auth_type = "token"
+
 
 class TestAuthConfig:
     def test_basic(self):
@@ -64,31 +74,48 @@ class TestAuthTypeValidation:
 class TestConnectorRegistry:
     def test_scanners_registered(self):
         registry = ConnectorRegistry.list_connectors()
-        assert "qualys" in registry
-        assert "nessus" in registry
-        assert "tenable" in registry
-        assert "rapid7" in registry
-        assert "openvas" in registry
-        assert "crowdstrike" in registry
+        expected = {"qualys", "nessus", "tenable", "rapid7", "openvas", "crowdstrike"}
+        assert expected <= registry.keys(), expected - registry.keys()
 
     def test_get_by_name(self):
         assert ConnectorRegistry.get("qualys") is QualysConnector
         assert ConnectorRegistry.get("nonexistent") is None
 
+    def test_get_agrees_with_view(self):
+        registry = ConnectorRegistry.list_connectors()
+        assert registry
+        for name, cls in registry.items():
+            assert ConnectorRegistry.get(name) is cls
+            assert cls.name == name
+
+    def test_late_registration_visible(self, monkeypatch):
+        # Plugins register after secimport.connectors is imported, so the
+        # registry must stay a live view rather than a frozen snapshot.
+        monkeypatch.setattr(ConnectorRegistry, "_connectors", dict(ConnectorRegistry._connectors))
+        view = ConnectorRegistry.list_connectors()
+
+        class _LateConnector(BaseConnector):
+            name = "late_plugin"
+
+        assert ConnectorRegistry.get("late_plugin") is _LateConnector
+        assert view["late_plugin"] is _LateConnector
+        with pytest.raises(TypeError):
+            view["other"] = _LateConnector  # type: ignore[index]
+
 
 class TestScannerConnectorInit:
     """Verify all scanner connectors can be instantiated."""
 
     @pytest.mark.parametrize(
         ("cls", "auth_fixture"),
-        [
+        (
             (QualysConnector, "basic_auth"),
             (NessusConnector, "api_key_auth"),
             (TenableConnector, "api_key_auth"),
             (Rapid7Connector, "basic_auth"),
             (OpenVASConnector, "basic_auth"),
             (CrowdStrikeConnector, "oauth2_auth"),
-        ],
+        ),
     )
     def test_init(self, cls, auth_fixture, connection_config, request):
         auth = request.getfixturevalue(auth_fixture)
@@ -98,14 +125,14 @@ class TestScannerConnectorInit:
 
     @pytest.mark.parametrize(
         "cls",
-        [
+        (
             QualysConnector,
             NessusConnector,
             TenableConnector,
             Rapid7Connector,
             OpenVASConnector,
             CrowdStrikeConnector,
-        ],
+        ),
     )
     def test_has_required_attrs(self, cls):
         assert isinstance(cls.name, str)
@@ -113,3 +140,33 @@ class TestScannerConnectorInit:
         assert isinstance(cls.description, str)
         assert isinstance(cls.auth_types, tuple)
         assert len(cls.ENDPOINTS) > 0
+
+
+class TestPagination:
+    def _client(self, pages):
+        def handler(request):
+            offset = int(request.url.params["offset"])
+            return httpx.Response(200, content=pages[offset])
+
+        return httpx.Client(transport=httpx.MockTransport(handler), base_url="https://example.com")
+
+    def test_offset_pages_decoded(self):
+        pager = PaginationMixin()
+        pager._client = self._client(
+            {
+                0: b'{"items": [{"id": 1, "host": "web01"}, {"id": 2, "host": "web02"}]}',
+                2: b'{"items": [{"id": 3, "host": "caf\\u00e9"}]}',
+            }
+        )
+        items = list(pager._paginate_offset("/v", page_size=2, results_key="items"))
+        assert items == [
+            {"id": 1, "host": "web01"},
+            {"id": 2, "host": "web02"},
+            {"id": 3, "host": "café"},
+        ]
+
+    def test_invalid_json_raises(self):
+        pager = PaginationMixin()
+        pager._client = self._client({0: b"<html>"})
+        with pytest.raises(ValueError):
+            list(pager._paginate_offset("/v"))
@@ -1,6 +1,13 @@
 """Tests for asset correlator and gap analysis."""
 
-from secimport.enrichment.correlator import AssetCorrelator
+import gc
+import sys
+
+import pytest
+
+from secimport.enrichment.correlator import AssetCorrelator, gc_paused
+from secimport.enrichment.models import CorrelationKey
+from secimport.enrichment.scoring import MatchWeights, SourceConfidence
 from secimport.models.base import (
     ParsedAsset,
     ParsedEndpoint,
@@ -11,8 +18,8 @@ from secimport.models.base import (
 
 
 def _iter(*items):
-    """Helper to make an iterator from items."""
-    return iter(items)
+    """Helper to pass items as a plain sequence; generators are tested explicitly."""
+    return items
 
 
 class TestAssetCorrelatorBasic:
@@ -29,11 +36,58 @@ class TestAssetCorrelatorBasic:
         assert count == 1
         assert c.asset_count == 1
 
-        enriched = list(c.get_enriched_assets())[0]
+        enriched = next(c.get_enriched_assets())
         assert enriched.hostname.value == "web01"
         assert enriched.ip_address.value == "10.0.0.1"
         assert "qualys" in enriched.present_in_sources
 
+    def test_source_records_match_model_dump(self):
+        asset = ParsedAsset(hostname="web01", os_version="22.04", source_system="qualys")
+        c = AssetCorrelator(keep_source_records=True)
+        c.ingest_assets(_iter(asset))
+
+        enriched = next(c.get_enriched_assets())
+        assert enriched.source_records == {"qualys": [asset.model_dump(exclude_none=True)]}
+
+    def test_source_records_off_by_default(self):
+        c = AssetCorrelator()
+        c.ingest_assets(_iter(ParsedAsset(hostname="web01", source_system="qualys")))
+        assert next(c.get_enriched_assets()).source_records is None
+
+    def test_emitted_keys_frozen(self):
+        c = AssetCorrelator()
+        c.ingest_assets(_iter(ParsedAsset(hostname="web01", source_system="qualys")))
+        enriched = next(c.get_enriched_assets())
+        assert isinstance(enriched.correlation_key.hostnames, frozenset)
+
+        # Ingesting after emission still merges into the frozen key.
+        c.ingest_endpoints(
+            _iter(
+                ParsedEndpoint(
+                    hostname="web01", ip_address="10.0.0.9", source_system="crowdstrike"
+                )
+            )
+        )
+        assert c.asset_count == 1
+        assert enriched.correlation_key.ip_addresses == {"10.0.0.9"}
+
+    def test_sources_and_identifiers_interned(self):
+        # Equal but distinct strings, as records deserialized from JSON carry.
+        source = "".join(["qua", "lys"])
+        serial = "".join(["sn-", "1"])
+        c = AssetCorrelator()
+        c.ingest_assets(
+            _iter(
+                ParsedAsset(hostname="web01", serial_number=serial, source_system=source),
+                ParsedAsset(hostname="web02", source_system="".join(["qua", "lys"])),
+            )
+        )
+        a, b = c.get_enriched_assets()
+        (a_source,) = a.present_in_sources
+        (b_source,) = b.present_in_sources
+        assert a_source is b_source is a.hostname.source_system
+        assert next(iter(a.correlation_key.serial_numbers)) is sys.intern("sn-1")
+
     def test_ingest_single_endpoint(self):
         c = AssetCorrelator()
         count = c.ingest_endpoints(
@@ -49,11 +103,46 @@ class TestAssetCorrelatorBasic:
         assert count == 1
         assert c.asset_count == 1
 
-        enriched = list(c.get_enriched_assets())[0]
+        enriched = next(c.get_enriched_assets())
         assert enriched.agent_id.value == "falcon-001"
         assert enriched.agent_status.value == "Online"
 
 
+class TestGcPaused:
+    def test_paused_inside_block_and_restored(self):
+        with gc_paused():
+            assert not gc.isenabled()
+        assert gc.isenabled()
+
+    def test_restored_on_error(self):
+        with pytest.raises(RuntimeError):
+            with gc_paused():
+                raise RuntimeError("source failed")
+        assert gc.isenabled()
+
+    def test_leaves_disabled_collector_alone(self):
+        gc.disable()
+        try:
+            with gc_paused():
+                pass
+            assert not gc.isenabled()
+        finally:
+            gc.enable()
+
+    def test_correlator_leaves_collector_alone(self):
+        seen = []
+
+        def assets():
+            seen.append(gc.isenabled())
+            yield ParsedAsset(hostname="web01", source_system="qualys")
+
+        c = AssetCorrelator()
+        c.ingest_assets(assets())
+        c.deduplicate()
+        assert seen == [True]
+        assert gc.isenabled()
+
+
 class TestCorrelationMatching:
     def test_same_hostname_correlates(self):
         c = AssetCorrelator()
@@ -72,7 +161,7 @@ class TestCorrelationMatching:
         )
         assert c.asset_count == 1  # Merged into one
 
-        enriched = list(c.get_enriched_assets())[0]
+        enriched = next(c.get_enriched_assets())
         assert "qualys" in enriched.present_in_sources
         assert "crowdstrike" in enriched.present_in_sources
         # EDR has higher confidence, so agent fields are set
@@ -90,6 +179,14 @@ class TestCorrelationMatching:
         )
         assert c.asset_count == 1
 
+    def test_repeated_identifier_indexed_once(self):
+        c = AssetCorrelator()
+        c.ingest_assets(
+            _iter(*(ParsedAsset(hostname="web01", source_system=f"src{i}") for i in range(5)))
+        )
+        assert c.asset_count == 1
+        assert list(c._hostname_idx["web01"]) == [0]
+
     def test_different_assets_not_merged(self):
         c = AssetCorrelator()
         c.ingest_assets(
@@ -101,6 +198,94 @@ class TestCorrelationMatching:
         assert c.asset_count == 2
 
 
+class TestScoringLookups:
+    def test_scores_resolved_once_per_source(self, monkeypatch):
+        calls = []
+        real_get = SourceConfidence.get.__func__
+
+        def counting_get(cls, source_system):
+            calls.append(source_system)
+            return real_get(cls, source_system)
+
+        monkeypatch.setattr(SourceConfidence, "get", classmethod(counting_get))
+        c = AssetCorrelator()
+        c.ingest_assets(
+            ParsedAsset(hostname=f"host{i}", source_system="qualys") for i in range(50)
+        )
+        c.ingest_endpoints(
+            ParsedEndpoint(hostname=f"host{i}", source_system="crowdstrike") for i in range(50)
+        )
+        assert calls == ["qualys", "crowdstrike"]
+
+
+class TestFindMatch:
+    def test_highest_weight_identifier_wins(self):
+        c = AssetCorrelator()
+        c.ingest_endpoints(
+            _iter(
+                ParsedEndpoint(hostname="ws01", agent_id="agent-1", source_system="crowdstrike"),
+                ParsedEndpoint(hostname="ws02", agent_id="agent-2", source_system="crowdstrike"),
+            )
+        )
+        match = c._find_match(c._build_key(hostname="ws01", agent_id="agent-2"))
+        assert match.matched
+        assert match.enriched_asset_index == 1
+        assert match.matched_on == ["agent_id"]
+        assert match.confidence == MatchWeights.get("agent_id")
+
+    def test_match_or_create_agrees_with_find_match(self):
+        c = AssetCorrelator()
+        c.ingest_endpoints(
+            _iter(
+                ParsedEndpoint(hostname="ws01", agent_id="agent-1", source_system="crowdstrike"),
+                ParsedEndpoint(hostname="ws02", agent_id="agent-2", source_system="crowdstrike"),
+                ParsedEndpoint(ip_address="10.0.0.5", source_system="crowdstrike"),
+            )
+        )
+        for key in (
+            c._build_key(hostname="ws01", agent_id="agent-2"),
+            c._build_key(hostname="ws02", ip_address="10.0.0.5"),
+            c._build_key(ip_address="10.0.0.5"),
+        ):
+            expected = c._find_match(key).enriched_asset_index
+            assert c._match_or_create(key, merge=False) == expected
+        assert c.asset_count == 3
+
+    def test_retuned_weights_respected(self, monkeypatch):
+        monkeypatch.setitem(MatchWeights.WEIGHTS, "ip_address", 0.999)
+        c = AssetCorrelator()
+        c.ingest_assets(
+            _iter(
+                ParsedAsset(hostname="web01", source_system="qualys"),
+                ParsedAsset(ip_address="10.0.0.9", source_system="qualys"),
+            )
+        )
+        match = c._find_match(c._build_key(hostname="web01", ip_address="10.0.0.9"))
+        assert match.enriched_asset_index == 1
+        assert match.matched_on == ["ip_address"]
+
+    def test_no_match(self):
+        c = AssetCorrelator()
+        assert not c._find_match(c._build_key(hostname="nothing")).matched
+
+    def test_match_or_create(self):
+        c = AssetCorrelator()
+        c.ingest_assets(_iter(ParsedAsset(hostname="web01", source_system="qualys")))
+        assert c._match_or_create(c._build_key(hostname="web01")) == 0
+        assert c.asset_count == 1
+        key = c._build_key(hostname="web02")
+        assert c._match_or_create(key) == 1
+        assert c.asset_count == 2
+        # New assets adopt the record's key; absent identifier types share
+        # one empty frozenset until merged.
+        assert c._assets[1].correlation_key is key
+        assert key.mac_addresses is c._build_key(ip_address="10.0.0.1").mac_addresses
+
+        c._update_indexes(1, key)
+        c._match_or_create(c._build_key(hostname="web02", mac_address="aa:bb:cc:dd:ee:ff"))
+        assert key.mac_addresses == {"aa:bb:cc:dd:ee:ff"}
+
+
 class TestMultiSourceCorrelation:
     def test_three_sources(self):
         """Simulate scanner + EDR + NDR all seeing the same host."""
@@ -148,7 +333,7 @@ class TestMultiSourceCorrelation:
 
         assert c.asset_count == 1  # All three correlated
 
-        enriched = list(c.get_enriched_assets())[0]
+        enriched = next(c.get_enriched_assets())
         assert len(enriched.present_in_sources) == 3
         assert "qualys" in enriched.present_in_sources
         assert "sentinelone" in enriched.present_in_sources
@@ -183,11 +368,74 @@ class TestVulnerabilityIngestion:
             )
         )
 
-        enriched = list(c.get_enriched_assets())[0]
+        enriched = next(c.get_enriched_assets())
         assert enriched.vulnerability_count == 3
         assert enriched.critical_vuln_count == 1
         assert enriched.high_vuln_count == 1
 
+    def test_repeated_hosts_resolve_to_same_asset(self):
+        c = AssetCorrelator()
+        c.ingest_vulnerabilities(
+            _iter(
+                *(
+                    ParsedVulnerability(
+                        title=f"Vuln {i}", severity="High",
+                        hostname=host, ip_address="10.0.0.1", source_system="qualys",
+                    )
+                    for i, host in enumerate(["web01", "web01", "WEB01", "web01"])
+                ),
+                ParsedVulnerability(
+                    title="Other", severity="Low", hostname="db01", source_system="qualys"
+                ),
+            )
+        )
+
+        assert c.asset_count == 2
+        web, db = c.get_enriched_assets()
+        assert web.vulnerability_count == 4
+        assert web.high_vuln_count == 4
+        assert db.vulnerability_count == 1
+
+    def test_matches_per_row_resolution(self):
+        # The third row creates a web01 asset, so the fourth must resolve by
+        # hostname rather than reuse the second row's match on the IP.
+        rows = [(None, "10.0.0.1"), ("web01", "10.0.0.1"), ("web01", None), ("web01", "10.0.0.1")]
+
+        def vulns():
+            for host, ip in rows:
+                yield ParsedVulnerability(
+                    title="V", severity="Low", hostname=host, ip_address=ip, source_system="q"
+                )
+
+        batched = AssetCorrelator()
+        batched.ingest_vulnerabilities(vulns())
+        per_row = AssetCorrelator()
+        for vuln in vulns():
+            per_row.ingest_vulnerabilities(_iter(vuln))
+
+        def counts(c):
+            return [a.vulnerability_count for a in c.get_enriched_assets()]
+
+        assert counts(batched) == counts(per_row) == [2, 2]
+
+    def test_counts_applied_when_input_fails(self):
+        def vulns():
+            yield ParsedVulnerability(
+                title="SQLi", severity="Critical", hostname="web01", source_system="qualys"
+            )
+            raise RuntimeError("export truncated")
+
+        c = AssetCorrelator()
+        try:
+            c.ingest_vulnerabilities(vulns())
+        except RuntimeError:
+            pass
+
+        enriched = next(c.get_enriched_assets())
+        assert enriched.vulnerability_count == 1
+        assert enriched.critical_vuln_count == 1
+        assert enriched.present_in_sources == {"qualys"}
+
 
 class TestOwnerMappings:
     def test_owner_applied(self):
@@ -207,10 +455,33 @@ class TestOwnerMappings:
             )
         )
 
-        enriched = list(c.get_enriched_assets())[0]
+        enriched = next(c.get_enriched_assets())
         assert enriched.owner_email.value == "admin@example.com"
 
 
+class TestToDataFrame:
+    def test_columns(self):
+        c = AssetCorrelator()
+        c.ingest_assets(
+            _iter(
+                ParsedAsset(hostname="web01", ip_address="10.0.0.1", source_system="qualys"),
+                ParsedAsset(hostname="db01", source_system="servicenow"),
+            )
+        )
+        df = c.to_dataframe()
+
+        assert len(df) == 2
+        assert list(df["hostname"]) == ["web01", "db01"]
+        assert list(df["hostname_source"]) == ["qualys", "servicenow"]
+        assert df["ip_address"].isna().tolist() == [False, True]
+        assert list(df["present_in_sources"]) == [["qualys"], ["servicenow"]]
+
+    def test_empty(self):
+        df = AssetCorrelator().to_dataframe()
+        assert len(df) == 0
+        assert "hostname_confidence" in df.columns
+
+
 class TestGapAnalysis:
     def test_gap_report(self):
         c = AssetCorrelator()
@@ -249,6 +520,43 @@ class TestGapAnalysis:
         assert gap.coverage_a_to_b == 1.0
         assert gap.coverage_b_to_a == 1.0
 
+    def test_follows_vulns_observations_and_dedup(self):
+        c = AssetCorrelator()
+        c.ingest_assets(
+            _iter(
+                ParsedAsset(hostname="web01", source_system="cmdb"),
+                ParsedAsset(ip_address="10.0.0.1", source_system="cmdb"),
+            )
+        )
+        c.ingest_vulnerabilities(
+            _iter(
+                ParsedVulnerability(
+                    title="T", severity="Low", hostname="web01", source_system="qualys"
+                )
+            )
+        )
+        c.ingest_network_observations(
+            _iter(ParsedNetworkObservation(ip_address="10.0.0.9", source_system="darktrace"))
+        )
+        gap = c.gap_analysis("cmdb", "qualys")
+        assert [k.hostnames for k in gap.in_both] == [{"web01"}]
+        assert [k.ip_addresses for k in gap.in_a_not_b] == [{"10.0.0.1"}]
+        assert len(c.gap_analysis("darktrace", "cmdb").in_a_not_b) == 1
+
+        # Bridge the two cmdb assets; after dedup both sources meet in one.
+        c.ingest_endpoints(
+            _iter(
+                ParsedEndpoint(
+                    hostname="web01", ip_address="10.0.0.1", source_system="crowdstrike"
+                )
+            )
+        )
+        assert c.deduplicate() == 1
+        gap = c.gap_analysis("cmdb", "qualys")
+        assert len(gap.in_both) == 1
+        assert gap.in_a_not_b == []
+        assert c.gap_analysis("nope", "cmdb").total_b == 1
+
 
 class TestDeduplication:
     def test_deduplicate_merges(self):
@@ -286,3 +594,203 @@ class TestDeduplication:
         merges = c.deduplicate()
         assert merges >= 1
         assert c.asset_count < 4  # Should have merged some
+
+    def test_deduplicate_collapses_chains(self):
+        c = AssetCorrelator()
+        c.ingest_assets(
+            _iter(
+                ParsedAsset(hostname="web01", source_system="qualys"),
+                ParsedAsset(hostname="web02", ip_address="10.0.0.2", source_system="nessus"),
+                ParsedAsset(
+                    hostname="web03", mac_address="AA:BB:CC:DD:EE:FF", source_system="rapid7"
+                ),
+            )
+        )
+        # Each endpoint matches one asset but carries an identifier of another,
+        # linking web01 -> web02 -> web03.
+        c.ingest_endpoints(
+            _iter(
+                ParsedEndpoint(
+                    hostname="web01", ip_address="10.0.0.2", source_system="crowdstrike"
+                ),
+                ParsedEndpoint(
+                    hostname="web02", mac_address="AA:BB:CC:DD:EE:FF", source_system="sentinelone"
+                ),
+            )
+        )
+        assert c.asset_count == 3
+
+        assert c.deduplicate() == 2
+        assert c.asset_count == 1
+
+        enriched = next(c.get_enriched_assets())
+        assert enriched.present_in_sources == {
+            "qualys", "nessus", "rapid7", "crowdstrike", "sentinelone"
+        }
+        assert enriched.correlation_key.hostnames == {"web01", "web02", "web03"}
+
+    def test_split_brain_joins_best_match_then_dedup(self):
+        c = AssetCorrelator()
+        c.ingest_assets(
+            _iter(
+                ParsedAsset(hostname="web01", source_system="qualys"),
+                ParsedAsset(serial_number="SN-9", source_system="qualys"),
+            )
+        )
+        c.ingest_endpoints(
+            _iter(
+                ParsedEndpoint(
+                    hostname="web01", serial_number="SN-9", source_system="crowdstrike"
+                ),
+            )
+        )
+        # The bridging record joins the serial-number match (higher weight).
+        assert c.asset_count == 2
+        assert list(c._hostname_idx["web01"]) == [0, 1]
+        assert c.deduplicate() == 1
+        assert c.asset_count == 1
+
+    def test_deduplicate_sums_vuln_counters(self):
+        c = AssetCorrelator()
+        c.ingest_assets(
+            _iter(
+                ParsedAsset(hostname="web01", source_system="qualys"),
+                ParsedAsset(ip_address="10.0.0.1", source_system="qualys"),
+            )
+        )
+        c.ingest_vulnerabilities(
+            _iter(
+                ParsedVulnerability(
+                    title="A", severity="Critical", hostname="web01", source_system="qualys"
+                ),
+                ParsedVulnerability(
+                    title="B", severity="High", ip_address="10.0.0.1", source_system="qualys"
+                ),
+                ParsedVulnerability(
+                    title="C", severity="Low", ip_address="10.0.0.1", source_system="qualys"
+                ),
+            )
+        )
+        c.ingest_endpoints(
+            _iter(
+                ParsedEndpoint(
+                    hostname="web01", ip_address="10.0.0.1", source_system="crowdstrike"
+                ),
+            )
+        )
+        assert c.deduplicate() == 1
+        (merged,) = c.get_enriched_assets()
+        assert merged.vulnerability_count == 3
+        assert merged.critical_vuln_count == 1
+        assert merged.high_vuln_count == 1
+
+    def test_deduplicate_no_overlap(self):
+        c = AssetCorrelator()
+        c.ingest_assets(
+            _iter(
+                ParsedAsset(hostname="web01", source_system="qualys"),
+                ParsedAsset(hostname="web02", source_system="qualys"),
+            )
+        )
+        assert c.deduplicate() == 0
+        assert c.asset_count == 2
+
+    def test_match_indexes_matched_asset(self):
+        c = AssetCorrelator()
+        c.ingest_assets(
+            _iter(
+                ParsedAsset(hostname="web01", source_system="qualys"),
+                ParsedAsset(hostname="web02", source_system="qualys"),
+            )
+        )
+        c.ingest_endpoints(
+            _iter(
+                ParsedEndpoint(
+                    hostname="web01", mac_address="AA:BB:CC:DD:EE:FF", source_system="crowdstrike"
+                ),
+            )
+        )
+        assert list(c._mac_idx["aa:bb:cc:dd:ee:ff"]) == [0]
+        assert c.deduplicate() == 0
+
+    def test_deduplicate_sweeps_and_reindexes(self):
+        c = AssetCorrelator()
+        c.ingest_assets(
+            _iter(
+                ParsedAsset(hostname="web01", source_system="qualys"),
+                ParsedAsset(ip_address="10.0.0.2", source_system="qualys"),
+                ParsedAsset(hostname="db01", source_system="qualys"),
+                ParsedAsset(hostname="app01", source_system="qualys"),
+            )
+        )
+        c.ingest_endpoints(
+            _iter(
+                ParsedEndpoint(
+                    hostname="web01", ip_address="10.0.0.2", source_system="crowdstrike"
+                ),
+            )
+        )
+
+        assert c.deduplicate() == 1
+        hostnames = [a.hostname.value for a in c.get_enriched_assets()]
+        assert hostnames == ["web01", "db01", "app01"]
+        # Indexes point at the compacted positions.
+        assert list(c._hostname_idx["db01"]) == [1]
+        assert list(c._hostname_idx["app01"]) == [2]
+        assert list(c._ip_idx["10.0.0.2"]) == [0]
+
+    def test_correlation_never_compares_keys_pairwise(self, monkeypatch):
+        def fail(self, other):
+            raise AssertionError("pairwise key comparison")
+
+        monkeypatch.setattr(CorrelationKey, "overlaps", fail)
+        c = AssetCorrelator()
+        c.ingest_assets(
+            ParsedAsset(hostname=f"host{i:03d}", source_system="qualys") for i in range(200)
+        )
+        c.ingest_endpoints(
+            ParsedEndpoint(hostname=f"host{i:03d}", source_system="crowdstrike")
+            for i in range(0, 200, 2)
+        )
+        assert c.asset_count == 200
+        assert c.deduplicate() == 0
+
+
+class TestMinMergeConfidence:
+    def _ip_only_pair(self, c: AssetCorrelator) -> None:
+        c.ingest_assets(
+            _iter(
+                ParsedAsset(hostname="web01", ip_address="10.0.0.1", source_system="qualys"),
+                ParsedAsset(ip_address="10.0.0.1", source_system="darktrace"),
+            )
+        )
+
+    def test_default_merges_on_ip(self):
+        c = AssetCorrelator()
+        self._ip_only_pair(c)
+        assert c.asset_count == 1
+
+    def test_low_weight_match_creates_new_asset(self):
+        c = AssetCorrelator(min_merge_confidence=0.8)
+        self._ip_only_pair(c)
+        assert c.asset_count == 2
+        # The identifier is still indexed for lookups.
+        assert c._find_match(CorrelationKey(ip_addresses={"10.0.0.1"})).matched
+
+    def test_strong_match_still_merges(self):
+        c = AssetCorrelator(min_merge_confidence=0.8)
+        c.ingest_assets(_iter(ParsedAsset(hostname="web01", source_system="qualys")))
+        c.ingest_endpoints(
+            _iter(
+                ParsedEndpoint(
+                    hostname="web01", ip_address="10.0.0.1", source_system="crowdstrike"
+                )
+            )
+        )
+        assert c.asset_count == 1
+
+    def test_deduplicate_ignores_low_weight_links(self):
+        c = AssetCorrelator(min_merge_confidence=0.8)
+        self._ip_only_pair(c)
+        assert c.deduplicate() == 0
+        assert c.asset_count == 2
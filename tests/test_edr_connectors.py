@@ -13,7 +13,7 @@ from secimport.connectors.edr import (
     TrendMicroConnector,
 )
 
-ALL_EDR = [
+ALL_EDR = (
     CrowdStrikeFalconConnector,
     DefenderForEndpointConnector,
     SentinelOneConnector,
@@ -21,13 +21,13 @@ ALL_EDR = [
     SymantecEndpointConnector,
     TrellixConnector,
     TrendMicroConnector,
-]
+)
 
 
 class TestEDRRegistry:
     def test_all_edr_registered(self):
         registry = ConnectorRegistry.list_connectors()
-        expected = [
+        expected = {
             "crowdstrike_falcon",
             "defender_endpoint",
             "sentinelone",
@@ -35,9 +35,8 @@ class TestEDRRegistry:
             "symantec_endpoint",
             "trellix",
             "trend_micro",
-        ]
-        for name in expected:
-            assert name in registry, f"{name} not in registry"
+        }
+        assert expected <= registry.keys(), expected - registry.keys()
 
     def test_get_by_name(self):
         assert ConnectorRegistry.get("crowdstrike_falcon") is CrowdStrikeFalconConnector
@@ -57,7 +56,7 @@ class TestEDRConnectorAttrs:
 class TestEDRConnectorInit:
     @pytest.mark.parametrize(
         ("cls", "auth_fixture"),
-        [
+        (
             (CrowdStrikeFalconConnector, "oauth2_auth"),
             (DefenderForEndpointConnector, "oauth2_auth"),
             (SentinelOneConnector, "api_key_auth"),
@@ -65,7 +64,7 @@ class TestEDRConnectorInit:
             (SymantecEndpointConnector, "basic_auth"),
             (TrellixConnector, "api_key_auth"),
             (TrendMicroConnector, "api_key_auth"),
-        ],
+        ),
     )
     def test_init(self, cls, auth_fixture, connection_config, request):
         auth = request.getfixturevalue(auth_fixture)
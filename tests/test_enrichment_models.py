@@ -1,6 +1,12 @@
 """Tests for enrichment data models."""
 
+import json
+
+import pytest
+from pydantic import ValidationError
+
 from secimport.enrichment.models import (
+    PROVENANCE_FIELDS,
     CorrelationKey,
     EnrichedAsset,
     FieldProvenance,
@@ -19,6 +25,28 @@ class TestFieldProvenance:
         fp = FieldProvenance(value="host01", source_system="ndr", confidence=0.6)
         assert fp.confidence == 0.6
 
+    @pytest.mark.parametrize("confidence", [-0.1, 7])
+    def test_confidence_bounded_when_validated(self, confidence):
+        with pytest.raises(ValidationError):
+            EnrichedAsset(
+                hostname={"value": "web01", "source_system": "qualys", "confidence": confidence}
+            )
+
+    def test_frozen(self):
+        fp = FieldProvenance(value="host01", source_system="ndr")
+        with pytest.raises(AttributeError):
+            fp.value = "host02"
+
+    def test_dumped_with_asset(self):
+        asset = EnrichedAsset()
+        asset.set_field("hostname", "web01", "qualys", confidence=0.9)
+        dumped = asset.model_dump(exclude_none=True)
+        assert dumped["hostname"] == {
+            "value": "web01",
+            "source_system": "qualys",
+            "confidence": 0.9,
+        }
+
 
 class TestCorrelationKey:
     def test_empty(self):
@@ -29,6 +57,16 @@ class TestCorrelationKey:
         key = CorrelationKey(hostnames={"web01"})
         assert not key.is_empty()
 
+    def test_slotted(self):
+        key = CorrelationKey(hostnames={"web01"})
+        assert not hasattr(key, "__dict__")
+        with pytest.raises(AttributeError):
+            key.hostname = "web01"
+
+    def test_validated_from_dict(self):
+        asset = EnrichedAsset.model_validate({"correlation_key": {"hostnames": ["web01"]}})
+        assert asset.correlation_key == CorrelationKey(hostnames={"web01"})
+
     def test_overlaps_hostname(self):
         a = CorrelationKey(hostnames={"web01"}, ip_addresses={"10.0.0.1"})
         b = CorrelationKey(hostnames={"web01"}, ip_addresses={"10.0.0.2"})
@@ -44,6 +82,23 @@ class TestCorrelationKey:
         b = CorrelationKey(agent_ids={"falcon-001"}, hostnames={"other"})
         assert a.overlaps(b)
 
+    def test_overlap_with_empty_key(self):
+        a = CorrelationKey(ip_addresses={"10.0.0.1", "10.0.0.2", "10.0.0.3"})
+        assert not a.overlaps(CorrelationKey())
+        assert not CorrelationKey().overlaps(a)
+        assert a.overlaps(CorrelationKey(ip_addresses={"10.0.0.3"}))
+
+    @pytest.mark.parametrize(
+        "field",
+        ("hostnames", "ip_addresses", "mac_addresses", "serial_numbers", "agent_ids"),
+    )
+    def test_overlaps_each_identifier(self, field):
+        a = CorrelationKey(**{field: {"x", "y"}})
+        b = CorrelationKey(**{field: {"y"}})
+        other = CorrelationKey(**{field: {"z"}})
+        assert a.overlaps(b) and b.overlaps(a)
+        assert not a.overlaps(other) and not b.overlaps(other)
+
     def test_merge(self):
         a = CorrelationKey(hostnames={"web01"}, ip_addresses={"10.0.0.1"})
         b = CorrelationKey(hostnames={"web01.local"}, mac_addresses={"aa:bb:cc:dd:ee:ff"})
@@ -53,6 +108,67 @@ class TestCorrelationKey:
         assert "aa:bb:cc:dd:ee:ff" in a.mac_addresses
         assert "10.0.0.1" in a.ip_addresses
 
+    @pytest.mark.parametrize(
+        "key",
+        (
+            CorrelationKey(hostnames={"web01"}, ip_addresses=["10.0.0.1"]),
+            CorrelationKey.from_identifiers(hostname="web01", agent_id="falcon-001"),
+            CorrelationKey.from_host_ip("web01", None),
+            CorrelationKey(),
+        ),
+    )
+    def test_identifier_sets_are_always_frozen(self, key):
+        for name in ("hostnames", "ip_addresses", "mac_addresses", "serial_numbers", "agent_ids"):
+            assert type(getattr(key, name)) is frozenset
+        key.merge(CorrelationKey(mac_addresses={"aa:bb:cc:dd:ee:ff"}))
+        assert key.mac_addresses == {"aa:bb:cc:dd:ee:ff"}
+        assert type(key.mac_addresses) is frozenset
+
+    def test_merge_does_not_change_shared_sets(self):
+        record = CorrelationKey.from_host_ip("web01", None)
+        other = CorrelationKey.from_host_ip("web02", None)
+        shared = record.hostnames
+        record.merge(CorrelationKey(hostnames={"web01.local"}))
+        assert shared == {"web01"}
+        assert other.ip_addresses == frozenset()
+
+    def test_key_stays_unhashable(self):
+        # Keys keep merging, so they must not be hashable.
+        with pytest.raises(TypeError):
+            hash(CorrelationKey(hostnames={"web01"}))
+
+    def test_key_dumps_as_sets(self):
+        asset = EnrichedAsset(correlation_key=CorrelationKey(hostnames={"web01"}))
+        dumped = asset.model_dump()["correlation_key"]
+        assert dumped["hostnames"] == {"web01"}
+        assert type(dumped["hostnames"]) is set
+        assert type(asset.correlation_key.hostnames) is frozenset
+
+    def test_from_identifiers(self):
+        key = CorrelationKey.from_identifiers(
+            hostname="WEB01.local",
+            ip_address=" 10.0.0.1 ",
+            mac_address="AA-BB-CC-DD-EE-FF",
+            serial_number=" SN123 ",
+            agent_id="  ",
+        )
+        assert key == CorrelationKey(
+            hostnames={"web01"},
+            ip_addresses={"10.0.0.1"},
+            mac_addresses={"aa:bb:cc:dd:ee:ff"},
+            serial_numbers={"sn123"},
+        )
+
+    def test_from_host_ip(self):
+        key = CorrelationKey.from_host_ip("WEB01", "not-an-ip")
+        assert key.hostnames == {"web01"}
+        assert key.ip_addresses == set()
+        assert CorrelationKey.from_host_ip(None, None).is_empty()
+
+    def test_normalized_once(self):
+        key = CorrelationKey.from_identifiers(hostname="WEB01.local.corp")
+        assert key.hostnames == {"web01.local"}
+
 
 class TestMatchResult:
     def test_no_match(self):
@@ -92,6 +208,90 @@ class TestEnrichedAsset:
         asset.set_field("hostname", None, "qualys", confidence=1.0)
         assert asset.hostname is None
 
+    def test_losing_updates_keep_existing_provenance(self):
+        asset = EnrichedAsset()
+        asset.set_field("hostname", "web01", "crowdstrike", confidence=0.9)
+        winner = asset.hostname
+        asset.set_field("hostname", "web-01", "siem", confidence=0.5)
+        asset.set_field("hostname", "web-01", "cmdb", confidence=0.9)  # ties keep the first
+        asset.set_field("hostname", None, "edr", confidence=1.0)
+        asset.merge_parsed("qualys", 0.9, {"hostname": "web-01"})
+        assert asset.hostname is winner
+
+    def test_merge_parsed(self):
+        asset = EnrichedAsset()
+        asset.set_field("hostname", "web01", "crowdstrike", confidence=0.95)
+        asset.merge_parsed(
+            "qualys",
+            0.8,
+            {"hostname": "web-01", "ip_address": "10.0.0.1", "owner_email": None},
+        )
+        assert asset.hostname.value == "web01"
+        assert asset.ip_address.value == "10.0.0.1"
+        assert asset.ip_address.source_system == "qualys"
+        assert asset.ip_address.confidence == 0.8
+        assert asset.owner_email is None
+
+    def test_add_source_records(self):
+        asset = EnrichedAsset()
+        assert asset.source_records is None
+        asset.add_source_records("qualys", [{"hostname": "web01"}])
+        asset.add_source_records("qualys", [{"hostname": "web01b"}])
+        assert asset.source_records == {"qualys": [{"hostname": "web01"}, {"hostname": "web01b"}]}
+
+    def test_exclude_unset_keeps_only_set_fields(self):
+        asset = EnrichedAsset()
+        asset.set_field("hostname", "web01", "qualys")
+        asset.merge_parsed("cmdb", 0.8, {"ip_address": "10.0.0.1", "location": None})
+        assert asset.model_fields_set == {"hostname", "ip_address"}
+        assert set(asset.model_dump(exclude_unset=True)) == {"hostname", "ip_address"}
+
+    def test_json_schema_lists_provenance_fields(self):
+        for mode in ("validation", "serialization"):
+            properties = EnrichedAsset.model_json_schema(mode=mode)["properties"]
+            assert set(PROVENANCE_FIELDS) <= set(properties)
+            assert "provenance" not in properties
+
+    def test_flat_keywords_and_dump_round_trip(self):
+        asset = EnrichedAsset(
+            hostname=FieldProvenance(value="web01", source_system="qualys"),
+            os_version={"value": "22.04", "source_system": "cmdb", "confidence": 0.85},
+        )
+        assert asset.os_version.source_system == "cmdb"
+
+        dumped = asset.model_dump()
+        assert "provenance" not in dumped
+        assert list(dumped)[:3] == ["correlation_key", "hostname", "ip_address"]
+        assert dumped["ip_address"] is None
+        assert "ip_address" not in asset.model_dump(exclude_none=True)
+        assert EnrichedAsset.model_validate(dumped) == asset
+        assert asset.model_dump(mode="json")["hostname"]["value"] == "web01"
+
+    def test_dump_include_exclude_use_flat_names(self):
+        asset = EnrichedAsset(
+            hostname=FieldProvenance(value="web01", source_system="qualys"),
+            vulnerability_count=2,
+        )
+        assert asset.model_dump(include={"hostname", "vulnerability_count"}) == {
+            "hostname": asset.model_dump()["hostname"],
+            "vulnerability_count": 2,
+        }
+        assert asset.model_dump(include={"hostname": {"value"}}) == {"hostname": {"value": "web01"}}
+        assert asset.model_dump(include={"ip_address"}) == {"ip_address": None}
+        assert "hostname" not in asset.model_dump(exclude={"hostname"})
+        assert "timestamp" not in asset.model_dump(exclude={"hostname": {"timestamp"}})["hostname"]
+        assert json.loads(asset.model_dump_json(include={"hostname"})) == {
+            "hostname": asset.model_dump(mode="json")["hostname"]
+        }
+
+    def test_model_copy_update(self):
+        asset = EnrichedAsset(hostname=FieldProvenance(value="web01", source_system="qualys"))
+        ip = FieldProvenance(value="10.0.0.1", source_system="cmdb")
+        updated = asset.model_copy(update={"ip_address": ip, "vulnerability_count": 3})
+        assert updated.ip_address is ip
+        assert updated.vulnerability_count == 3
+        assert asset.ip_address is None
+
 
 class TestGapReport:
     def test_basic(self):
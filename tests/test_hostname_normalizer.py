@@ -21,6 +21,13 @@ class TestNormalizeHostname:
     def test_strip_internal_suffix(self):
         assert normalize_hostname("db01.internal") == "db01"
 
+    def test_strip_longest_overlapping_suffix(self):
+        assert normalize_hostname("db01.localdomain") == "db01"
+        assert normalize_hostname("db01.domain") == "db01"
+
+    def test_strip_only_one_suffix(self):
+        assert normalize_hostname("WEB01.Corp.LOCAL") == "web01.corp"
+
     def test_no_strip_domain(self):
         assert normalize_hostname("app01.prod.example.com", strip_domain=False) == (
             "app01.prod.example.com"
@@ -33,6 +40,13 @@ class TestNormalizeHostname:
         assert normalize_hostname("") is None
         assert normalize_hostname("   ") is None
 
+    def test_interned(self):
+        assert normalize_hostname(" WEB01.local") is normalize_hostname("web01")
+
+    def test_strip_domain_not_shared_in_cache(self):
+        assert normalize_hostname("web02.local") == "web02"
+        assert normalize_hostname("web02.local", strip_domain=False) == "web02.local"
+
 
 class TestNormalizeIP:
     def test_ipv4(self):
@@ -54,6 +68,34 @@ class TestNormalizeIP:
     def test_empty(self):
         assert normalize_ip("") is None
 
+    def test_unencodable_rejected(self):
+        assert normalize_ip("10.0.0.1\x00") is None
+        assert normalize_ip("10.0.0.\udc80") is None
+        assert normalize_ip("fe80::\udc80") is None
+
+    def test_ipv4_leading_zeros_rejected(self):
+        assert normalize_ip("010.0.0.1") is None
+        assert normalize_ip("1.2.3") is None
+
+    def test_ipv6_forms_match_ipaddress(self):
+        assert normalize_ip("::ffff:192.168.1.1") == "::ffff:c0a8:101"
+        assert normalize_ip("FE80::1%eth0") == "fe80::1%eth0"
+
+    def test_repeated_value_same_object(self):
+        assert normalize_ip(" 10.0.0.7") is normalize_ip("10.0.0.7 ")
+        assert normalize_ip("not-an-ip") is None
+
+    def test_repeats_and_blanks_skip_parsing(self):
+        from secimport.normalizers.hostname import _canonical_ip
+
+        normalize_ip("10.0.0.8")
+        before = _canonical_ip.cache_info()
+        for value in ("10.0.0.8", " 10.0.0.8 ", None, "", "   "):
+            normalize_ip(value)
+        after = _canonical_ip.cache_info()
+        assert after.misses == before.misses
+        assert after.hits == before.hits + 2
+
 
 class TestNormalizeMAC:
     def test_colon_separated(self):
@@ -77,8 +119,15 @@ class TestNormalizeMAC:
     def test_invalid_chars(self):
         assert normalize_mac("GG:HH:II:JJ:KK:LL") is None
 
+    def test_inner_whitespace_rejected(self):
+        assert normalize_mac("AA BB CC DD EE FF") is None
+        assert normalize_mac("aa:bb:cc:dd:ee:f ") is None
+
     def test_none(self):
         assert normalize_mac(None) is None
 
     def test_empty(self):
         assert normalize_mac("") is None
+
+    def test_interned(self):
+        assert normalize_mac("AA-BB-CC-DD-EE-FF") is normalize_mac("aabb.ccdd.eeff")
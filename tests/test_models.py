@@ -104,6 +104,25 @@ class TestSourceMetadata:
         asset = ParsedAsset(hostname="srv01", source_system="cmdb")
         assert asset.source_system == "cmdb"
 
+    @pytest.mark.parametrize(
+        "model",
+        (
+            ParsedVulnerability,
+            ParsedAsset,
+            ParsedOwnerMapping,
+            ParsedEndpoint,
+            ParsedUser,
+            ParsedGroup,
+            ParsedNetworkObservation,
+        ),
+    )
+    def test_constraints_stay_in_core(self, model):
+        # Range checks are Field(ge=..., le=...) constraints that pydantic-core
+        # enforces natively; Python-level validators would slow every record.
+        decorators = model.__pydantic_decorators__
+        assert not decorators.field_validators
+        assert not decorators.model_validators
+
 
 class TestParsedEndpoint:
     def test_minimal(self):
@@ -226,3 +245,24 @@ class TestParseResult:
         assert result.skipped_count == 5
         assert result.duration_seconds == 1.23
         assert result.parser_name == "NessusParser"
+
+
+@pytest.mark.parametrize(
+    "model",
+    (
+        ParsedAsset,
+        ParsedEndpoint,
+        ParsedGroup,
+        ParsedNetworkObservation,
+        ParsedOwnerMapping,
+        ParsedUser,
+        ParsedVulnerability,
+        ParseResult,
+        SourceMetadata,
+    ),
+)
+def test_models_built_at_import(model):
+    # Pydantic builds validators at class creation unless a model defers it;
+    # a deferred build would land on the first parsed row instead.
+    assert model.__pydantic_complete__
+    assert model.model_config.get("defer_build") is not True
@@ -2,40 +2,50 @@
 
 import pytest
 
-from secimport.normalizers import normalize_severity
+from secimport.normalizers import (
+    SEVERITY_MAPPINGS,
+    invalidate_severity_tables,
+    normalize_severity,
+    register_severity_mapping,
+    severity_normalizer,
+)
 
 
 class TestNormalizeSeverity:
-    @pytest.mark.parametrize(
-        ("value", "scanner", "expected"),
-        [
-            # Qualys numeric
-            ("5", "qualys", "Critical"),
-            ("4", "qualys", "High"),
-            ("3", "qualys", "Medium"),
-            ("2", "qualys", "Low"),
-            ("1", "qualys", "Low"),
-            # Nessus text
-            ("Critical", "nessus", "Critical"),
-            ("High", "nessus", "High"),
-            ("Medium", "nessus", "Medium"),
-            ("Low", "nessus", "Low"),
-            ("Info", "nessus", "Low"),
-            # Tenable
-            ("Informational", "tenable", "Low"),
-            # Rapid7
-            ("Severe", "rapid7", "Critical"),
-            ("Moderate", "rapid7", "Medium"),
-            # OpenVAS
-            ("High", "openvas", "Critical"),
-            ("Log", "openvas", "Low"),
-            # Generic fallback
-            ("critical", "generic", "Critical"),
-            ("HIGH", "generic", "High"),
-        ],
+    MAPPINGS = (
+        # Qualys numeric
+        ("5", "qualys", "Critical"),
+        ("4", "qualys", "High"),
+        ("3", "qualys", "Medium"),
+        ("2", "qualys", "Low"),
+        ("1", "qualys", "Low"),
+        # Nessus text
+        ("Critical", "nessus", "Critical"),
+        ("High", "nessus", "High"),
+        ("Medium", "nessus", "Medium"),
+        ("Low", "nessus", "Low"),
+        ("Info", "nessus", "Low"),
+        # Tenable
+        ("Informational", "tenable", "Low"),
+        # Rapid7
+        ("Severe", "rapid7", "Critical"),
+        ("Moderate", "rapid7", "Medium"),
+        # OpenVAS
+        ("High", "openvas", "Critical"),
+        ("Log", "openvas", "Low"),
+        # Generic fallback
+        ("critical", "generic", "Critical"),
+        ("HIGH", "generic", "High"),
     )
-    def test_mappings(self, value: str, scanner: str, expected: str):
-        assert normalize_severity(value, scanner) == expected
+
+    def test_mappings(self):
+        # One item for the whole table; every mismatch is reported at once.
+        mismatches = [
+            (value, scanner, expected, actual)
+            for value, scanner, expected in self.MAPPINGS
+            if (actual := normalize_severity(value, scanner)) != expected
+        ]
+        assert mismatches == []
 
     def test_none_returns_low(self):
         assert normalize_severity(None) == "Low"
@@ -52,3 +62,45 @@ class TestNormalizeSeverity:
     def test_case_insensitive(self):
         assert normalize_severity("critical", "nessus") == "Critical"
         assert normalize_severity("HIGH", "rapid7") == "High"
+
+    def test_scanner_name_case_insensitive(self):
+        assert normalize_severity(" severe ", "Rapid7") == "Critical"
+
+
+class TestSeverityNormalizer:
+    def test_cached_per_scanner(self):
+        assert severity_normalizer("qualys") is severity_normalizer("qualys")
+
+    @pytest.mark.parametrize("value", ("5", "Critical", " critical ", "Bogus", 4, None, ""))
+    def test_matches_normalize_severity(self, value):
+        for scanner in ("qualys", "nessus", "openvas", "generic", "unknown"):
+            assert severity_normalizer(scanner)(value) == normalize_severity(value, scanner)
+
+    @pytest.fixture
+    def restore_mappings(self):
+        saved = {scanner: dict(mapping) for scanner, mapping in SEVERITY_MAPPINGS.items()}
+        yield
+        SEVERITY_MAPPINGS.clear()
+        SEVERITY_MAPPINGS.update(saved)
+        invalidate_severity_tables()
+
+    def test_registered_mapping_applies(self, restore_mappings):
+        acme = severity_normalizer("acme")
+        assert acme("P1") == "Low"
+        register_severity_mapping("ACME", {"P1": "Critical"})
+        assert acme("P1") == "Critical"
+        assert normalize_severity("p1", "acme") == "Critical"
+
+    def test_in_place_edits_apply_after_invalidate(self, restore_mappings):
+        generic = severity_normalizer("generic")
+        assert generic("urgent") == "Low"
+        SEVERITY_MAPPINGS["generic"]["Urgent"] = "Critical"
+        invalidate_severity_tables()
+        assert generic("urgent") == "Critical"
+
+    def test_first_case_insensitive_match_wins(self, restore_mappings):
+        register_severity_mapping("acme", {"High": "Critical", "HIGH": "Low"})
+        assert normalize_severity("high", "acme") == "Critical"
+
+    def test_cache_is_bounded(self):
+        assert severity_normalizer.cache_info().maxsize is not None
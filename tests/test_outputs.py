@@ -1,23 +1,55 @@
 """Tests for output sinks."""
 
 import csv
+import io
 import json
+import sys
+from datetime import datetime
 
-from secimport.outputs import CSVOutput, JSONOutput, OutputRegistry, StdoutOutput
+import httpx
+import pytest
+
+from secimport.enrichment.models import EnrichedAsset
+from secimport.outputs import (
+    CSVOutput,
+    JSONOutput,
+    OutputRegistry,
+    StdoutOutput,
+    WebhookOutput,
+)
+from secimport.outputs import base as outputs_base
+from secimport.outputs.base import dumps_json
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run a test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "orjson":
+        if outputs_base.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(outputs_base, "orjson", None)
+    return request.param
 
 
 class TestOutputRegistry:
     def test_outputs_registered(self):
         registry = OutputRegistry.list_outputs()
-        assert "json" in registry
-        assert "csv" in registry
-        assert "stdout" in registry
-        assert "webhook" in registry
+        expected = {"json", "csv", "stdout", "webhook"}
+        assert expected <= registry.keys(), expected - registry.keys()
 
     def test_get_by_type(self):
         assert OutputRegistry.get("json") is JSONOutput
         assert OutputRegistry.get("nonexistent") is None
 
+    def test_list_outputs_is_live_view(self, monkeypatch):
+        monkeypatch.setattr(OutputRegistry, "_registry", dict(OutputRegistry._registry))
+        view = OutputRegistry.list_outputs()
+        OutputRegistry.register("late_sink", StdoutOutput)
+        assert view["late_sink"] is StdoutOutput
+        with pytest.raises(TypeError):
+            view["other"] = StdoutOutput  # type: ignore[index]
+
 
 class TestJSONOutput:
     def test_write(self, tmp_path):
@@ -26,7 +58,7 @@ class TestJSONOutput:
         count = output.write(iter([{"hostname": "web01"}, {"hostname": "web02"}]))
         assert count == 2
 
-        data = json.loads(out_file.read_text())
+        data = json.loads(out_file.read_bytes())
         assert len(data) == 2
         assert data[0]["hostname"] == "web01"
 
@@ -35,6 +67,75 @@ class TestJSONOutput:
         output = JSONOutput(path=str(out_file))
         count = output.write(iter([]))
         assert count == 0
+        assert json.loads(out_file.read_bytes()) == []
+
+    def test_write_streams_iterator(self, tmp_path, json_backend):
+        out_file = tmp_path / "out.json"
+        records = ({"hostname": f"web{i:02d}", "nested": {"n": i}} for i in range(3))
+        assert JSONOutput(path=str(out_file)).write(records) == 3
+        data = json.loads(out_file.read_bytes())
+        assert [d["nested"]["n"] for d in data] == [0, 1, 2]
+
+    def test_write_compact_by_default(self, tmp_path, json_backend):
+        out_file = tmp_path / "out.json"
+        JSONOutput(path=str(out_file)).write(iter([{"a": 1}, {"a": 2}]))
+        assert out_file.read_bytes() == b'[\n{"a":1},\n{"a":2}\n]'
+
+    def test_write_pretty(self, tmp_path):
+        out_file = tmp_path / "out.json"
+        JSONOutput(path=str(out_file), pretty=True).write(iter([{"a": 1}]))
+        assert out_file.read_text() == '[\n{\n  "a": 1\n}\n]'
+
+    def test_creates_parent_once(self, tmp_path):
+        out_file = tmp_path / "nested" / "dir" / "out.json"
+        output = JSONOutput(path=str(out_file))
+        assert out_file.parent.is_dir()
+        assert output.write(iter([{"a": 1}])) == 1
+        assert output.write(iter([{"a": 2}])) == 1
+        assert json.loads(out_file.read_bytes()) == [{"a": 2}]
+
+    def test_write_jsonl(self, tmp_path):
+        out_file = tmp_path / "out.jsonl"
+        output = JSONOutput(path=str(out_file), jsonl=True)
+        assert output.write(iter([{"hostname": "web01"}, {"hostname": "web02"}])) == 2
+        lines = out_file.read_text().splitlines()
+        assert [json.loads(line)["hostname"] for line in lines] == ["web01", "web02"]
+
+    @pytest.mark.parametrize(
+        ("name", "jsonl", "expected"),
+        (
+            ("out.jsonl", None, True),
+            ("OUT.NDJSON", None, True),
+            ("out.json", None, False),
+            ("out.jsonl", False, False),
+            ("out.json", True, True),
+        ),
+    )
+    def test_jsonl_from_suffix(self, tmp_path, name, jsonl, expected):
+        output = JSONOutput(path=str(tmp_path / name), jsonl=jsonl)
+        assert output.jsonl is expected
+
+
+class TestDumpsJson:
+    def test_backends_agree(self, json_backend):
+        record = {
+            "hostname": "café",
+            "sources": {"qualys"},
+            "seen": datetime(2024, 1, 15, 10, 0),
+            1: "int key",
+        }
+        assert json.loads(dumps_json(record)) == {
+            "hostname": "café",
+            "sources": "{'qualys'}",
+            "seen": "2024-01-15 10:00:00",
+            "1": "int key",
+        }
+
+    def test_indent(self, json_backend):
+        assert dumps_json({"a": 1}, indent=True) == b'{\n  "a": 1\n}'
+
+    def test_compact(self, json_backend):
+        assert dumps_json({"a": 1, "b": [1, 2]}) == b'{"a":1,"b":[1,2]}'
 
 
 class TestCSVOutput:
@@ -49,11 +150,10 @@ class TestCSVOutput:
         )
         assert count == 2
 
-        with out_file.open() as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-        assert len(rows) == 2
-        assert rows[0]["hostname"] == "web01"
+        with out_file.open(newline="") as f:
+            header, *rows = csv.reader(f)
+        assert header == ["hostname", "ip"]
+        assert rows == [["web01", "10.0.0.1"], ["web02", "10.0.0.2"]]
 
     def test_write_empty(self, tmp_path):
         out_file = tmp_path / "empty.csv"
@@ -61,12 +161,154 @@ class TestCSVOutput:
         count = output.write(iter([]))
         assert count == 0
 
+    def test_missing_and_extra_keys(self, tmp_path):
+        out_file = tmp_path / "out.csv"
+        output = CSVOutput(path=str(out_file), columns=["hostname", "ip"])
+        count = output.write(
+            iter([
+                {"hostname": "web01", "ip": "10.0.0.1", "extra": "x"},
+                {"hostname": "web02"},
+            ])
+        )
+        assert count == 2
+        assert out_file.read_text().splitlines() == [
+            "hostname,ip",
+            "web01,10.0.0.1",
+            "web02,",
+        ]
+
+    def test_streams_records(self, tmp_path):
+        out_file = tmp_path / "out.csv"
+        opened_before_second = []
+
+        def records():
+            yield {"hostname": "web01"}
+            opened_before_second.append(out_file.exists())
+            yield {"hostname": "web02"}
+
+        assert CSVOutput(path=str(out_file)).write(records()) == 2
+        assert opened_before_second == [True]
+        assert out_file.read_text().splitlines() == ["hostname", "web01", "web02"]
+
+    def test_header_from_sparse_records(self, tmp_path):
+        out_file = tmp_path / "out.csv"
+        CSVOutput(path=str(out_file)).write(
+            iter([{"hostname": "web01"}, {"hostname": "web02", "ip": "10.0.0.2"}])
+        )
+        assert out_file.read_text().splitlines() == [
+            "hostname,ip",
+            "web01,",
+            "web02,10.0.0.2",
+        ]
+
+    def test_header_from_model(self, tmp_path):
+        out_file = tmp_path / "out.csv"
+        asset = EnrichedAsset()
+        asset.set_field("hostname", "web01", "qualys")
+        CSVOutput(path=str(out_file), model=EnrichedAsset).write(
+            iter([asset.model_dump(exclude_none=True)])
+        )
+        header, row = list(csv.reader(out_file.open()))
+        assert header[:3] == ["correlation_key", "hostname", "ip_address"]
+        assert "provenance" not in header
+        assert row[1] and not row[2]
+
+    def test_single_column(self, tmp_path):
+        out_file = tmp_path / "out.csv"
+        CSVOutput(path=str(out_file), columns=["hostname"]).write(
+            iter([{"hostname": "web,01"}])
+        )
+        assert out_file.read_text().splitlines() == ["hostname", '"web,01"']
+
 
 class TestStdoutOutput:
-    def test_write(self, capsys):
+    def test_write(self, capfd):
+        # capfd sees what reaches fd 1, so text printed earlier must be
+        # flushed ahead of the bytes written to the binary buffer.
+        print("before")
         output = StdoutOutput()
         count = output.write(iter([{"hostname": "web01"}]))
         assert count == 1
 
-        captured = capsys.readouterr()
-        assert "web01" in captured.out
+        lines = capfd.readouterr().out.splitlines()
+        assert lines[0] == "before"
+        assert json.loads(lines[1]) == {"hostname": "web01"}
+
+    def test_json_lines(self, capsys, json_backend):
+        output = StdoutOutput()
+        output.write(iter([{"hostname": "web01"}, {"hostname": "web02"}]))
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line)["hostname"] for line in lines] == ["web01", "web02"]
+
+
+    def test_batches_writes(self, monkeypatch):
+        writes = []
+
+        class _Buffer(io.BytesIO):
+            def write(self, data):
+                writes.append(len(data))
+                return super().write(data)
+
+        class _Stdout(io.StringIO):
+            buffer = _Buffer()
+
+        stdout = _Stdout()
+        monkeypatch.setattr(sys, "stdout", stdout)
+        monkeypatch.setattr(StdoutOutput, "FLUSH_BYTES", 64)
+        count = StdoutOutput().write({"hostname": f"web{i:02d}"} for i in range(10))
+        assert count == 10
+        assert 1 < len(writes) < 10
+        lines = stdout.buffer.getvalue().splitlines()
+        assert [json.loads(line)["hostname"] for line in lines] == [
+            f"web{i:02d}" for i in range(10)
+        ]
+
+
+class TestWebhookOutput:
+    @pytest.fixture
+    def received(self, monkeypatch):
+        """Route the sink's httpx.Client through a mock transport."""
+        batches = []
+        clients = []
+
+        def handler(request):
+            batches.append(json.loads(request.content))
+            return httpx.Response(200)
+
+        real_client = httpx.Client
+
+        def client(**kwargs):
+            clients.append(kwargs)
+            return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+        monkeypatch.setattr(httpx, "Client", client)
+        return batches, clients
+
+    def test_batches_share_one_client(self, received):
+        batches, clients = received
+        output = WebhookOutput(url="https://hooks.example.com/x", batch_size=2)
+        count = output.write({"hostname": f"web{i}"} for i in range(5))
+        assert count == 5
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert len(clients) == 1
+
+    def test_concurrent(self, received):
+        batches, _ = received
+        output = WebhookOutput(
+            url="https://hooks.example.com/x", batch_size=3, concurrency=4
+        )
+        assert output.write({"n": i} for i in range(20)) == 20
+        assert sorted(r["n"] for b in batches for r in b) == list(range(20))
+
+    def test_error_raised(self, monkeypatch):
+        real_client = httpx.Client
+        monkeypatch.setattr(
+            httpx,
+            "Client",
+            lambda **kw: real_client(
+                transport=httpx.MockTransport(lambda r: httpx.Response(500)), **kw
+            ),
+        )
+        output = WebhookOutput(url="https://hooks.example.com/x", concurrency=2)
+        with pytest.raises(httpx.HTTPStatusError):
+            output.write(iter([{"n": 1}]))
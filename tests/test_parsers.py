@@ -1,8 +1,13 @@
 """Tests for file parsers and auto-detection."""
 
 import csv
-import tempfile
+import io
+import multiprocessing
+import subprocess
+import sys
+from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 import pytest
 
@@ -12,33 +17,54 @@ from secimport.detectors import (
     detect_parser,
     detect_source,
     parse_file,
+    parse_many,
 )
 from secimport.models.base import (
     ParsedAsset,
     ParsedOwnerMapping,
     ParsedVulnerability,
+    ParseResult,
 )
-from secimport.parsers.base import BaseParser, ParserRegistry
+from secimport.parsers.assets.csv_generic import GenericAssetParser
+from secimport.parsers.assets.servicenow import ServiceNowAssetParser
+from secimport.parsers.base import BaseParser, ParserRegistry, _construct
+from secimport.parsers.owners.csv_generic import GenericOwnerParser
+from secimport.parsers.owners.ipam import IPAMOwnerParser
+from secimport.parsers.vulnerabilities.base import BaseVulnParser
+from secimport.parsers.vulnerabilities.crowdstrike import CrowdStrikeVulnParser
+from secimport.parsers.vulnerabilities.generic import GenericVulnParser
+from secimport.parsers.vulnerabilities.nessus import NessusVulnParser
+from secimport.parsers.vulnerabilities.openvas import OpenVASVulnParser
+from secimport.parsers.vulnerabilities.qualys import QualysVulnParser
+from secimport.parsers.vulnerabilities.rapid7 import Rapid7VulnParser
+from secimport.parsers.vulnerabilities.tenable import TenableVulnParser
 
 # ---------------------------------------------------------------------------
-# Fixtures: temp CSV files
+# Fixtures: CSV files, written once per session (parsers only read them)
 # ---------------------------------------------------------------------------
 
 
-def _write_csv(headers: list[str], rows: list[list[str]]) -> Path:
-    """Write a temp CSV and return its path."""
-    tmp = tempfile.NamedTemporaryFile(
-        mode="w", suffix=".csv", delete=False, newline=""
-    )
-    writer = csv.writer(tmp)
+def _write_csv(path: Path, headers: list[str], rows: list[list[str]]) -> Path:
+    """Write a CSV to ``path`` and return it."""
+    with path.open("w", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(headers)
+        writer.writerows(rows)
+    return path
+
+
+def _csv_stream(headers: list[str], rows: list[list[str]]) -> io.StringIO:
+    """Build CSV text in memory, for tests that only call ``parse``."""
+    stream = io.StringIO(newline="")
+    writer = csv.writer(stream)
     writer.writerow(headers)
     writer.writerows(rows)
-    tmp.flush()
-    return Path(tmp.name)
+    stream.seek(0)
+    return stream
 
 
-@pytest.fixture()
-def qualys_csv() -> Path:
+@pytest.fixture(scope="session")
+def qualys_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
     headers = [
         "QID", "CVE ID", "Title", "Severity",
         "CVSS Base", "DNS", "IP", "Port", "Protocol", "Vuln Status",
@@ -49,11 +75,13 @@ def qualys_csv() -> Path:
         ["67890", "", "Another Vuln", "3",
          "5.5", "host2.example.com", "10.0.0.2", "80", "tcp", "Active"],
     ]
-    return _write_csv(headers, rows)
+    return _write_csv(
+        tmp_path_factory.mktemp("parsers") / "qualys.csv", headers, rows
+    )
 
 
-@pytest.fixture()
-def nessus_csv() -> Path:
+@pytest.fixture(scope="session")
+def nessus_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
     headers = [
         "Plugin ID", "CVE", "Name", "Risk",
         "CVSS v3.0 Base Score", "Host", "IP Address",
@@ -63,11 +91,13 @@ def nessus_csv() -> Path:
         ["10001", "CVE-2023-5678", "Nessus Vuln", "Critical",
          "9.1", "host1", "192.168.1.1", "22", "tcp", "A test"],
     ]
-    return _write_csv(headers, rows)
+    return _write_csv(
+        tmp_path_factory.mktemp("parsers") / "nessus.csv", headers, rows
+    )
 
 
-@pytest.fixture()
-def tenable_csv() -> Path:
+@pytest.fixture(scope="session")
+def tenable_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
     headers = [
         "Plugin ID", "Severity", "Asset UUID",
         "Plugin Name", "Plugin Family", "CVE", "IP Address", "Port",
@@ -76,11 +106,13 @@ def tenable_csv() -> Path:
         ["20001", "High", "uuid-123", "Tenable Finding",
          "Web Servers", "CVE-2024-0001", "10.1.1.1", "8080"],
     ]
-    return _write_csv(headers, rows)
+    return _write_csv(
+        tmp_path_factory.mktemp("parsers") / "tenable.csv", headers, rows
+    )
 
 
-@pytest.fixture()
-def rapid7_csv() -> Path:
+@pytest.fixture(scope="session")
+def rapid7_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
     headers = [
         "Vulnerability ID", "Risk Score", "Asset IP Address",
         "Vulnerability Title", "Exploits", "Severity", "CVSS Score",
@@ -89,11 +121,13 @@ def rapid7_csv() -> Path:
         ["vuln-001", "850", "10.2.2.2",
          "Rapid7 Finding", "1", "Severe", "8.5"],
     ]
-    return _write_csv(headers, rows)
+    return _write_csv(
+        tmp_path_factory.mktemp("parsers") / "rapid7.csv", headers, rows
+    )
 
 
-@pytest.fixture()
-def crowdstrike_csv() -> Path:
+@pytest.fixture(scope="session")
+def crowdstrike_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
     headers = [
         "Vulnerability ID", "CVE", "Severity", "Hostname",
         "Aid", "Vulnerability Name", "CVSS Score",
@@ -102,11 +136,13 @@ def crowdstrike_csv() -> Path:
         ["CS-001", "CVE-2024-9999", "Critical",
          "cs-host1", "aid-123", "CS Finding", "10.0"],
     ]
-    return _write_csv(headers, rows)
+    return _write_csv(
+        tmp_path_factory.mktemp("parsers") / "crowdstrike.csv", headers, rows
+    )
 
 
-@pytest.fixture()
-def openvas_csv() -> Path:
+@pytest.fixture(scope="session")
+def openvas_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
     headers = [
         "NVT OID", "Threat", "Host", "NVT Name",
         "Solution Type", "CVEs", "CVSS", "Port",
@@ -115,11 +151,13 @@ def openvas_csv() -> Path:
         ["1.3.6.1.4.1.123", "High", "10.3.3.3",
          "OpenVAS Finding", "VendorFix", "CVE-2024-0002", "7.5", "443/tcp"],
     ]
-    return _write_csv(headers, rows)
+    return _write_csv(
+        tmp_path_factory.mktemp("parsers") / "openvas.csv", headers, rows
+    )
 
 
-@pytest.fixture()
-def asset_csv() -> Path:
+@pytest.fixture(scope="session")
+def asset_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
     headers = [
         "Hostname", "IP Address", "Asset Type",
         "Owner", "Department", "Environment", "OS",
@@ -130,11 +168,13 @@ def asset_csv() -> Path:
         ["ws-01", "10.0.0.20", "Workstation",
          "user@example.com", "HR", "Development", "Windows 11"],
     ]
-    return _write_csv(headers, rows)
+    return _write_csv(
+        tmp_path_factory.mktemp("parsers") / "asset.csv", headers, rows
+    )
 
 
-@pytest.fixture()
-def servicenow_csv() -> Path:
+@pytest.fixture(scope="session")
+def servicenow_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
     headers = [
         "sys_id", "name", "sys_class_name",
         "assigned_to", "u_environment", "ip_address", "os",
@@ -143,11 +183,13 @@ def servicenow_csv() -> Path:
         ["abc123", "sn-host1", "cmdb_ci_server",
          "John Doe", "Production", "10.5.5.5", "Linux"],
     ]
-    return _write_csv(headers, rows)
+    return _write_csv(
+        tmp_path_factory.mktemp("parsers") / "servicenow.csv", headers, rows
+    )
 
 
-@pytest.fixture()
-def owner_csv() -> Path:
+@pytest.fixture(scope="session")
+def owner_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
     headers = [
         "IP Address", "Owner", "Department",
         "Subnet", "Business Unit", "Location",
@@ -156,11 +198,13 @@ def owner_csv() -> Path:
         ["10.0.0.0/24", "netops@example.com", "Network Ops",
          "10.0.0.0/24", "Infrastructure", "DC1"],
     ]
-    return _write_csv(headers, rows)
+    return _write_csv(
+        tmp_path_factory.mktemp("parsers") / "owner.csv", headers, rows
+    )
 
 
-@pytest.fixture()
-def ipam_csv() -> Path:
+@pytest.fixture(scope="session")
+def ipam_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
     headers = [
         "Network", "Network View", "Comment",
         "EA-Site", "EA-Department", "EA-Owner",
@@ -169,7 +213,35 @@ def ipam_csv() -> Path:
         ["10.10.0.0/16", "default", "Office Network",
          "NYC", "Engineering", "eng@example.com"],
     ]
-    return _write_csv(headers, rows)
+    return _write_csv(
+        tmp_path_factory.mktemp("parsers") / "ipam.csv", headers, rows
+    )
+
+
+# Parsed records for fixtures that several tests inspect, parsed once per
+# session. The tuple stops tests adding or dropping records, but the models
+# themselves are mutable, so teardown checks that no test changed them.
+
+
+def _shared_records(records: tuple) -> Iterator[tuple]:
+    before = [r.model_dump() for r in records]
+    yield records
+    assert [r.model_dump() for r in records] == before, "a test modified shared records"
+
+
+@pytest.fixture(scope="session")
+def qualys_parsed(qualys_csv: Path) -> Iterator[tuple]:
+    yield from _shared_records(tuple(QualysVulnParser().parse(qualys_csv)))
+
+
+@pytest.fixture(scope="session")
+def asset_parsed(asset_csv: Path) -> Iterator[tuple]:
+    yield from _shared_records(tuple(GenericAssetParser().parse(asset_csv)))
+
+
+@pytest.fixture(scope="session")
+def owner_parsed(owner_csv: Path) -> Iterator[tuple]:
+    yield from _shared_records(tuple(GenericOwnerParser().parse(owner_csv)))
 
 
 # ---------------------------------------------------------------------------
@@ -197,6 +269,29 @@ class TestParserRegistry:
         assert len(owners) == 2
         assert "generic_owner" in owners
 
+    def test_registry_views_are_read_only(self) -> None:
+        with pytest.raises(TypeError):
+            ParserRegistry.list_parsers()["x"] = BaseParser  # type: ignore[index]
+        with pytest.raises(TypeError):
+            ParserRegistry.by_data_type("owner")["x"] = BaseParser  # type: ignore[index]
+
+    def test_by_data_type_follows_registration(self) -> None:
+        before = ParserRegistry.by_data_type("owner")
+        assert ParserRegistry.by_data_type("owner") is before
+
+        class _ProbeOwner(BaseParser):
+            name = "probe_owner"
+            data_type = "owner"
+
+            def _parse_row(self, row):  # pragma: no cover
+                raise NotImplementedError
+
+        try:
+            assert "probe_owner" in ParserRegistry.by_data_type("owner")
+        finally:
+            assert ParserRegistry.unregister("probe_owner") is _ProbeOwner
+        assert "probe_owner" not in ParserRegistry.by_data_type("owner")
+
     def test_get_by_name(self) -> None:
         cls = ParserRegistry.get("qualys_vuln")
         assert cls is not None
@@ -217,37 +312,21 @@ class TestDetection:
             "QID", "CVE ID", "Title", "Severity",
             "IP", "DNS", "Vuln Status",
         ]
-        from secimport.parsers.vulnerabilities.qualys import (
-            QualysVulnParser,
-        )
-
         score = QualysVulnParser.detect(columns)
         assert score == 1.0
 
     def test_detect_nessus_columns(self) -> None:
         columns = ["Plugin ID", "Risk", "Host", "Name", "Synopsis"]
-        from secimport.parsers.vulnerabilities.nessus import (
-            NessusVulnParser,
-        )
-
         score = NessusVulnParser.detect(columns)
         assert score == 1.0
 
     def test_detect_no_match(self) -> None:
         columns = ["foo", "bar", "baz"]
-        from secimport.parsers.vulnerabilities.qualys import (
-            QualysVulnParser,
-        )
-
         score = QualysVulnParser.detect(columns)
         assert score == 0.0
 
     def test_detect_partial_match(self) -> None:
         columns = ["QID", "Title", "Extra"]
-        from secimport.parsers.vulnerabilities.qualys import (
-            QualysVulnParser,
-        )
-
         score = QualysVulnParser.detect(columns)
         assert 0 < score < 1.0
 
@@ -255,13 +334,56 @@ class TestDetection:
         columns = [
             "qid", "severity", "ip", "dns", "title", "vuln status",
         ]
-        from secimport.parsers.vulnerabilities.qualys import (
-            QualysVulnParser,
-        )
-
         score = QualysVulnParser.detect(columns)
         assert score == 1.0
 
+    def test_detection_columns_folded_once(self) -> None:
+        class _PaddedParser(BaseParser):
+            name = "test_padded_detect"
+            DETECTION_COLUMNS = [" Asset ID ", "OWNER", "owner"]
+
+            def _parse_row(self, row):  # pragma: no cover
+                raise NotImplementedError
+
+        try:
+            assert _PaddedParser._DETECTION_COLUMNS_LOWER == ("asset id", "owner", "owner")
+            assert _PaddedParser.detect(["asset id", "Owner"]) == 1.0
+            assert _PaddedParser.detect(["ASSET ID"]) == pytest.approx(1 / 3)
+            scores = dict(ParserRegistry.score_columns(["ASSET ID"]))
+            assert scores[_PaddedParser] == pytest.approx(1 / 3)
+        finally:
+            ParserRegistry.unregister("test_padded_detect")
+
+    def test_score_columns_matches_detect(self) -> None:
+        columns = ["QID", "Severity", "IP", "Plugin ID", "Risk", "Host", "hostname"]
+        scores = ParserRegistry.score_columns(columns)
+        assert [p for p, _ in scores] == list(ParserRegistry.list_parsers().values())
+        for parser_cls, score in scores:
+            assert score == pytest.approx(parser_cls.detect(columns))
+
+    def test_score_columns_data_type_filter(self) -> None:
+        scores = ParserRegistry.score_columns(["Hostname"], data_type="owner")
+        assert scores
+        assert all(p.data_type == "owner" for p, _ in scores)
+
+    def test_score_columns_uses_custom_detect(self) -> None:
+        class _CustomDetectParser(BaseParser):
+            name = "test_custom_detect"
+            DETECTION_COLUMNS = ("Never Present",)
+
+            @classmethod
+            def detect(cls, columns: list[str]) -> float:
+                return 0.75
+
+            def _parse_row(self, row):  # pragma: no cover
+                raise NotImplementedError
+
+        try:
+            scores = dict(ParserRegistry.score_columns(["anything"]))
+            assert scores[_CustomDetectParser] == 0.75
+        finally:
+            ParserRegistry.unregister("test_custom_detect")
+
     def test_detect_parser_qualys_file(self, qualys_csv: Path) -> None:
         parser_cls = detect_parser(qualys_csv)
         assert parser_cls is not None
@@ -308,23 +430,12 @@ class TestDetection:
 
 
 class TestQualysParser:
-    def test_parse(self, qualys_csv: Path) -> None:
-        from secimport.parsers.vulnerabilities.qualys import (
-            QualysVulnParser,
-        )
+    def test_parse(self, qualys_parsed: tuple) -> None:
+        assert len(qualys_parsed) == 2
+        assert all(isinstance(r, ParsedVulnerability) for r in qualys_parsed)
 
-        parser = QualysVulnParser()
-        results = list(parser.parse(qualys_csv))
-        assert len(results) == 2
-        assert all(isinstance(r, ParsedVulnerability) for r in results)
-
-    def test_parse_fields(self, qualys_csv: Path) -> None:
-        from secimport.parsers.vulnerabilities.qualys import (
-            QualysVulnParser,
-        )
-
-        parser = QualysVulnParser()
-        vuln = list(parser.parse(qualys_csv))[0]
+    def test_parse_fields(self, qualys_parsed: tuple) -> None:
+        vuln = qualys_parsed[0]
         assert vuln.scanner_id == "12345"
         assert vuln.cve_id == "CVE-2023-1234"
         assert vuln.title == "Test Vuln"
@@ -334,23 +445,95 @@ class TestQualysParser:
         assert vuln.ip_address == "10.0.0.1"
         assert vuln.port == 443
 
-    def test_severity_normalization(self, qualys_csv: Path) -> None:
-        from secimport.parsers.vulnerabilities.qualys import (
-            QualysVulnParser,
+    def test_severity_normalization(self, qualys_parsed: tuple) -> None:
+        assert qualys_parsed[0].severity == "Critical"  # 5
+        assert qualys_parsed[1].severity == "Medium"  # 3
+
+
+    @pytest.mark.parametrize(
+        ("parser_name", "fixture"),
+        (
+            ("qualys_vuln", "qualys_csv"),
+            ("nessus_vuln", "nessus_csv"),
+            ("tenable_vuln", "tenable_csv"),
+            ("rapid7_vuln", "rapid7_csv"),
+            ("crowdstrike_vuln", "crowdstrike_csv"),
+            ("openvas_vuln", "openvas_csv"),
+            ("generic_asset", "asset_csv"),
+            ("servicenow_asset", "servicenow_csv"),
+            ("generic_owner", "owner_csv"),
+            ("ipam_owner", "ipam_csv"),
+        ),
+    )
+    def test_fast_construct_matches_validation(
+        self,
+        parser_name: str,
+        fixture: str,
+        request: pytest.FixtureRequest,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        # _parse_row must coerce every typed field: FAST_CONSTRUCT output
+        # has to equal what full validation produces for the sample files.
+        path = request.getfixturevalue(fixture)
+        parser_cls = ParserRegistry.get(parser_name)
+        assert parser_cls is not None
+
+        fast = list(parser_cls().parse(path))
+        monkeypatch.setattr(parser_cls, "FAST_CONSTRUCT", False)
+        result = ParseResult(source_type="test", data_type=parser_cls.data_type)
+        validated = list(parser_cls().parse(path, result=result))
+        assert result.error_count == 0
+        assert fast
+        assert [v.model_dump(exclude={"ingested_at"}) for v in fast] == [
+            v.model_dump(exclude={"ingested_at"}) for v in validated
+        ]
+
+    def test_construct_matches_model_construct(self) -> None:
+        fields = {
+            "title": "t", "severity": "High", "port": 443,
+            "extra": {"k": "v"}, "not_a_field": 1,
+        }
+        fast = _construct(ParsedVulnerability, dict(fields))
+        slow = ParsedVulnerability.model_construct(**fields)
+        assert fast.model_fields_set == slow.model_fields_set
+        assert fast.model_dump(exclude={"ingested_at"}) == slow.model_dump(
+            exclude={"ingested_at"}
         )
 
-        parser = QualysVulnParser()
-        results = list(parser.parse(qualys_csv))
-        assert results[0].severity == "Critical"  # 5
-        assert results[1].severity == "Medium"  # 3
+        partial = _construct(ParsedVulnerability, {"title": "t"})
+        assert "severity" not in partial.__dict__
+        assert partial.extra == {}
+        assert partial.extra is not _construct(ParsedVulnerability, {}).extra
+        assert isinstance(partial.ingested_at, datetime)
+
+    def test_rows_own_their_fields_set(self, qualys_csv: Path) -> None:
+        first, second = QualysVulnParser().parse(qualys_csv)
+        assert first.model_fields_set == second.model_fields_set
+        assert first.model_fields_set is not second.model_fields_set
+        first.solution = "patch"
+        first.model_fields_set.discard("title")
+        assert "solution" not in second.model_fields_set
+        assert "title" in second.model_fields_set
+
+    def test_dates_and_bad_cvss(self) -> None:
+        stream = _csv_stream(
+            ["QID", "Title", "Severity", "CVSS Base", "First Detected"],
+            [
+                ["1", "Dated", "4", "7.5", "2024-01-15T10:00:00"],
+                ["2", "Undated", "4", "7.5", ""],
+                ["3", "Bad CVSS", "4", "42", ""],
+            ],
+        )
+        result = ParseResult(source_type="qualys", data_type="vulnerability")
+        vulns = list(QualysVulnParser().parse(stream, result=result))
+        assert [v.scanner_id for v in vulns] == ["1", "2"]
+        assert vulns[0].first_detected.year == 2024
+        assert vulns[1].first_detected is None
+        assert result.error_count == 1
 
 
 class TestNessusParser:
     def test_parse(self, nessus_csv: Path) -> None:
-        from secimport.parsers.vulnerabilities.nessus import (
-            NessusVulnParser,
-        )
-
         parser = NessusVulnParser()
         results = list(parser.parse(nessus_csv))
         assert len(results) == 1
@@ -362,10 +545,6 @@ class TestNessusParser:
 
 class TestTenableParser:
     def test_parse(self, tenable_csv: Path) -> None:
-        from secimport.parsers.vulnerabilities.tenable import (
-            TenableVulnParser,
-        )
-
         parser = TenableVulnParser()
         results = list(parser.parse(tenable_csv))
         assert len(results) == 1
@@ -374,10 +553,6 @@ class TestTenableParser:
 
 class TestRapid7Parser:
     def test_parse(self, rapid7_csv: Path) -> None:
-        from secimport.parsers.vulnerabilities.rapid7 import (
-            Rapid7VulnParser,
-        )
-
         parser = Rapid7VulnParser()
         results = list(parser.parse(rapid7_csv))
         assert len(results) == 1
@@ -387,10 +562,6 @@ class TestRapid7Parser:
 
 class TestCrowdStrikeParser:
     def test_parse(self, crowdstrike_csv: Path) -> None:
-        from secimport.parsers.vulnerabilities.crowdstrike import (
-            CrowdStrikeVulnParser,
-        )
-
         parser = CrowdStrikeVulnParser()
         results = list(parser.parse(crowdstrike_csv))
         assert len(results) == 1
@@ -400,10 +571,6 @@ class TestCrowdStrikeParser:
 
 class TestOpenVASParser:
     def test_parse(self, openvas_csv: Path) -> None:
-        from secimport.parsers.vulnerabilities.openvas import (
-            OpenVASVulnParser,
-        )
-
         parser = OpenVASVulnParser()
         results = list(parser.parse(openvas_csv))
         assert len(results) == 1
@@ -413,29 +580,72 @@ class TestOpenVASParser:
         assert vuln.protocol == "tcp"
 
 
+class TestDefaultTitles:
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        (
+            ("qualys_vuln", "QID-42"),
+            ("nessus_vuln", "Plugin-42"),
+            ("tenable_vuln", "Plugin-42"),
+            ("rapid7_vuln", "Vuln-42"),
+            ("crowdstrike_vuln", "Vuln-42"),
+            ("openvas_vuln", "NVT-42"),
+        ),
+    )
+    def test_prefixed_scanner_id(self, name: str, expected: str) -> None:
+        parser_cls = ParserRegistry.get(name)
+        assert parser_cls is not None
+        id_column = next(
+            col
+            for col, field in parser_cls.COLUMN_MAPPING.items()
+            if field == "scanner_id"
+        )
+        stream = _csv_stream([id_column], [["42"]])
+        (vuln,) = parser_cls().parse(stream)
+        assert vuln.title == expected
+
+    def test_generic_falls_back_to_cve(self) -> None:
+        stream = _csv_stream(["ID", "CVE"], [["1", "CVE-2024-1"], ["2", ""]])
+        titles = [v.title for v in GenericVulnParser().parse(stream)]
+        assert titles == ["CVE-2024-1", "Unknown Vulnerability"]
+
+    def test_shared_base_is_not_registered(self) -> None:
+        assert BaseVulnParser not in ParserRegistry.list_parsers().values()
+
+
 # ---------------------------------------------------------------------------
 # Parsing tests (asset parsers)
 # ---------------------------------------------------------------------------
 
 
-class TestGenericAssetParser:
-    def test_parse(self, asset_csv: Path) -> None:
-        from secimport.parsers.assets.csv_generic import (
-            GenericAssetParser,
+    @pytest.mark.parametrize(
+        ("raw", "port", "protocol"),
+        (
+            ("443/tcp", 443, "tcp"),
+            ("general/tcp", None, "tcp"),
+            ("8080", 8080, None),
+            ("", None, None),
+        ),
+    )
+    def test_port_protocol_split(
+        self, raw: str, port: object, protocol: object
+    ) -> None:
+        stream = _csv_stream(
+            ["NVT OID", "NVT Name", "Threat", "Port"],
+            [["1.3.6.1", "Finding", "High", raw]],
         )
+        (vuln,) = OpenVASVulnParser().parse(stream)
+        assert vuln.port == port
+        assert vuln.protocol == protocol
 
-        parser = GenericAssetParser()
-        results = list(parser.parse(asset_csv))
-        assert len(results) == 2
-        assert all(isinstance(r, ParsedAsset) for r in results)
 
-    def test_parse_fields(self, asset_csv: Path) -> None:
-        from secimport.parsers.assets.csv_generic import (
-            GenericAssetParser,
-        )
+class TestGenericAssetParser:
+    def test_parse(self, asset_parsed: tuple) -> None:
+        assert len(asset_parsed) == 2
+        assert all(isinstance(r, ParsedAsset) for r in asset_parsed)
 
-        parser = GenericAssetParser()
-        asset = list(parser.parse(asset_csv))[0]
+    def test_parse_fields(self, asset_parsed: tuple) -> None:
+        asset = asset_parsed[0]
         assert asset.hostname == "srv-01"
         assert asset.ip_address == "10.0.0.10"
         assert asset.asset_type == "Server"
@@ -446,10 +656,6 @@ class TestGenericAssetParser:
 
 class TestServiceNowAssetParser:
     def test_parse(self, servicenow_csv: Path) -> None:
-        from secimport.parsers.assets.servicenow import (
-            ServiceNowAssetParser,
-        )
-
         parser = ServiceNowAssetParser()
         results = list(parser.parse(servicenow_csv))
         assert len(results) == 1
@@ -464,32 +670,35 @@ class TestServiceNowAssetParser:
 
 
 class TestGenericOwnerParser:
-    def test_parse(self, owner_csv: Path) -> None:
-        from secimport.parsers.owners.csv_generic import (
-            GenericOwnerParser,
-        )
-
-        parser = GenericOwnerParser()
-        results = list(parser.parse(owner_csv))
-        assert len(results) == 1
-        assert isinstance(results[0], ParsedOwnerMapping)
-
-    def test_parse_fields(self, owner_csv: Path) -> None:
-        from secimport.parsers.owners.csv_generic import (
-            GenericOwnerParser,
-        )
+    def test_parse(self, owner_parsed: tuple) -> None:
+        assert len(owner_parsed) == 1
+        assert isinstance(owner_parsed[0], ParsedOwnerMapping)
 
-        parser = GenericOwnerParser()
-        owner = list(parser.parse(owner_csv))[0]
+    def test_parse_fields(self, owner_parsed: tuple) -> None:
+        owner = owner_parsed[0]
         assert owner.owner_email == "netops@example.com"
         assert owner.department == "Network Ops"
         assert owner.subnet == "10.0.0.0/24"
 
+    def test_confidence_cells(self) -> None:
+        stream = _csv_stream(
+            ["Owner", "Subnet", "Confidence"],
+            [
+                ["a@example.com", "10.0.0.0/24", "0.5"],
+                ["b@example.com", "10.0.1.0/24", ""],
+                ["c@example.com", "10.0.2.0/24", "high"],
+                ["d@example.com", "10.0.3.0/24", "5"],
+            ],
+        )
+        result = ParseResult(source_type="csv", data_type="owner")
+        owners = list(GenericOwnerParser().parse(stream, result=result))
+        assert [o.confidence for o in owners] == [0.5, 1.0, 1.0]
+        assert result.error_count == 1
+        assert "outside 0-1" in result.errors[0]
+
 
 class TestIPAMOwnerParser:
     def test_parse(self, ipam_csv: Path) -> None:
-        from secimport.parsers.owners.ipam import IPAMOwnerParser
-
         parser = IPAMOwnerParser()
         results = list(parser.parse(ipam_csv))
         assert len(results) == 1
@@ -506,23 +715,40 @@ class TestIPAMOwnerParser:
 
 
 class TestParseFile:
-    def test_parse_file_auto_detect(self, qualys_csv: Path) -> None:
-        data_iter, result = parse_file(qualys_csv)
-        items = list(data_iter)
-        assert len(items) == 2
-        assert result.source_type == "qualys"
-        assert result.data_type == "vulnerability"
-        assert result.parsed_count == 2
-
-    def test_parse_file_explicit_parser(
-        self, qualys_csv: Path
+    @pytest.mark.parametrize(
+        ("fixture", "parser_name", "expected_parser", "source", "data_type", "rows"),
+        (
+            ("qualys_csv", None, "qualys_vuln", "qualys", "vulnerability", 2),
+            ("qualys_csv", "qualys_vuln", "qualys_vuln", "qualys", "vulnerability", 2),
+            ("nessus_csv", None, "nessus_vuln", "nessus", "vulnerability", 1),
+            ("tenable_csv", None, "tenable_vuln", "tenable", "vulnerability", 1),
+            ("rapid7_csv", None, "rapid7_vuln", "rapid7", "vulnerability", 1),
+            ("crowdstrike_csv", None, "crowdstrike_vuln", "crowdstrike", "vulnerability", 1),
+            ("openvas_csv", None, "openvas_vuln", "openvas", "vulnerability", 1),
+            ("asset_csv", None, "generic_asset", "generic", "asset", 2),
+            ("servicenow_csv", None, "servicenow_asset", "servicenow", "asset", 1),
+            ("owner_csv", None, "generic_owner", "generic", "owner", 1),
+            ("ipam_csv", None, "ipam_owner", "ipam", "owner", 1),
+        ),
+    )
+    def test_parse_file(
+        self,
+        request: pytest.FixtureRequest,
+        fixture: str,
+        parser_name: str | None,
+        expected_parser: str,
+        source: str,
+        data_type: str,
+        rows: int,
     ) -> None:
         data_iter, result = parse_file(
-            qualys_csv, parser_name="qualys_vuln"
+            request.getfixturevalue(fixture), parser_name=parser_name
         )
         items = list(data_iter)
-        assert len(items) == 2
-        assert result.source_type == "qualys"
+        assert len(items) == result.parsed_count == rows
+        assert result.parser_name == expected_parser
+        assert result.source_type == source
+        assert result.data_type == data_type
 
     def test_parse_file_unknown_parser_raises(
         self, qualys_csv: Path
@@ -530,14 +756,70 @@ class TestParseFile:
         with pytest.raises(ValueError, match="Unknown parser"):
             parse_file(qualys_csv, parser_name="nonexistent")
 
-    def test_parse_file_no_match_raises(self) -> None:
+    def test_parse_file_no_match_raises(self, tmp_path: Path) -> None:
         csv_path = _write_csv(
+            tmp_path / "data.csv",
             ["foo", "bar", "baz"], [["a", "b", "c"]]
         )
         with pytest.raises(ValueError, match="Could not detect"):
             parse_file(csv_path)
 
 
+class _RuntimeOwnerParser(BaseParser):
+    """Module level so spawned ``parse_many`` workers can unpickle it."""
+
+    name = "runtime_owner"
+    source = "runtime"
+    data_type = "owner"
+    DETECTION_COLUMNS = ("Runtime IP", "Runtime Owner")
+    COLUMN_MAPPING = {"Runtime IP": "ip_address", "Runtime Owner": "owner_email"}
+
+    def _parse_row(self, row):
+        return self._build(ParsedOwnerMapping, row)
+
+
+# Registered only by the test that uses it.
+ParserRegistry.unregister(_RuntimeOwnerParser.name)
+
+
+class TestParseMany:
+    @pytest.mark.parametrize("max_workers", (1, 2))
+    def test_results_in_input_order(
+        self, qualys_csv: Path, nessus_csv: Path, max_workers: int
+    ) -> None:
+        results = list(
+            parse_many([qualys_csv, nessus_csv, qualys_csv], max_workers=max_workers)
+        )
+        assert [r.source_type for _, r in results] == ["qualys", "nessus", "qualys"]
+        for records, result in results:
+            assert len(records) == result.parsed_count > 0
+            assert all(isinstance(r, ParsedVulnerability) for r in records)
+
+    def test_no_match_raises(self, tmp_path: Path) -> None:
+        csv_path = _write_csv(tmp_path / "data.csv", ["foo"], [["a"]])
+        with pytest.raises(ValueError, match="Could not detect"):
+            list(parse_many([csv_path]))
+
+    def test_runtime_registered_parser_under_spawn(self, tmp_path: Path) -> None:
+        paths = [
+            _write_csv(
+                tmp_path / f"owners{i}.csv",
+                ["Runtime IP", "Runtime Owner"],
+                [[f"10.0.0.{i}", f"owner{i}@example.com"]],
+            )
+            for i in range(2)
+        ]
+        ParserRegistry.register(_RuntimeOwnerParser)
+        try:
+            results = list(
+                parse_many(paths, max_workers=2, mp_context=multiprocessing.get_context("spawn"))
+            )
+        finally:
+            ParserRegistry.unregister(_RuntimeOwnerParser.name)
+        assert [r.parser_name for _, r in results] == ["runtime_owner", "runtime_owner"]
+        assert [records[0].ip_address for records, _ in results] == ["10.0.0.0", "10.0.0.1"]
+
+
 # ---------------------------------------------------------------------------
 # BaseParser.read_file / get_columns tests
 # ---------------------------------------------------------------------------
@@ -549,16 +831,132 @@ class TestBaseParserIO:
         assert "QID" in columns
         assert "Severity" in columns
 
+    def test_get_columns_cached_until_file_changes(self, tmp_path: Path) -> None:
+        path = _write_csv(tmp_path / "data.csv", ["A", "B"], [["1", "2"]])
+        assert BaseParser.get_columns(path) == ["A", "B"]
+        assert BaseParser.get_columns(str(path)) == ["A", "B"]
+
+        path.write_text("A,B,C\n1,2,3\n")
+        assert BaseParser.get_columns(path) == ["A", "B", "C"]
+
+    def test_csv_parsing_does_not_import_pandas(self, qualys_csv: Path) -> None:
+        code = (
+            "import sys; import secimport.parsers; "
+            "from secimport.parsers.vulnerabilities.qualys import QualysVulnParser; "
+            f"list(QualysVulnParser().parse({str(qualys_csv)!r})); "
+            "sys.exit('pandas' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
+
+    @pytest.mark.parametrize(
+        "text",
+        (
+            "\ufeffQID,Title,QID,QID.1\n1,a,2,3\n",
+            "\n\nQID,Title\n1,a\n",
+            " QID , Title \n",
+            'QID,"Title, long"\n',
+            "QID,Title",
+            ",, a\n",
+            "x,,x\n",
+            "a,,Unnamed: 1\n",
+            "Unnamed: 1,,\n",
+            "a,a,a.1,a.1\n",
+            "a,a.1,a\n",
+        ),
+    )
+    def test_get_columns_matches_pandas_header(self, tmp_path: Path, text: str) -> None:
+        import pandas as pd
+
+        path = tmp_path / "data.csv"
+        path.write_text(text, encoding="utf-8")
+        assert BaseParser.get_columns(path) == list(pd.read_csv(path, nrows=0).columns)
+
+    def test_parse_accepts_text_stream(self, qualys_csv: Path) -> None:
+        stream = io.StringIO("\ufeff" + qualys_csv.read_text(), newline="")
+        from_stream = list(QualysVulnParser().parse(stream))
+        from_path = list(QualysVulnParser().parse(qualys_csv))
+        assert [v.model_dump(exclude={"ingested_at"}) for v in from_stream] == [
+            v.model_dump(exclude={"ingested_at"}) for v in from_path
+        ]
+
+    def test_get_columns_empty_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "empty.csv"
+        path.write_text("")
+        assert BaseParser.get_columns(path) == []
+        assert detect_parser(path) is None
+
     def test_read_file(self, qualys_csv: Path) -> None:
         df = BaseParser.read_file(qualys_csv)
         assert len(df) == 2
         assert "QID" in df.columns
 
-    def test_column_mapping(self) -> None:
-        from secimport.parsers.vulnerabilities.qualys import (
-            QualysVulnParser,
+    def test_iter_chunks(self, qualys_csv: Path) -> None:
+        chunks = list(BaseParser.iter_chunks(qualys_csv, chunk_size=1))
+        assert [len(c) for c in chunks] == [1, 1]
+        assert list(chunks[1].columns) == BaseParser.get_columns(qualys_csv)
+
+    def test_iter_rows_matches_pandas(self, tmp_path: Path) -> None:
+        path = tmp_path / "ragged.csv"
+        path.write_bytes(
+            b'\xef\xbb\xbfHost,IP,Host,Host.1\n'
+            b'a,10.0.0.1,b,c\n'
+            b'\n'
+            b'"d,e",10.0.0.2\n'
         )
+        batches = list(BaseParser.iter_rows(path, chunk_size=1))
+        df = BaseParser.read_file(path)
+        assert batches[0][0] == list(df.columns)
+        assert [row for _, rows in batches for row in rows] == df.values.tolist()
+
+    def test_blank_lines_before_header(self) -> None:
+        stream = io.StringIO("\n\nQID,Title,Severity\n\n1,Foo,5\n", newline="")
+        assert [(v.scanner_id, v.title) for v in QualysVulnParser().parse(stream)] == [
+            ("1", "Foo")
+        ]
+
+    def test_long_rows_counted_as_errors(self) -> None:
+        stream = _csv_stream(["QID", "Title"], [["1", "Foo"], ["2", "Bar", "extra"]])
+        result = ParseResult(source_type="qualys", data_type="vulnerability")
+        (vuln,) = QualysVulnParser().parse(stream, result=result)
+        assert vuln.scanner_id == "1"
+        assert result.error_count == 1
+        assert result.errors == ["Row 1: expected 2 fields, saw 3"]
+
+    def test_parse_across_chunks(
+        self, qualys_csv: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(QualysVulnParser, "CHUNK_SIZE", 1)
+        result = ParseResult(source_type="qualys", data_type="vulnerability")
+        results = list(QualysVulnParser().parse(qualys_csv, result=result))
+        assert [r.scanner_id for r in results] == ["12345", "67890"]
+        assert result.total_rows == 2
+        assert result.parsed_count == 2
+
+    def test_records_share_ingested_at(self, qualys_csv: Path) -> None:
+        parser = QualysVulnParser()
+        first, second = parser.parse(qualys_csv)
+        assert first.ingested_at is second.ingested_at
+        assert first.ingested_at.tzinfo is None
 
+    def test_interleaved_parses_keep_their_ingested_at(self, qualys_csv: Path) -> None:
+        parser = QualysVulnParser()
+        first_run, second_run = parser.parse(qualys_csv), parser.parse(qualys_csv)
+        a1 = next(first_run)
+        b1 = next(second_run)
+        a2 = next(first_run)
+        b2 = next(second_run)
+        assert a1.ingested_at is a2.ingested_at
+        assert b1.ingested_at is b2.ingested_at
+        assert a1.ingested_at is not b1.ingested_at
+        # Records built outside ``parse`` read the clock as usual.
+        outside = parser._parse_row({"title": "t", "severity": "Low"})
+        assert outside.ingested_at is not a1.ingested_at
+        assert outside.ingested_at is not b1.ingested_at
+
+    def test_column_mapping(self) -> None:
         parser = QualysVulnParser()
         row = {
             "QID": "123", "Title": "Test",
@@ -569,3 +967,98 @@ class TestBaseParserIO:
         assert mapped["title"] == "Test"
         assert mapped["ip_address"] == "1.1.1.1"
         assert "Extra Col" in mapped["extra"]
+
+    def test_parse_chunk_size(self, qualys_csv: Path) -> None:
+        parser = QualysVulnParser()
+        chunked = list(parser.parse(qualys_csv, chunk_size=1))
+        whole = list(parser.parse(qualys_csv))
+        assert [v.scanner_id for v in chunked] == [v.scanner_id for v in whole]
+
+    def test_parse_maps_columns_by_position(self) -> None:
+        stream = _csv_stream(
+            [" qid ", "Title", "Scanner Note", "IP", "Severity"],
+            [["42", "Open port", "seen twice", "10.0.0.9", "3"]],
+        )
+        (vuln,) = QualysVulnParser().parse(stream)
+        assert vuln.scanner_id == "42"
+        assert vuln.title == "Open port"
+        assert vuln.ip_address == "10.0.0.9"
+        assert vuln.extra == {"Scanner Note": "seen twice"}
+
+    def test_column_mapping_folded_once_per_class(self) -> None:
+        class _Probe(BaseParser):
+            name = "probe_mapping"
+            COLUMN_MAPPING = {" Host Name ": "hostname", "IP": "ip_address"}
+
+            def _parse_row(self, row):  # pragma: no cover
+                raise NotImplementedError
+
+        try:
+            assert _Probe._COLUMN_MAPPING_LOWER == {
+                "host name": "hostname", "ip": "ip_address",
+            }
+            mapped = _Probe()._map_columns({"HOST NAME": "a", "ip ": "b"})
+            assert mapped == {"hostname": "a", "ip_address": "b", "extra": {}}
+        finally:
+            ParserRegistry.unregister("probe_mapping")
+
+    def test_column_coercions_memoised_per_batch(self) -> None:
+        calls: list[str] = []
+
+        def _port(value):
+            calls.append(value)
+            return int(value) if value else None
+
+        class _Probe(BaseParser):
+            name = "probe_coercions"
+            COLUMN_MAPPING = {"IP": "ip_address", "Port": "port"}
+            COLUMN_COERCIONS = {"port": _port, "severity": lambda v: v or "Low"}
+
+            def _parse_row(self, row):
+                return row
+
+        stream = _csv_stream(
+            ["IP", "Port"],
+            [["10.0.0.1", "443"], ["10.0.0.2", "x"], ["10.0.0.3", "443"]],
+        )
+        try:
+            result = ParseResult(source_type="probe", data_type="vulnerability")
+            rows = list(_Probe().parse(stream, result=result))
+        finally:
+            ParserRegistry.unregister("probe_coercions")
+        assert calls == ["443", "x"]
+        assert [r["port"] for r in rows] == [443, 443]
+        assert all(r["severity"] == "Low" for r in rows)
+        assert result.error_count == 1
+
+    def test_column_plan_cached_per_class(self) -> None:
+        header = ["QID", "IP", "Note"]
+        plan = QualysVulnParser()._column_plan(header)
+        assert QualysVulnParser()._column_plan(list(header)) is plan
+        targets, extras, template = plan
+        assert targets == ((0, "scanner_id"), (1, "ip_address"))
+        assert extras == ((2, "Note"),)
+        assert list(template) == ["scanner_id", "ip_address", "extra"]
+        assert tuple(header) not in NessusVulnParser._COLUMN_PLANS
+
+    def test_parse_row_receives_mapped_dict_uncopied(
+        self, qualys_csv: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        built: list = []
+        received: list = []
+        map_values = BaseParser._map_values
+        parse_row = QualysVulnParser._parse_row
+
+        def _map(plan, values):
+            built.append(map_values(plan, values))
+            return built[-1]
+
+        def _parse(self, row):
+            received.append(row)
+            return parse_row(self, row)
+
+        monkeypatch.setattr(QualysVulnParser, "_map_values", staticmethod(_map))
+        monkeypatch.setattr(QualysVulnParser, "_parse_row", _parse)
+        list(QualysVulnParser().parse(qualys_csv))
+        assert len(received) == 2
+        assert all(r is b for r, b in zip(received, built))
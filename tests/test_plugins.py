@@ -0,0 +1,37 @@
+"""Tests for plugin discovery."""
+
+import importlib.metadata
+
+import pytest
+
+from secimport import plugins
+
+
+class TestDiscoverPlugins:
+    def test_scans_metadata_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls = []
+        real = importlib.metadata.entry_points
+
+        def _entry_points(**kwargs):
+            calls.append(kwargs)
+            return real(**kwargs)
+
+        monkeypatch.setattr(importlib.metadata, "entry_points", _entry_points)
+        loaded = plugins.discover_plugins()
+        assert len(calls) == 1
+        assert set(loaded) == {"connectors", "parsers"}
+
+    def test_loads_group_entries(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        eps = importlib.metadata.EntryPoints(
+            [
+                importlib.metadata.EntryPoint(
+                    name="json_mod", value="json", group=plugins.PARSER_GROUP
+                ),
+                importlib.metadata.EntryPoint(name="other", value="json", group="unrelated.group"),
+            ]
+        )
+        monkeypatch.setattr(importlib.metadata, "entry_points", lambda: eps)
+        assert plugins.discover_plugins() == {
+            "connectors": [],
+            "parsers": ["json_mod"],
+        }
@@ -0,0 +1,169 @@
+"""Tests for the ingestion runner."""
+
+import csv
+import gc
+from pathlib import Path
+
+import pytest
+
+from secimport.config.loader import SecimportConfig, SourceConfig
+from secimport.connectors.base import ConnectorRegistry
+from secimport.enrichment.correlator import AssetCorrelator
+from secimport.models.base import ParsedAsset
+from secimport.runner import _FILE_KINDS, _OPERATION_KINDS, IngestionRunner
+
+
+def _write_qualys(path: Path) -> Path:
+    with path.open("w", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["QID", "Title", "Severity", "CVSS Base", "DNS", "IP"])
+        writer.writerow(["1", "Vuln A", "5", "9.8", "web1", "10.0.0.1"])
+        writer.writerow(["2", "Vuln B", "3", "5.0", "web1", "10.0.0.1"])
+        writer.writerow(["3", "Vuln C", "2", "2.0", "db1", "10.0.0.2"])
+    return path
+
+
+class TestFileSources:
+    def test_file_source_feeds_correlator(self, tmp_path: Path) -> None:
+        path = _write_qualys(tmp_path / "qualys.csv")
+        config = SecimportConfig(
+            sources=[
+                SourceConfig(
+                    name="qualys_export",
+                    path=str(path),
+                    options={"chunk_size": 2},
+                )
+            ]
+        )
+        runner = IngestionRunner(config)
+        runner._ingest_source(config.sources[0])
+
+        assert runner.correlator.asset_count == 2
+        vuln_counts = sorted(a.vulnerability_count for a in runner.correlator.get_enriched_assets())
+        assert vuln_counts == [1, 2]
+
+    def test_explicit_parser(self, tmp_path: Path) -> None:
+        path = _write_qualys(tmp_path / "export.csv")
+        source = SourceConfig(name="q", path=str(path), parser="qualys_vuln")
+        runner = IngestionRunner(SecimportConfig(sources=[source]))
+        runner.run()
+        assert runner.correlator.asset_count == 2
+
+    def test_collector_paused_only_during_ingestion(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        path = _write_qualys(tmp_path / "qualys.csv")
+        runner = IngestionRunner(SecimportConfig(sources=[SourceConfig(name="q", path=str(path))]))
+        ingest = runner._ingest_records
+        seen = []
+
+        def recording_ingest(kind, records):
+            seen.append(gc.isenabled())
+            return ingest(kind, records)
+
+        monkeypatch.setattr(runner, "_ingest_records", recording_ingest)
+        runner.run()
+        assert seen == [False]
+        assert gc.isenabled()
+
+
+class TestParallelSources:
+    def _config(self, tmp_path: Path, workers: int) -> SecimportConfig:
+        first = _write_qualys(tmp_path / "a.csv")
+        second = tmp_path / "b.csv"
+        with second.open("w", newline="") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(["QID", "Title", "Severity", "DNS", "IP"])
+            writer.writerow(["9", "Vuln Z", "4", "app1", "10.0.0.9"])
+        return SecimportConfig(
+            sources=[
+                SourceConfig(name="a", path=str(first)),
+                SourceConfig(name="missing", path=str(tmp_path / "nope.csv")),
+                SourceConfig(name="b", path=str(second)),
+            ],
+            source_workers=workers,
+            outputs=[],
+        )
+
+    def test_matches_sequential(self, tmp_path: Path) -> None:
+        def _summary(runner: IngestionRunner) -> list:
+            return [
+                (a.hostname, a.vulnerability_count) for a in runner.correlator.get_enriched_assets()
+            ]
+
+        sequential = IngestionRunner(self._config(tmp_path, workers=1))
+        sequential.run()
+        parallel = IngestionRunner(self._config(tmp_path, workers=4))
+        parallel.run()
+
+        assert parallel.correlator.asset_count == 3
+        assert _summary(parallel) == _summary(sequential)
+
+    def test_failed_source_is_skipped(self, tmp_path: Path, caplog) -> None:
+        runner = IngestionRunner(self._config(tmp_path, workers=4))
+        with caplog.at_level("ERROR", logger="secimport.runner"):
+            runner.run()
+        assert "Failed to ingest from missing" in caplog.text
+        assert runner.correlator.asset_count == 3
+
+
+class _FakeConnector:
+    name = "fake"
+    SUPPORTED_OPERATIONS = ("get_assets",)
+    instances: list = []
+
+    def __init__(self, connection, auth) -> None:
+        self.status = "disconnected"
+        self.connects = 0
+        _FakeConnector.instances.append(self)
+
+    def connect(self) -> bool:
+        self.connects += 1
+        self.status = "connected"
+        return True
+
+    def disconnect(self) -> None:
+        self.status = "disconnected"
+
+    def get_assets(self):
+        yield ParsedAsset(hostname="cmdb1", source_system="cmdb")
+
+    def get_endpoints(self):  # pragma: no cover - not declared, never called
+        raise AssertionError("undeclared operation called")
+
+
+class TestConnectorSources:
+    def test_runs_declared_operations_only(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(ConnectorRegistry, "get", classmethod(lambda cls, name: _FakeConnector))
+        source = SourceConfig(name="c", connector="fake", base_url="https://x")
+        runner = IngestionRunner(SecimportConfig(sources=[source]))
+        runner.run()
+        assert runner.correlator.asset_count == 1
+        assert runner._connectors == {}
+
+    def test_context_manager_reuses_connectors(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(ConnectorRegistry, "get", classmethod(lambda cls, name: _FakeConnector))
+        monkeypatch.setattr(_FakeConnector, "instances", [])
+        source = SourceConfig(name="c", connector="fake", base_url="https://x")
+        with IngestionRunner(SecimportConfig(sources=[source])) as runner:
+            runner.run()
+            runner.run()
+            (connector,) = _FakeConnector.instances
+            assert connector.connects == 1
+            assert connector.status == "connected"
+        assert connector.status == "disconnected"
+        assert runner._connectors == {}
+
+    def test_category_operations(self) -> None:
+        connectors = ConnectorRegistry.list_connectors()
+        assert connectors["crowdstrike_falcon"].SUPPORTED_OPERATIONS == ("get_endpoints",)
+        assert connectors["darktrace"].SUPPORTED_OPERATIONS == ("get_devices",)
+        assert connectors["servicenow"].SUPPORTED_OPERATIONS == ("get_assets",)
+        assert connectors["aws"].SUPPORTED_OPERATIONS == ()
+
+
+class TestKindTables:
+    @pytest.mark.parametrize("kind", sorted({*_FILE_KINDS.values(), *_OPERATION_KINDS.values()}))
+    def test_kind_names_an_ingest_method(self, kind: str) -> None:
+        # Batches are routed by these tables, once per source, never per record.
+        assert callable(getattr(AssetCorrelator, f"ingest_{kind}", None))
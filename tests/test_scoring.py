@@ -15,15 +15,19 @@ class TestMatchWeights:
 
     def test_ordering(self):
         weights = MatchWeights.WEIGHTS
-        assert weights["agent_id"] > weights["serial_number"]
-        assert weights["serial_number"] > weights["mac_address"]
-        assert weights["mac_address"] > weights["hostname"]
-        assert weights["hostname"] > weights["ip_address"]
+        expected = ["ip_address", "hostname", "mac_address", "serial_number", "agent_id"]
+        assert sorted(weights, key=weights.__getitem__) == expected
+        assert len(set(weights.values())) == len(weights)  # strictly ordered
 
     def test_best_match_confidence(self):
         assert MatchWeights.best_match_confidence(["hostname", "ip_address"]) == 0.85
         assert MatchWeights.best_match_confidence(["agent_id"]) == 0.99
         assert MatchWeights.best_match_confidence([]) == 0.0
+        assert MatchWeights.best_match_confidence(["unknown"]) == MatchWeights.DEFAULT
+
+    def test_best_match_confidence_retuned(self, monkeypatch):
+        monkeypatch.setitem(MatchWeights.WEIGHTS, "ip_address", 0.999)
+        assert MatchWeights.best_match_confidence(["agent_id", "ip_address"]) == 0.999
 
 
 class TestSourceConfidence: